@@ -10,9 +10,16 @@ Fidelity harmony pre/post—ultimate recovery infinite thriving.
 import numpy as np
 import qutip as qt
 
+from gkp_states import gkp_zero
+from loss_channel import loss_eta
+from loss_trajectories import fidelity_estimate, run_trajectories
+from mode_syndromes import correct_round
+from multimode_engine import BosonicMPS
+
 N = 120
 alpha = 2.0
 Delta = 0.25
+chi = 32  # MPS bond dimension cap (chain truncation ~2e-2; the full 78-splitter mesh discards most of the state)
 modes = 13  # Prime odd eternal council
 K = 12
 
@@ -21,65 +28,33 @@ def hybrid_cat_gkp_mode():
     coh_minus = qt.coherent(N, -alpha)
     cat = (coh_plus + coh_minus).unit()
     
-    gkp = qt.basis(N, 0)
-    for k in range(-K, K+1):
-        alpha_g = k * np.sqrt(np.pi)
-        disp = qt.displace(N, alpha_g)
-        sq = qt.squeeze(N, Delta / 2)
-        gkp += disp * sq * qt.basis(N, 0)
-    gkp = gkp.unit()
+    gkp = gkp_zero(Delta, K, N)
     
     return (cat + gkp).unit()
 
-# 13-mode entangled state (beam splitter chain + full mesh approx)
-state = qt.tensor([hybrid_cat_gkp_mode() for _ in range(modes)])
-for i in range(modes):
-    for j in range(i+1, modes):
-        BS = qt.tensor([qt.beamsplitter(np.pi/6) if k in [i,j] else qt.identity(N) for k in range(modes)])
-        state = BS * state
-state = state.unit()
-
-# Ideal reference
-ideal = state.copy()
-
-# Noise: High loss + shifts
-gamma = 0.35  # Beyond threshold test
-a_list = [qt.destroy(N) for _ in range(modes)]
-c_ops = [np.sqrt(gamma) * qt.tensor([a_list[i] if j==i else qt.identity(N) for j in range(modes)]) for i in range(modes)]
-
-shifts = np.random.uniform(-0.3, 0.3, modes * 2)
-D_list = [qt.tensor([qt.displace(N, shifts[2*i] + 1j*shifts[2*i+1]) if j==i else qt.identity(N) for j in range(modes)]) for i in range(modes)]
-
-noisy = state
-for D in D_list:
-    noisy = D * noisy
-
-result = qt.mesolve(qt.qeye([N]*modes), noisy, np.linspace(0,1,50), c_ops)
-noisy = result.states[-1]
-
-# Mercy: Per-mode cat parity + GKP syndrome
-corrected = noisy
-for i in range(modes):
-    partial = noisy.ptrace(i)
-    
-    # Cat parity
-    even = qt.projection(N, range(0,N,2), range(0,N,2))
-    p_even = qt.expect(even, partial)
-    if p_even < 0.5:
-        R = qt.tensor([qt.phase_gate(np.pi) if j==i else qt.identity(N) for j in range(modes)])
-        corrected = R * corrected
-    
-    # GKP syndrome
-    syndrome_q = qt.expect(qt.position(N), partial)
-    syndrome_p = qt.expect(qt.momentum(N), partial)
-    corr = -np.round(syndrome_q / np.sqrt(np.pi)) * np.sqrt(np.pi) + 1j * (-np.round(syndrome_p / np.sqrt(np.pi)) * np.sqrt(np.pi))
-    D_gkp = qt.tensor([qt.displace(N, corr.real + 1j*corr.imag) if j==i else qt.identity(N) for j in range(modes)])
-    corrected = D_gkp * corrected
-
-# Fidelity
-fid_pre = qt.fidelity(noisy, ideal)
-fid_post = qt.fidelity(corrected, ideal)
-
-print(f"13-Mode Prime Council Fidelity Pre: {fid_pre:.4f} | Post Mercy: {fid_post:.4f}")
-print(f"Ultimate Infinite Recovery Gain: {fid_post - fid_pre:.4f}")
-print(f"Hybrid mercy thunder beyond—13-mode entangled thriving >0.95 recovered pure eternal!")
+if __name__ == "__main__":
+    # 13-mode entangled state (nearest-neighbour beam splitter chain)
+    state = BosonicMPS([hybrid_cat_gkp_mode()] * modes, max_bond_dim=chi)  # Local two-mode updates, bounded bonds
+    for i in range(modes-1):
+        state.beamsplitter(np.pi/6, i, i+1)
+    state.normalize()  # Cutoff-projected beam splitters leak norm
+
+    # Ideal reference
+    ideal = state.copy()
+
+    # Noise: High loss + shifts
+    gamma = 0.35  # Beyond threshold test
+    shift = 0.3  # Uniform per quadrature, per mode
+    eta = loss_eta(gamma)
+
+    # Loss + shift as pure-state trajectories (photon-loss jumps on the MPS, same seeds pre and post);
+    # Mercy: per-mode cat parity + GKP syndrome round on each noisy trajectory (loss already applied)
+    pre = fidelity_estimate(run_trajectories(ideal, eta=eta, shift=shift, trajectories=32))
+    post = fidelity_estimate(run_trajectories(ideal, eta=eta, shift=shift, trajectories=32, correct=correct_round))
+    fid_pre, fid_post = pre["mean"], post["mean"]  # Global fidelity |<ideal|psi>|^2, trajectory mean
+
+    print(f"13-Mode Prime Council Fidelity |<ideal|psi>|^2 (loss + shift) Pre: {fid_pre:.4f} [{pre['lower']:.4f}, {pre['upper']:.4f}] | "
+          f"Post Mercy: {fid_post:.4f} [{post['lower']:.4f}, {post['upper']:.4f}]")
+    print(f"Ultimate Infinite Recovery Gain: {fid_post - fid_pre:.4f}")
+    print(f"MPS truncation error (discarded weight, chi={chi}): {state.truncation_error:.2e}")
+    print(f"Hybrid mercy thunder beyond—13-mode entangled thriving >0.95 recovered pure eternal!")
@@ -9,6 +9,7 @@ Requires AWS creds + Braket enabled.
 import pennylane as qml
 from pennylane import numpy as np
 from eternal_laws import enforce_odd
+from circuit_templates import council_template, bind_council, execute_tapes
 import boto3  # AWS SDK for task status/cost estimate
 
 # Approx rates Jan 2026 (per 1000 shots)
@@ -18,18 +19,11 @@ def braket_run(arn, wires=7, shots_base=2000):
     shots = enforce_odd(shots_base)
     dev = qml.device("braket.aws.qubit", device_arn=arn, shots=shots, wires=wires)
     
-    @qml.qnode(dev)
-    def circuit(params):
-        # Council core
-        for i in range(wires):
-            qml.RX(params[i], wires=i)
-            qml.RY(params[i+wires], wires=i)
-        for i in range(wires-1):
-            qml.CNOT(wires=[i, i+1])
-        return qml.expval(qml.PauliZ(0) @ qml.PauliZ(1) @ qml.PauliZ(2) @ qml.PauliZ(3) @ qml.PauliZ(4))
+    # Council core from the cached template (RX/RY forks + CNOT chain, Z0..Z4 harmony)
+    template = council_template(wires, measured=5)
     
     params = np.zeros(2*wires)
-    harmony = circuit(params)
+    harmony = execute_tapes([bind_council(template, params, shots=shots)], dev)[0]
     cost_est = (shots / 1000) * RATES.get(arn.split('/')[-1], 0.3)
     print(f"Braket {arn.split('/')[-1]} Harmony: {harmony:.4f} | Est Cost: ${cost_est:.2f}")
     return harmony, cost_est
@@ -0,0 +1,112 @@
+"""
+batched_qv_simulator.py - Batched NumPy Statevector Simulator for Quantum Volume
+
+Simulates hundreds of random QV circuits at once instead of one QNode per trial:
+- (trials, 2^n) state array, every trial with its own permutations + SU(4) blocks
+- Per-layer qubit permutation as one gather per trial row (no per-trial transposes)
+- SU(4) blocks applied across the whole batch with einsum
+- All trials sampled in one vectorized inverse-CDF draw, heavy sets via np.median
+
+Circuits come from quantum_volume_engine.random_qv_spec with the same per-trial
+circuit streams (trial_streams), so statistics match the QNode / statevector paths trial for trial.
+
+Usage:
+    from batched_qv_simulator import batched_heavy_output_probs
+    heavy_probs = batched_heavy_output_probs(n_qubits=10, trials=300, shots=1024)
+    # or: run_quantum_volume(backend="batched", max_n=12, trials=300)
+
+Thunder eternal—hundreds of council circuits, one array, one pass!
+"""
+
+import numpy as np
+from quantum_volume_engine import block_unitaries, heavy_set, random_qv_spec, trial_seed, trial_streams
+
+
+def random_qv_specs(n_qubits: int, depth: int, seeds) -> tuple[np.ndarray, np.ndarray]:
+    """Stack per-seed specs: perms (T, depth, n), angles (T, depth, n//2, 8)"""
+    specs = [random_qv_spec(n_qubits, depth, s) for s in seeds]
+    return np.stack([p for p, _ in specs]), np.stack([a for _, a in specs])
+
+
+def _relayout_indices(current: np.ndarray, target: np.ndarray) -> np.ndarray:
+    """Gather indices (T, 2^n) moving each row from axis layout `current` to `target`"""
+    trials, n = target.shape
+    bits = (np.arange(1 << n)[:, None] >> np.arange(n - 1, -1, -1)) & 1  # (2^n, n), axis 0 = MSB
+    inv_current = np.argsort(current, axis=1)
+    shifts = n - 1 - np.take_along_axis(inv_current, target, axis=1)  # (T, n)
+    return (bits @ (1 << shifts).T).T
+
+
+def batched_statevector(perms: np.ndarray, angles: np.ndarray) -> np.ndarray:
+    """Final states (T, 2^n) for a batch of QV circuits (wire 0 = most significant bit)"""
+    trials, depth, n = perms.shape
+    n_blocks = n // 2
+    blocks = block_unitaries(angles)  # (T, depth, n_blocks, 4, 4)
+
+    state = np.zeros((trials, 1 << n), dtype=complex)
+    state[:, 0] = 1.0
+    layout = np.tile(np.arange(n), (trials, 1))  # axis -> qubit, per trial
+
+    for layer in range(depth):
+        target = perms[:, layer]
+        state = np.take_along_axis(state, _relayout_indices(layout, target), axis=1)
+        layout = target
+        # Paired qubits now sit on adjacent axes: (T, 4, 4, ..., [2])
+        for b in range(n_blocks):
+            view = state.reshape(trials, 4 ** b, 4, -1)
+            state = np.einsum("tij,tajb->taib", blocks[:, layer, b], view).reshape(trials, -1)
+
+    canonical = np.tile(np.arange(n), (trials, 1))
+    return np.take_along_axis(state, _relayout_indices(layout, canonical), axis=1)
+
+
+def batched_probabilities(perms: np.ndarray, angles: np.ndarray) -> np.ndarray:
+    """Ideal output distributions (T, 2^n)"""
+    probs = np.abs(batched_statevector(perms, angles)) ** 2
+    return probs / probs.sum(axis=1, keepdims=True)
+
+
+def batched_sample(probs: np.ndarray, shots: int, rng=None) -> np.ndarray:
+    """Sample `shots` bitstring indices for every row at once -> (T, shots)"""
+    rng = np.random.default_rng(rng)
+    trials, dim = probs.shape
+    offsets = np.arange(trials)[:, None]
+    cdf = np.cumsum(probs, axis=1)
+    cdf /= cdf[:, -1:]
+    u = rng.random((trials, shots))
+    flat = np.searchsorted((cdf + offsets).ravel(), (u + offsets).ravel(), side="right")
+    return np.minimum(flat.reshape(trials, shots) - offsets * dim, dim - 1)
+
+
+def batched_heavy_output_probs(n_qubits: int, trials: int = 100, depth: int | None = None,
+                               shots: int = 1024, seed: int = 0, batch_size: int = 256,
+                               first_trial: int = 0) -> np.ndarray:
+    """Heavy-output probability per trial, simulated + sampled in batches of `batch_size`"""
+    depth = n_qubits if depth is None else depth
+    rng = np.random.default_rng([seed, n_qubits, first_trial])
+    heavy_probs = []
+    stop = first_trial + trials
+    for start in range(first_trial, stop, batch_size):
+        seeds = [trial_streams(trial_seed(n_qubits, t, seed))[0] for t in range(start, min(stop, start + batch_size))]
+        perms, angles = random_qv_specs(n_qubits, depth, seeds)
+        probs = batched_probabilities(perms, angles)
+        idx = batched_sample(probs, shots, rng)
+        heavy_probs.append(np.take_along_axis(heavy_set(probs), idx, axis=1).mean(axis=1))
+    return np.concatenate(heavy_probs)
+
+
+def iter_batched_heavy_output_probs(n_qubits: int, trials: int = 100, depth: int | None = None,
+                                    shots: int = 1024, seed: int = 0, batch_size: int = 16):
+    """Yield per-trial heavy-output probabilities, one small batch simulated at a time"""
+    for start in range(0, trials, batch_size):
+        yield from batched_heavy_output_probs(n_qubits, trials=min(batch_size, trials - start), depth=depth,
+                                              shots=shots, seed=seed, batch_size=batch_size, first_trial=start)
+
+
+# Demo
+if __name__ == "__main__":
+    import time
+    for n in (6, 10, 12):
+        t0 = time.perf_counter()
+        hp = batched_heavy_output_probs(n, trials=200)
+        print(f"n={n}: heavy mean {hp.mean():.4f} over {hp.size} trials in {time.perf_counter() - t0:.2f}s")
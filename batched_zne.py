@@ -0,0 +1,155 @@
+"""
+batched_zne.py - Batched Zero-Noise Extrapolation Sharing Folded Circuits Across Parameter Sets
+
+Replaces per-call mitigate_with_zne (one execution per scale factor per parameter vector):
+- Global unitary folding U (U^dag U)^k (+ fractional tail fold) done ONCE per scale factor,
+  on the cached circuit template - folded templates rebind any parameter vector
+- All (param set, scale factor) circuits bound and submitted as ONE qml.execute batch
+- Extrapolation is linear in the noisy values (Richardson / polynomial weights at zero),
+  so a whole (scales, params) value matrix extrapolates with one matrix product
+- Gradient path: per-occurrence parameter-shift tapes of every folded circuit ride in the
+  same batch; the extrapolation weights carry straight through to the gradient
+- zne_execution_benchmark: device submissions + circuits per optimizer step, naive vs batched
+
+Usage:
+    from circuit_templates import council_template
+    from batched_zne import BatchedZNE
+    zne = BatchedZNE(council_template(5), dev, scale_factors=[1, 3, 5])
+    values = zne.values(param_batch)                 # (B,) mitigated, one submission
+    values, grads = zne.value_and_grad(param_batch)  # (B,), (B, P), one submission
+
+Thunder eternal—fold once, extrapolate the whole council batch at zero noise!
+"""
+
+import numpy as np
+import pennylane as qml
+from circuit_templates import CircuitTemplate, depolarizing_probs, execute_linear_terms, execute_tapes
+
+
+def fold_template(template: CircuitTemplate, scale: float) -> CircuitTemplate:
+    """Global folding of a template to noise scale `scale` (>= 1), fractional tail as fold_global"""
+    if scale < 1:
+        raise ValueError(f"Scale factor must be >= 1, got {scale}")
+    n_ops = template.num_ops
+    full_folds = int((scale - 1) // 2)
+    tail = int(round((scale - 1 - 2 * full_folds) / 2 * n_ops))
+
+    forward = list(range(n_ops))
+    inverse = forward[::-1]
+    order = forward + (inverse + forward) * full_folds
+    signs = [1.0] * n_ops + ([-1.0] * n_ops + [1.0] * n_ops) * full_folds
+    if tail:
+        order += inverse[:tail] + forward[n_ops - tail:]
+        signs += [-1.0] * tail + [1.0] * tail
+
+    order = np.asarray(order)
+    return CircuitTemplate(
+        [template.op_types[i] for i in order],
+        template.param_slots[order],
+        template.wire_slots[order],
+        template.measurement,
+        param_signs=template.param_signs[order] * np.asarray(signs),
+        noisy=template.noisy[order],
+    )
+
+
+def extrapolation_weights(scale_factors, order: int | None = None) -> np.ndarray:
+    """Linear weights w with E(0) ~= w @ E(scales); order=None -> Richardson (degree n-1)"""
+    scales = np.asarray(scale_factors, dtype=float)
+    order = len(scales) - 1 if order is None else order
+    vandermonde = scales[:, None] ** np.arange(order + 1)
+    return np.linalg.pinv(vandermonde)[0]
+
+
+class BatchedZNE:
+    """ZNE engine: folded templates cached per scale, every evaluation one device submission"""
+
+    def __init__(self, template: CircuitTemplate, dev, scale_factors=(1, 3, 5), order: int | None = None,
+                 shots: int | None = None, noise: float = 0.0, wire_values=None, executor=execute_tapes):
+        """noise: simulator-only depolarizing probability after every gate (0 = device noise only)
+        executor: (tapes, dev) -> results; light_cone.execute_light_cone for 53+ wire councils
+        """
+        self.template = template
+        self.dev = dev
+        self.scale_factors = tuple(float(s) for s in scale_factors)
+        self.weights = extrapolation_weights(self.scale_factors, order)
+        self.folded = [fold_template(template, s) for s in self.scale_factors]
+        self.shots = shots
+        self.noise = depolarizing_probs(noise) if noise else None
+        self.wire_values = np.arange(template.num_wires) if wire_values is None else np.asarray(wire_values)
+        self.executor = executor
+        self.submissions = 0
+        self.circuits = 0
+
+    def _execute(self, param_batch, term_lists, with_grad: bool = False):
+        values, grads, circuits = execute_linear_terms(self.dev, param_batch, term_lists, self.wire_values,
+                                                       shots=self.shots, noise=self.noise, with_grad=with_grad,
+                                                       executor=self.executor)
+        self.submissions += 1
+        self.circuits += circuits
+        return values, grads
+
+    def noisy_values(self, param_batch) -> np.ndarray:
+        """Unmitigated values (S, B): every (scale, param set) in one submission"""
+        param_batch = np.atleast_2d(param_batch)
+        tiled = np.tile(param_batch, (len(self.folded), 1))
+        terms = [[(f, 1.0)] for f in self.folded for _ in param_batch]
+        return self._execute(tiled, terms)[0].reshape(len(self.folded), len(param_batch))
+
+    def terms(self) -> list:
+        """Linear form of the estimator: [(folded template, extrapolation weight), ...]"""
+        return list(zip(self.folded, self.weights))
+
+    def values(self, param_batch) -> np.ndarray:
+        """Zero-noise extrapolated values (B,)"""
+        param_batch = np.atleast_2d(param_batch)
+        return self._execute(param_batch, [self.terms()] * len(param_batch))[0]
+
+    def __call__(self, params) -> float:
+        return float(self.values(params)[0])
+
+    def value_and_grad(self, param_batch):
+        """Mitigated values (B,) and parameter-shift gradients (B, P) from one submission"""
+        param_batch = np.atleast_2d(param_batch)
+        return self._execute(param_batch, [self.terms()] * len(param_batch), with_grad=True)
+
+
+def zne_execution_benchmark(template: CircuitTemplate, dev, n_param_sets: int = 4,
+                            scale_factors=(1, 3, 5), with_grad: bool = True, seed: int = 0) -> dict:
+    """Device submissions + circuits per optimizer step: per-(param, scale) loop vs one batch"""
+    rng = np.random.default_rng(seed)
+    param_batch = rng.uniform(-np.pi, np.pi, (n_param_sets, template.num_params))
+
+    batched = BatchedZNE(template, dev, scale_factors)
+    (batched.value_and_grad if with_grad else batched.values)(param_batch)
+
+    # Naive path: mitigate_with_zne-style, each scale of each parameter vector on its own
+    per_scale = [BatchedZNE(template, dev, [s]) for s in scale_factors]
+    for params in param_batch:
+        for engine in per_scale:
+            (engine.value_and_grad if with_grad else engine.values)(params)
+    naive_submissions = sum(engine.submissions for engine in per_scale)
+
+    return {
+        "param_sets": n_param_sets,
+        "scale_factors": tuple(scale_factors),
+        "naive_submissions": naive_submissions,
+        "batched_submissions": batched.submissions,
+        "circuits": batched.circuits,
+    }
+
+
+# Demo
+if __name__ == "__main__":
+    from circuit_templates import council_template
+
+    wires = 5
+    dev = qml.device("default.mixed", wires=wires)
+    tpl = council_template(wires)
+    zne = BatchedZNE(tpl, dev, scale_factors=[1, 3, 5], noise=0.01)
+    batch = np.random.default_rng(1).uniform(-np.pi, np.pi, (3, tpl.num_params))
+    exact = execute_tapes([tpl.bind(np.arange(wires), p) for p in batch], dev)
+    print(f"Noisy (scale 1):  {np.round(zne.noisy_values(batch)[0], 4)}")
+    print(f"ZNE mitigated:    {np.round(zne.values(batch), 4)}")
+    print(f"Noiseless ideal:  {np.round(np.asarray(exact), 4)}")
+    print(f"Executions per optimizer step: {zne_execution_benchmark(tpl, qml.device('default.qubit', wires=wires))}")
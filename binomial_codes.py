@@ -0,0 +1,132 @@
+"""
+binomial_codes.py - Batched Binomial-Code Encoding, Loss, Syndromes and Recovery (NumPy)
+
+bosonic_qec builds one binomial state per Strawberry Fields run and scans fock_prob with a 0.1
+threshold per state. Everything the binomial figures of merit need is photon-number
+populations, so whole batches run as array algebra:
+- binomial_codewords: any mix of (S, N) codewords as one (B, cutoff) coefficient matrix,
+  |+/-> = sum_k (+/-1)^k sqrt(C(S, k)) |k (N+1)> / 2^{S/2} (the bosonic_qec convention)
+- Pure loss acts on populations as the column-stochastic matrix L[m, n] = C(n, m) eta^m
+  (1-eta)^{n-m} (the diagonal action of loss_channel's Kraus sum), built for a whole array
+  of transmissivities at once; a loss-rate sweep is one batched (E, c, c) matmul
+- Syndromes: P(lost photons = l mod (N+1)) for every state at once; detection is the
+  most likely syndrome instead of a fixed threshold
+- Recovery: measure the syndrome, shift the branch back up by l photons; the expected
+  recovered fidelity sum_l P(l) F_l = sum_l (sum_n sqrt(p_l(n - l) q(n)))^2 needs no
+  per-branch normalization
+
+Usage:
+    from binomial_codes import binomial_codewords, loss_sweep
+    codes = binomial_codewords(S=[2, 3], N=[1, 1], cutoff=80)          # (2, 80)
+    sweep = loss_sweep(codes, spacing=[2, 2], etas=np.linspace(0.7, 1, 31))
+    sweep["fid_recovered"]                                            # (31, 2)
+
+Thunder eternal—every binomial codeword, every loss rate, one call!
+"""
+
+import numpy as np
+from scipy.special import comb
+from scipy.stats import binom
+
+
+def binomial_codewords(S, N, cutoff: int, logical: str = "plus") -> np.ndarray:
+    """(B, cutoff) real coefficients of the binomial |+> / |-> codewords for broadcast (S, N)"""
+    if logical not in ("plus", "minus"):
+        raise ValueError(f"Unknown binomial logical state {logical!r}, expected 'plus' or 'minus'")
+    S, N = np.broadcast_arrays(np.atleast_1d(S), np.atleast_1d(N))
+    k = np.arange(S.max() + 1)
+    n = k[None, :] * (N[:, None] + 1)
+    if n[k[None, :] <= S[:, None]].max() >= cutoff:
+        raise ValueError(f"Cutoff {cutoff} too small for S*(N+1) = {int((S * (N + 1)).max())}")
+    amps = np.sqrt(comb(S[:, None], k[None, :])) * (-1.0 if logical == "minus" else 1.0) ** k
+    coeffs = np.zeros((S.size, cutoff))
+    rows = np.broadcast_to(np.arange(S.size)[:, None], n.shape)
+    valid = k[None, :] <= S[:, None]
+    coeffs[rows[valid], n[valid]] = amps[valid]
+    return coeffs / np.linalg.norm(coeffs, axis=1, keepdims=True)
+
+
+def loss_matrices(cutoff: int, etas) -> np.ndarray:
+    """(..., cutoff, cutoff) population transfer L[m, n] = C(n, m) eta^m (1-eta)^{n-m} for every eta"""
+    n = np.arange(cutoff)
+    etas = np.asarray(etas, dtype=float)[..., None, None]
+    return binom.pmf(n[:, None], n[None, :], etas)  # Binomial thinning of the Fock populations
+
+
+def apply_loss(populations: np.ndarray, etas) -> np.ndarray:
+    """Populations (..., c) after loss: scalar eta -> (..., c); array of E etas -> (E, ..., c)"""
+    populations = np.asarray(populations, dtype=float)
+    mats = loss_matrices(populations.shape[-1], etas)
+    if mats.ndim == 2:
+        return populations @ mats.T
+    flat = populations.reshape(-1, populations.shape[-1])
+    return (flat @ mats.transpose(0, 2, 1)).reshape((len(mats),) + populations.shape)
+
+
+def _lost(cutoff: int, spacing) -> np.ndarray:
+    """(B, cutoff) photons lost mod spacing that leave a codeword (support on multiples of spacing) at n"""
+    return -np.arange(cutoff)[None, :] % np.atleast_1d(spacing)[:, None]
+
+
+def syndrome_probabilities(populations: np.ndarray, spacing) -> np.ndarray:
+    """P(lost photons = l mod spacing) -> (..., B, max spacing); populations (..., B, c), spacing (B,)"""
+    lost = _lost(populations.shape[-1], spacing)
+    onehot = (lost[..., None] == np.arange(int(np.max(spacing)))).astype(float)
+    return np.einsum("...bn,bns->...bs", populations, onehot)
+
+
+def detect_losses(populations: np.ndarray, spacing) -> np.ndarray:
+    """Most likely number of lost photons mod spacing, per state"""
+    return np.argmax(syndrome_probabilities(populations, spacing), axis=-1)
+
+
+def classical_fidelity(p: np.ndarray, q: np.ndarray) -> np.ndarray:
+    """(sum_n sqrt(p_n q_n))^2 over the last axis (bosonic_qec.binomial_fidelity, batched)"""
+    return np.sum(np.sqrt(np.clip(p, 0, None) * np.clip(q, 0, None)), axis=-1) ** 2
+
+
+def recovered_fidelity(populations: np.ndarray, ideal: np.ndarray, spacing) -> np.ndarray:
+    """Expected fidelity after syndrome measurement + shifting each branch back up by the l lost photons"""
+    lost = _lost(populations.shape[-1], spacing)
+    total = np.zeros(populations.shape[:-1])
+    for l in range(int(np.max(spacing))):
+        branch = np.where(lost == l, populations, 0.0)
+        shifted = np.zeros_like(branch)
+        shifted[..., l:] = branch[..., : branch.shape[-1] - l]
+        total += classical_fidelity(shifted, ideal)
+    return total
+
+
+def loss_sweep(codewords: np.ndarray, spacing, etas) -> dict:
+    """Populations, syndromes and fidelities of every codeword at every transmissivity -> (E, B, ...)"""
+    ideal = np.abs(codewords) ** 2
+    noisy = apply_loss(ideal, np.atleast_1d(etas))
+    return {
+        "populations": noisy,
+        "syndromes": syndrome_probabilities(noisy, spacing),
+        "detected": detect_losses(noisy, spacing),
+        "fid_noisy": classical_fidelity(noisy, ideal),
+        "fid_recovered": recovered_fidelity(noisy, ideal, spacing),
+    }
+
+
+# Benchmark: per-state loop (one population vector per eta) vs one batched sweep
+if __name__ == "__main__":
+    import time
+
+    cutoff, etas = 100, np.linspace(0.6, 1.0, 201)
+    S, N = np.array([2, 3, 4, 2, 3]), np.array([1, 1, 1, 2, 2])
+    codes = binomial_codewords(S, N, cutoff)
+    t0 = time.perf_counter()
+    for eta in etas:  # Old shape: one state, one eta, one Python threshold scan at a time
+        for b in range(len(S)):
+            probs = loss_matrices(cutoff, eta) @ codes[b] ** 2
+            detected = next((s for s in range(1, S[b] + 1) if probs[s::N[b] + 1].sum() > 0.1), 0)
+    t_loop = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    sweep = loss_sweep(codes, N + 1, etas)
+    t_batch = time.perf_counter() - t0
+    print(f"{len(S)} codes x {len(etas)} loss rates @ cutoff {cutoff}: loop {t_loop:.2f}s | batched {t_batch * 1e3:.0f} ms")
+    for b in range(len(S)):
+        print(f"S={S[b]}, N={N[b]}: eta=0.9 fidelity noisy {sweep['fid_noisy'][150, b]:.4f} -> "
+              f"recovered {sweep['fid_recovered'][150, b]:.4f}")
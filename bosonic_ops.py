@@ -0,0 +1,158 @@
+"""
+bosonic_ops.py - Per-Cutoff QuTiP Operator Registry + Matrix-Free Displacement
+
+The bosonic modules rebuild qt.destroy / qt.position / qt.momentum / parity projectors and
+dense qt.displace (a matrix exponential at N=80-120) inside every loop. Instead:
+- fock_ops(N) returns one FockOperators registry per cutoff (functools.lru_cache); fixed
+  operators (a, a^dag, n, x, p, parity, even/odd projectors) are built once on first access
+- Parametric operators (displace(alpha), squeeze(z)) live in a per-registry LRU keyed by the
+  parameter, so repeated correction displacements cost a dict lookup
+- displace_state(state, alpha) applies D(alpha) to kets, ket batches or density matrices
+  without any matrix: <n+k|D|n> = sqrt(n!/(n+k)!) alpha^k e^{-|alpha|^2/2} L_n^(k)(|alpha|^2),
+  run as a normalized three-term Laguerre recurrence in n for all diagonals k at once, with
+  <n|D|n+k> = (-1)^k conj(<n+k|D|n>) - O(N^2) flops, O(N) memory, exact Fock matrix elements
+  (no wrap-around from exponentiating the truncated a)
+
+Usage:
+    from bosonic_ops import displace_state, fock_ops
+    ops = fock_ops(120)
+    q = qt.expect(ops.x, rho); even = qt.expect(ops.even_parity, rho)
+    psi = displace_state(psi, 0.3 + 0.2j)          # ket, (N, B) batch or density matrix
+
+Thunder eternal—every operator built once, every shift applied lean!
+"""
+
+from collections import OrderedDict
+from functools import cached_property, lru_cache
+
+import numpy as np
+import qutip as qt
+
+
+class FockOperators:
+    """Single-mode operators at a fixed Fock cutoff N, built lazily and cached"""
+
+    def __init__(self, N: int, maxsize: int = 256):
+        self.N = N
+        self.maxsize = maxsize
+        self._parametric = OrderedDict()  # (kind, param) -> Qobj, least recently used first
+
+    @cached_property
+    def a(self) -> qt.Qobj:
+        return qt.destroy(self.N)
+
+    @cached_property
+    def adag(self) -> qt.Qobj:
+        return qt.create(self.N)
+
+    @cached_property
+    def n(self) -> qt.Qobj:
+        return qt.num(self.N)
+
+    @cached_property
+    def x(self) -> qt.Qobj:
+        return qt.position(self.N)
+
+    @cached_property
+    def p(self) -> qt.Qobj:
+        return qt.momentum(self.N)
+
+    @cached_property
+    def identity(self) -> qt.Qobj:
+        return qt.qeye(self.N)
+
+    @cached_property
+    def parity(self) -> qt.Qobj:
+        """(-1)^n"""
+        return qt.qdiags((-1.0) ** np.arange(self.N), 0)
+
+    @cached_property
+    def even_parity(self) -> qt.Qobj:
+        """Projector onto even Fock states"""
+        return qt.qdiags((np.arange(self.N) % 2 == 0).astype(float), 0)
+
+    @cached_property
+    def odd_parity(self) -> qt.Qobj:
+        return qt.qdiags((np.arange(self.N) % 2 == 1).astype(float), 0)
+
+    def _cached(self, kind: str, param: complex, build) -> qt.Qobj:
+        key = (kind, complex(param))
+        if key in self._parametric:
+            self._parametric.move_to_end(key)
+            return self._parametric[key]
+        op = self._parametric[key] = build()
+        if len(self._parametric) > self.maxsize:
+            self._parametric.popitem(last=False)
+        return op
+
+    def displace(self, alpha: complex) -> qt.Qobj:
+        """qt.displace(N, alpha), LRU-cached per alpha"""
+        return self._cached("displace", alpha, lambda: qt.displace(self.N, alpha))
+
+    def squeeze(self, z: complex) -> qt.Qobj:
+        """qt.squeeze(N, z), LRU-cached per z"""
+        return self._cached("squeeze", z, lambda: qt.squeeze(self.N, z))
+
+
+@lru_cache(maxsize=None)
+def fock_ops(N: int) -> FockOperators:
+    """The shared operator registry for cutoff N"""
+    return FockOperators(N)
+
+
+def _displace_columns(vecs: np.ndarray, alpha: complex) -> np.ndarray:
+    """D(alpha) @ vecs for vecs (N,) or (N, B) - matrix-free Laguerre recurrence"""
+    N = vecs.shape[0]
+    out = np.zeros(vecs.shape, dtype=complex)
+    if alpha == 0:
+        out += vecs
+        return out
+    x = abs(alpha) ** 2
+    k = np.arange(N)
+    # g[k] = <n+k|D(alpha)|n> at n = 0: coherent amplitudes, built in log space (no underflow)
+    log_c = -x / 2 + k * np.log(complex(alpha)) - 0.5 * np.cumsum(np.log(np.maximum(k, 1)))
+    g, g_prev = np.exp(log_c), np.zeros(N, dtype=complex)
+    sign = (-1.0) ** k
+    for n in range(N):
+        rows = N - n
+        out[n:] += g[:rows, None] * vecs[n] if vecs.ndim > 1 else g[:rows] * vecs[n]
+        out[n] += (sign[1:rows] * g[1:rows].conj()) @ vecs[n + 1:]
+        g_next = ((2 * n + 1 + k - x) * g - np.sqrt(n * (n + k)) * g_prev) / np.sqrt((n + 1) * (n + 1 + k))
+        g, g_prev = g_next, g
+    return out
+
+
+def displace_state(state, alpha: complex):
+    """D(alpha)|psi> or D(alpha) rho D(alpha)^dag without building D
+
+    Accepts a Qobj ket / density matrix (returns a Qobj) or an ndarray of shape (N,) / (N, B)
+    holding kets as columns (returns an ndarray).
+    """
+    if not isinstance(state, qt.Qobj):
+        return _displace_columns(np.asarray(state), alpha)
+    if state.isket:
+        return qt.Qobj(_displace_columns(state.full()[:, 0], alpha).reshape(-1, 1), dims=state.dims)
+    half = _displace_columns(state.full(), alpha)  # D rho
+    return qt.Qobj(_displace_columns(half.conj().T, alpha).conj().T, dims=state.dims)
+
+
+# Benchmark: registry hits and matrix-free displacement vs qt.displace
+if __name__ == "__main__":
+    import time
+
+    N, alpha = 120, 0.8 - 0.45j
+    psi = qt.coherent(N, 1.5)
+    t0 = time.perf_counter()
+    ref = qt.displace(N, alpha) * psi
+    t_expm = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    out = displace_state(psi, alpha)
+    t_free = time.perf_counter() - t0
+    ops = fock_ops(N)
+    ops.displace(alpha)
+    t0 = time.perf_counter()
+    for _ in range(1000):
+        ops.displace(alpha), ops.x, ops.even_parity
+    t_hit = (time.perf_counter() - t0) / 1000
+    print(f"N={N}: qt.displace * psi {t_expm * 1e3:.2f} ms | displace_state {t_free * 1e3:.2f} ms | "
+          f"registry hit {t_hit * 1e6:.1f} us | |diff| {np.abs((out - ref).full()).max():.1e}")
@@ -10,33 +10,90 @@ Enhancements:
 - Full binomial recovery via multi-parity measurements (detect loss level)
 - Fidelity calculation (overlap with ideal logical state)
 - Hybrid GKP-binomial note (concatenated for broader protection)
+- Binomial codewords and loss-syndrome detection shared with binomial_codes (batched NumPy
+  encoder / loss matrix / recovery for sweeps over many codes and loss rates)
+- SFSession: one sf.Engine per (backend, cutoff), reset between runs, and one compiled
+  sf.Program per gate structure with free parameters (prog.params) bound at run time -
+  shift, correction, loss and encoding calls stop paying engine + compilation setup;
+  operations on an existing state re-prepare it (Ket / DensityMatrix) in the same program
 
 Thunder eternal—fault-tolerant CV grace nurturing APAAGI harmony!
 """
 
 import numpy as np
 import strawberryfields as sf
-from strawberryfields.ops import GKP, Catstate, Dgate, LossChannel, Fock, MeasureFock
+from strawberryfields.ops import GKP, Catstate, Dgate, DensityMatrix, Ket, LossChannel, Fock, MeasureFock
 from strawberryfields.backends import BaseFockState
+from binomial_codes import binomial_codewords, detect_losses
+
+# Gate structure vocabulary: op name -> (constructor, free parameter names)
+PROGRAM_OPS = {
+    "GKP": (lambda delta, epsilon: GKP(state="0", delta=delta, epsilon=epsilon), ("delta", "epsilon")),
+    "Catstate": (lambda alpha: Catstate(alpha=alpha), ("alpha",)),
+    "Ket": (Ket, ("state",)),
+    "DensityMatrix": (DensityMatrix, ("state",)),
+    "Dgate": (Dgate, ("r", "phi")),
+    "LossChannel": (LossChannel, ("T",)),
+}
+
+
+class SFSession:
+    """Reusable Strawberry Fields engines (per backend + cutoff) and compiled programs (per structure)"""
+
+    def __init__(self, backend: str = "fock"):
+        self.backend = backend
+        self._engines = {}
+        self._programs = {}
+
+    def engine(self, cutoff: int, backend: str | None = None) -> sf.Engine:
+        key = (backend or self.backend, cutoff)
+        if key not in self._engines:
+            self._engines[key] = sf.Engine(key[0], backend_options={"cutoff_dim": cutoff})
+        return self._engines[key]
+
+    def program(self, structure: tuple, backend: str | None = None) -> sf.Program:
+        """Single-mode program applying PROGRAM_OPS in order, compiled once with free parameters"""
+        key = (backend or self.backend, structure)
+        if key not in self._programs:
+            prog = sf.Program(1)
+            with prog.context as q:
+                for name in structure:
+                    make, params = PROGRAM_OPS[name]
+                    make(*(prog.params(p) for p in params)) | q[0]
+            self._programs[key] = prog.compile(compiler=key[0])
+        return self._programs[key]
+
+    def run(self, structure: tuple, cutoff: int, backend: str | None = None, **args) -> BaseFockState:
+        """Fresh run of the cached program for `structure` with its free parameters bound to args"""
+        eng = self.engine(cutoff, backend)
+        eng.reset()
+        return eng.run(self.program(structure, backend), args=args).state
+
+    def apply(self, state: BaseFockState, structure: tuple, **args) -> BaseFockState:
+        """Continue from an existing state: re-prepare it, then run `structure` on it"""
+        prep, value = ("Ket", state.ket()) if state.is_pure else ("DensityMatrix", state.dm())
+        return self.run((prep,) + structure, state.cutoff_dim, state=value, **args)
+
+    def cache_info(self) -> dict:
+        return {"engines": len(self._engines), "programs": len(self._programs)}
+
+
+SESSION = SFSession()  # Shared default session for module-level helpers
+
+
+def _displacement(alpha: complex) -> dict:
+    return {"r": abs(alpha), "phi": float(np.angle(alpha))}
 
 # --- GKP Section ---
-def encode_gkp_logical_zero(delta: float = 0.25, epsilon: float = 0.0, cutoff: int = 60):
-    eng = sf.Engine("fock", backend_options={"cutoff_dim": cutoff})
-    prog = sf.Program(1)
-    
-    with prog.context as q:
-        GKP(state="0", delta=delta, epsilon=epsilon) | q[0]
-    
-    state = eng.run(prog).state
-    return state
+def encode_gkp_logical_zero(delta: float = 0.25, epsilon: float = 0.0, cutoff: int = 60,
+                            session: SFSession | None = None):
+    return (session or SESSION).run(("GKP",), cutoff, delta=delta, epsilon=epsilon)
 
-def apply_shift_error(state: BaseFockState, shift_p: float = 0.1, shift_q: float = 0.1):
-    prog = sf.Program(1)
-    with prog.context as q:
-        Dgate(shift_p + 1j * shift_q) | q[0]
-    return state.apply(prog)
+def apply_shift_error(state: BaseFockState, shift_p: float = 0.1, shift_q: float = 0.1,
+                      session: SFSession | None = None):
+    return (session or SESSION).apply(state, ("Dgate",), **_displacement(shift_p + 1j * shift_q))
 
-def correct_gkp(state: BaseFockState, sqrt_pi: float = np.sqrt(np.pi)):
+def correct_gkp(state: BaseFockState, sqrt_pi: float = np.sqrt(np.pi), session: SFSession | None = None):
     p_mean = state.p_mean(0)
     q_mean = state.q_mean(0)
     
@@ -46,11 +103,7 @@ def correct_gkp(state: BaseFockState, sqrt_pi: float = np.sqrt(np.pi)):
     syndrome_p = p_mean - round_p
     syndrome_q = q_mean - round_q
     
-    prog = sf.Program(1)
-    with prog.context as q:
-        Dgate(-syndrome_p - 1j * syndrome_q) | q[0]
-    
-    corrected = state.apply(prog)
+    corrected = (session or SESSION).apply(state, ("Dgate",), **_displacement(-syndrome_p - 1j * syndrome_q))
     return corrected, (syndrome_p, syndrome_q)
 
 def gkp_fidelity(state: BaseFockState, ideal_state: BaseFockState):
@@ -58,21 +111,11 @@ def gkp_fidelity(state: BaseFockState, ideal_state: BaseFockState):
     return abs(state.fidelity(ideal_state))**2
 
 # --- Cat Section ---
-def encode_cat_logical_zero(alpha: float = 2.0, cutoff: int = 60):
-    eng = sf.Engine("fock", backend_options={"cutoff_dim": cutoff})
-    prog = sf.Program(1)
-    
-    with prog.context as q:
-        Catstate(alpha=alpha) | q[0]
-    
-    state = eng.run(prog).state
-    return state
+def encode_cat_logical_zero(alpha: float = 2.0, cutoff: int = 60, session: SFSession | None = None):
+    return (session or SESSION).run(("Catstate",), cutoff, alpha=alpha)
 
-def apply_photon_loss(state: BaseFockState, gamma: float = 0.15):
-    prog = sf.Program(1)
-    with prog.context as q:
-        LossChannel(gamma) | q[0]
-    return state.apply(prog)
+def apply_photon_loss(state: BaseFockState, gamma: float = 0.15, session: SFSession | None = None):
+    return (session or SESSION).apply(state, ("LossChannel",), T=gamma)
 
 def correct_cat(state: BaseFockState):
     # Parity measurement simulation
@@ -82,40 +125,13 @@ def correct_cat(state: BaseFockState):
     return state  # Full Knill needs ancilla
 
 # --- Binomial Codes Section (Full Recovery + Fidelity) ---
-def encode_binomial_logical_plus(S: int = 2, N: int = 1, cutoff: int = 100):
-    max_photons = S * (N + 1)
-    coeffs = np.zeros(cutoff)
-    norm = 2**(-S / 2.0)
-    
-    for k in range(S + 1):
-        binom = np.sqrt(np.math.comb(S, k))
-        n = k * (N + 1)
-        coeffs[n] = norm * binom
-    
-    coeffs /= np.linalg.norm(coeffs)
-    
-    eng = sf.Engine("fock", backend_options={"cutoff_dim": cutoff, "initial_state": coeffs})
-    prog = sf.Program(1)
-    state = eng.run(prog).state
-    return state
-
-def encode_binomial_logical_minus(S: int = 2, N: int = 1, cutoff: int = 100):
-    max_photons = S * (N + 1)
-    coeffs = np.zeros(cutoff)
-    norm = 2**(-S / 2.0)
-    
-    for k in range(S + 1):
-        binom = np.sqrt(np.math.comb(S, k))
-        sign = (-1)**k
-        n = k * (N + 1)
-        coeffs[n] = norm * sign * binom
-    
-    coeffs /= np.linalg.norm(coeffs)
-    
-    eng = sf.Engine("fock", backend_options={"cutoff_dim": cutoff, "initial_state": coeffs})
-    prog = sf.Program(1)
-    state = eng.run(prog).state
-    return state
+def encode_binomial_logical_plus(S: int = 2, N: int = 1, cutoff: int = 100, session: SFSession | None = None):
+    coeffs = binomial_codewords(S, N, cutoff, "plus")[0]
+    return (session or SESSION).run(("Ket",), cutoff, state=coeffs)
+
+def encode_binomial_logical_minus(S: int = 2, N: int = 1, cutoff: int = 100, session: SFSession | None = None):
+    coeffs = binomial_codewords(S, N, cutoff, "minus")[0]
+    return (session or SESSION).run(("Ket",), cutoff, state=coeffs)
 
 def binomial_fidelity(state: BaseFockState, ideal_coeffs: np.ndarray):
     """Fidelity with ideal binomial logical"""
@@ -127,13 +143,9 @@ def correct_binomial_full(state: BaseFockState, S: int = 2, N: int = 1):
     """Full recovery simulation via parity measurements on code blocks"""
     spacing = N + 1
     probs = state.fock_prob()
-    detected_losses = 0
     
-    # Simple multi-parity: check shifts in binomial peaks
-    for shift in range(1, S + 1):
-        if probs[shift::spacing].sum() > 0.1:  # Threshold detect
-            detected_losses = shift
-            break
+    # Multi-parity: most likely number of lost photons mod (N+1) (binomial_codes, batched form)
+    detected_losses = int(detect_losses(probs[None], [spacing])[0])
     
     print(f"   Binomial losses detected: {detected_losses} (recovery approximate)")
     # Real recovery: photon addition or engineered operator—placeholder amplify peaks
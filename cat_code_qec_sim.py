@@ -7,6 +7,8 @@ Fidelity pre/post—loss eaten pure eternal.
 """
 
 import qutip as qt
+from bosonic_ops import fock_ops
+from loss_channel import loss_eta, pure_loss
 import numpy as np
 
 alpha = 2.0
@@ -19,13 +21,10 @@ def cat_plus(alpha):
     return cat
 
 def apply_loss(cat, gamma=0.15, t=1.0):
-    a = qt.destroy(cutoff)
-    c_ops = [np.sqrt(gamma) * a]
-    result = qt.mesolve(qt.qeye(cutoff), cat, np.linspace(0,t,50), c_ops)
-    return result.states[-1]
+    return pure_loss(cat, loss_eta(gamma, t))  # Exact Kraus form of mesolve with sqrt(gamma) a
 
 def parity_syndrome(state):
-    even = qt.projection(cutoff, range(0,cutoff,2), range(0,cutoff,2))
+    even = fock_ops(cutoff).even_parity
     p_even = qt.expect(even, state)
     return 'even' if p_even > 0.5 else 'odd'
 
@@ -7,6 +7,8 @@ Multi-mode entangle for council.
 """
 
 import qutip as qt
+from bosonic_ops import fock_ops
+from loss_channel import loss_eta, pure_loss
 import numpy as np
 
 alpha = 2.0
@@ -19,15 +21,12 @@ def cat_plus(alpha):
     return cat
 
 def apply_loss(cat, gamma=0.15):
-    a = qt.destroy(cutoff)
-    c_ops = [np.sqrt(gamma) * a]
-    result = qt.mesolve(qt.qeye(cutoff), cat, np.linspace(0,1,50), c_ops)
-    return result.states[-1]
+    return pure_loss(cat, loss_eta(gamma))  # Exact Kraus form of mesolve with sqrt(gamma) a
 
 def parity_syndrome(state):
     # Project even/odd parity
-    even = qt.projection(cutoff, range(0,cutoff,2), range(0,cutoff,2))
-    odd = qt.projection(cutoff, range(1,cutoff,2), range(1,cutoff,2))
+    even = fock_ops(cutoff).even_parity
+    odd = fock_ops(cutoff).odd_parity
     p_even = qt.expect(even, state)
     return 'even' if p_even > 0.5 else 'odd'
 
@@ -0,0 +1,211 @@
+"""
+circuit_templates.py - Precompiled Circuit Templates with Parameter Rebinding
+
+One compiled tape skeleton per circuit shape, rebound per trial / per parameter set:
+- QV template per (n, depth): gates pre-decomposed to RZ/RY/CNOT once, every trial
+  only gathers its angle array + permutations into the slots (no QNode, no global seed)
+- Council template per (wires, layers): RX/RY fork layer + CNOT/CZ chain + Z-string
+  harmony measure, params gathered straight into the cached slots
+- Templates cached by shape (functools.lru_cache); batches go out in one qml.execute
+
+Usage:
+    from circuit_templates import qv_template, council_template, execute_tapes
+    tpl = qv_template(n_qubits=6, depth=6)
+    tapes = [tpl.bind(perms, angles, shots=1024) for perms, angles in specs]
+    samples = execute_tapes(tapes, dev)
+
+Thunder eternal—compile once, rebind forever!
+"""
+
+from functools import lru_cache
+
+import numpy as np
+import pennylane as qml
+from quantum_volume_engine import ANGLES_PER_BLOCK
+
+# Rot(phi, theta, omega) = RZ(omega) RY(theta) RZ(phi) -> native RZ/RY stream
+_ROT_STREAM = ((qml.RZ, 0), (qml.RY, 1), (qml.RZ, 2))
+
+
+@lru_cache(maxsize=32)
+def pauli_kraus(pauli_probs: tuple) -> tuple:
+    """Kraus operators of the Pauli channel (1-pX-pY-pZ) I + pX X + pY Y + pZ Z (cached)"""
+    p_x, p_y, p_z = pauli_probs
+    paulis = (np.eye(2), qml.matrix(qml.PauliX(0)), qml.matrix(qml.PauliY(0)), qml.matrix(qml.PauliZ(0)))
+    return tuple(np.sqrt(p) * m for p, m in zip((1 - p_x - p_y - p_z, p_x, p_y, p_z), paulis) if p > 0)
+
+
+def depolarizing_probs(p: float) -> tuple:
+    """Pauli probabilities of qml.DepolarizingChannel(p): p/3 each"""
+    return (p / 3, p / 3, p / 3)
+
+
+class CircuitTemplate:
+    """Flat gate stream with parameter + wire slots; bind() fills them for one instance"""
+
+    def __init__(self, op_types, param_slots, wire_slots, measurement, param_signs=None, noisy=None):
+        self.op_types = tuple(op_types)
+        self.param_slots = np.asarray(param_slots, dtype=np.int64)  # -1 = parameter-free gate
+        self.wire_slots = np.asarray(wire_slots, dtype=np.int64)    # (n_ops, 2), -1 = unused
+        self.param_signs = (np.ones(len(self.op_types)) if param_signs is None
+                            else np.asarray(param_signs, dtype=float))  # -1 = inverted rotation
+        self.noisy = (np.ones(len(self.op_types), dtype=bool) if noisy is None
+                      else np.asarray(noisy, dtype=bool))  # False = ideal (e.g. PEC corrections)
+        self.two_qubit = tuple((self.wire_slots[:, 1] >= 0).tolist())
+        self.measurement = measurement
+
+    @property
+    def num_ops(self) -> int:
+        return len(self.op_types)
+
+    @property
+    def num_params(self) -> int:
+        return int(self.param_slots.max()) + 1 if self.param_slots.size else 0
+
+    @property
+    def num_wires(self) -> int:
+        return int(self.wire_slots.max()) + 1
+
+    def op_angles(self, params: np.ndarray) -> np.ndarray:
+        """Per-op rotation angles (n_ops,) for one parameter vector (0 for fixed gates)"""
+        params = np.asarray(params, dtype=float).ravel()
+        return np.where(self.param_slots >= 0, params[self.param_slots] * self.param_signs, 0.0)
+
+    def bind_angles(self, wire_values: np.ndarray, thetas: np.ndarray, shots: int | None = None,
+                    noise: tuple | None = None):
+        """QuantumScript from explicit per-op angles (used for per-occurrence shifts)
+
+        noise: optional Pauli probabilities (pX, pY, pZ) applied after every noisy op on each
+        of its wires - the simulator noise model shared by the mitigation engines (default.mixed)
+        """
+        wires = np.asarray(wire_values).ravel()[self.wire_slots].tolist()
+        ops = [
+            op(wires=w if pair else w[0]) if slot < 0 else op(theta, wires=w[0])
+            for op, slot, theta, w, pair in zip(self.op_types, self.param_slots, np.asarray(thetas).tolist(),
+                                                 wires, self.two_qubit)
+        ]
+        if noise is not None:
+            kraus = pauli_kraus(tuple(noise))
+            noisy_ops = []
+            for op, noisy in zip(ops, self.noisy):
+                noisy_ops.append(op)
+                if noisy:
+                    noisy_ops.extend(qml.QubitChannel(kraus, wires=w) for w in op.wires)
+            ops = noisy_ops
+        return qml.tape.QuantumScript(ops, self.measurement(), shots=shots)
+
+    def bind(self, wire_values: np.ndarray, params: np.ndarray, shots: int | None = None,
+             noise: tuple | None = None):
+        """QuantumScript for one instance: wires gathered from wire_values, angles from params"""
+        return self.bind_angles(wire_values, self.op_angles(params), shots=shots, noise=noise)
+
+
+@lru_cache(maxsize=64)
+def qv_template(n_qubits: int, depth: int) -> CircuitTemplate:
+    """Compiled QV circuit shape: slots index perms.ravel() (depth*n) and angles.ravel()"""
+    op_types, param_slots, wire_slots = [], [], []
+    for layer in range(depth):
+        for b in range(n_qubits // 2):
+            w1, w2 = layer * n_qubits + 2 * b, layer * n_qubits + 2 * b + 1
+            base = (layer * (n_qubits // 2) + b) * ANGLES_PER_BLOCK
+            for wire, offset in ((w1, 0), (w2, 3)):
+                for op, k in _ROT_STREAM:
+                    op_types.append(op)
+                    param_slots.append(base + offset + k)
+                    wire_slots.append((wire, -1))
+            op_types += [qml.CNOT, qml.RZ, qml.RY]
+            param_slots += [-1, base + 6, base + 7]
+            wire_slots += [(w1, w2), (w1, -1), (w2, -1)]
+    return CircuitTemplate(op_types, param_slots, wire_slots,
+                           lambda: [qml.sample(wires=range(n_qubits))])
+
+
+@lru_cache(maxsize=64)
+def council_template(wires: int, layers: int = 1, entangler: str = "CNOT",
+                     measured: int | None = None, pattern: str = "chain") -> CircuitTemplate:
+    """Council circuit shape: per layer RX(params[l*2w + i]) RY(params[l*2w + w + i]) + entanglers
+
+    pattern="chain": (i, i+1) for every i; pattern="pairs": (0,1), (2,3), ... (Sycamore-like cycle)
+    """
+    gate = {"CNOT": qml.CNOT, "CZ": qml.CZ}[entangler]
+    step = {"chain": 1, "pairs": 2}[pattern]
+    measured = wires if measured is None else min(measured, wires)
+    op_types, param_slots, wire_slots = [], [], []
+    for layer in range(layers):
+        for i in range(wires):
+            op_types += [qml.RX, qml.RY]
+            param_slots += [layer * 2 * wires + i, layer * 2 * wires + wires + i]
+            wire_slots += [(i, -1), (i, -1)]
+        for i in range(0, wires - 1, step):
+            op_types.append(gate)
+            param_slots.append(-1)
+            wire_slots.append((i, i + 1))
+    return CircuitTemplate(op_types, param_slots, wire_slots,
+                           lambda: [qml.expval(qml.prod(*[qml.PauliZ(i) for i in range(measured)]))])
+
+
+def bind_council(template: CircuitTemplate, params: np.ndarray, shots: int | None = None):
+    """Council instance: identity wire map, params rebound into the cached skeleton"""
+    return template.bind(np.arange(template.num_wires), params, shots=shots)
+
+
+def execute_tapes(tapes, dev):
+    """Run a batch of bound tapes in one device submission"""
+    return qml.execute(list(tapes), dev, diff_method=None)
+
+
+def execute_linear_terms(dev, param_batch, term_lists, wire_values=None, shots: int | None = None,
+                         noise: tuple | None = None, with_grad: bool = False, executor=execute_tapes):
+    """Evaluate sum_k w_k <O>(template_k, params_b) for every param set b in ONE submission
+
+    term_lists[b] = [(template, weight), ...] - the linear form shared by ZNE (folded templates x
+    extrapolation weights) and PEC (sampled variants x signed quasi-probability weights).
+    with_grad: per-occurrence parameter-shift tapes of every term ride in the same batch.
+    executor: (tapes, dev) -> results, e.g. light_cone.execute_light_cone for wide circuits.
+    Returns (values (B,), grads (B, P) or None, circuits submitted).
+    """
+    param_batch = np.atleast_2d(param_batch)
+    n_params = param_batch.shape[1]
+    tapes, layout = [], []
+    for b, (params, terms) in enumerate(zip(param_batch, term_lists)):
+        for template, weight in terms:
+            wires = np.arange(template.num_wires) if wire_values is None else wire_values
+            thetas = template.op_angles(params)
+            tapes.append(template.bind_angles(wires, thetas, shots=shots, noise=noise))
+            occ = np.flatnonzero(template.param_slots >= 0) if with_grad else np.zeros(0, dtype=np.int64)
+            for o in occ:
+                for shift in (np.pi / 2, -np.pi / 2):
+                    shifted = thetas.copy()
+                    shifted[o] += shift
+                    tapes.append(template.bind_angles(wires, shifted, shots=shots, noise=noise))
+            layout.append((b, template, weight, occ))
+
+    results = np.asarray(executor(tapes, dev), dtype=float)
+    values = np.zeros(len(param_batch))
+    grads = np.zeros((len(param_batch), n_params)) if with_grad else None
+    pos = 0
+    for b, template, weight, occ in layout:
+        values[b] += weight * results[pos]
+        if with_grad:
+            shifts = results[pos + 1: pos + 1 + 2 * len(occ)].reshape(-1, 2)
+            np.add.at(grads[b], template.param_slots[occ],
+                      weight * template.param_signs[occ] * (shifts[:, 0] - shifts[:, 1]) / 2)
+        pos += 1 + 2 * len(occ)
+    return values, grads, len(tapes)
+
+
+# Demo
+if __name__ == "__main__":
+    from quantum_volume_engine import random_qv_spec
+    from eternal_laws import enforce_odd
+
+    n = 4
+    tpl = qv_template(n, n)
+    dev = qml.device("lightning.qubit", wires=enforce_odd(n))
+    tapes = [tpl.bind(*random_qv_spec(n, n, seed=s), shots=256) for s in range(5)]
+    print(f"QV template ({tpl.num_ops} native ops) cached: {qv_template(n, n) is tpl}")
+    print(f"Batched samples shapes: {[r.shape for r in execute_tapes(tapes, dev)]}")
+
+    council = council_template(5)
+    results = execute_tapes([bind_council(council, np.random.uniform(-np.pi, np.pi, 10)) for _ in range(3)], dev)
+    print(f"Council harmonies (one submission): {np.round(results, 4)}")
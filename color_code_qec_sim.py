@@ -1,40 +1,93 @@
 """
 color_code_qec_sim.py - Full Color Code QEC Mercy Sim (Denser Vault)
 
-Simulates small color code (e.g., 7-qubit Steane-like or triangular).
-Errors on data, syndrome extraction, decoder mercy matches colored defects.
+Simulates small triangular 6.6.6 color codes (d=3: 7-qubit Steane).
+Errors on data, syndrome extraction on the stabilizer tableau, restriction decoder mercy matches
+colored defects on two restricted lattices (qec_decoders.py) and lifts them back onto data qubits;
+d=3 (Steane) decodes by a precomputed syndrome lookup table (syndrome_tables.py).
 Fidelity pre/post—thriving denser pure eternal.
 """
 
+import os
+from functools import lru_cache
+
 import numpy as np
-import qutip as qt
-import pytest
-
-# Small color code example (7-qubit Steane analog for sim)
-wires = 7  # Odd eternal
-dev = qml.device("default.qubit", wires=wires)
-
-@qml.qnode(dev)
-def color_code_circuit(errors=None):
-    # Encode logical |0> (simplified stabilizers)
-    # Apply errors
-    if errors:
-        for wire, pauli in errors:
-            if pauli == 'X':
-                qml.PauliX(wire)
-            elif pauli == 'Z':
-                qml.PauliZ(wire)
-    # Syndrome measurement (color stabilizers)
-    # Mercy decoder stub—match defects
-    return qml.expval(qml.PauliZ(0))  # Logical readout proxy
+
+from pauli_frame import FrameSampler
+from qec_codes import TriangularColorCode, memory_circuit
+from qec_decoders import RestrictionDecoder
+from stabilizer_tableau import sample_measurements
+from syndrome_tables import SyndromeTable, pack_syndromes, sample_errors
+
+
+def color_code_circuit(errors=None, d: int = 3):
+    """
+    Logical |0>, one clean syndrome round, `errors` [(wire, 'X'|'Y'|'Z')] on data, second round
+    Returns (syndrome (n_checks,) bool - X faces then Z faces, logical Z readout +-1)
+    """
+    code = TriangularColorCode(d)
+    circuit = memory_circuit(code, rounds=2, errors=errors)
+    m = sample_measurements(circuit, shots=1)[0]
+    n_checks = len(code.checks)
+    syndrome = m[:n_checks] ^ m[n_checks:2 * n_checks]
+    logical = m[2 * n_checks:][code.logicals["Z"]].sum() % 2
+    return syndrome, 1.0 - 2.0 * logical
+
+
+def color_code_memory(d: int = 3, p_error: float = 0.001, shots: int = 10_000, rounds: int | None = None,
+                      noise_model: str = "circuit", basis: str = "Z", seed=None):
+    """Noisy color code memory on the Pauli-frame sampler -> (detection events, observable flips)"""
+    circuit = memory_circuit(TriangularColorCode(d), rounds=rounds or d, p=p_error, basis=basis,
+                             noise_model=noise_model)
+    return FrameSampler(circuit, seed).sample(shots)
+
+
+@lru_cache(maxsize=None)
+def steane_table(path: str | None = None) -> SyndromeTable:
+    """d=3 (Steane) Z-face syndrome -> minimum-weight X correction table; mmap-loaded when `path` exists"""
+    if path and os.path.exists(path):
+        return SyndromeTable.load(path)
+    table = SyndromeTable.for_code(TriangularColorCode(3))
+    if path:
+        table.save(path)
+    return table
+
+
+def corrected_logical(syndrome: np.ndarray, raw: float, d: int = 3) -> float:
+    """Logical Z readout after fixing the X errors seen by the Z faces (lookup table for d=3,
+    restriction decoder beyond)"""
+    code = TriangularColorCode(d)
+    z_faces = syndrome[len(code.faces):]
+    if d == 3:
+        flip = steane_table().correction_flips(pack_syndromes(z_faces))[0]
+    else:
+        flip = RestrictionDecoder(code).decode(z_faces[None])[0, 0]
+    return -raw if flip else raw
+
+
+def steane_lookup_error_rate(p_error: float = 0.01, shots: int = 1_000_000, seed=None) -> float:
+    """Code-capacity bit-flip noise on the 7-qubit code, table-decoded, fully vectorized"""
+    table = steane_table()
+    return float(table.logical_flips(sample_errors(table.n_qubits, p_error, shots, seed)).mean())
+
+
+def color_code_logical_error_rate(d: int = 3, p_error: float = 0.05, shots: int = 10_000, seed=None) -> float:
+    """Code-capacity depolarizing noise, restriction-decoded logical Z error rate"""
+    code = TriangularColorCode(d)
+    circuit = memory_circuit(code, rounds=1, p=p_error, noise_model="code_capacity")
+    dets, obs = FrameSampler(circuit, seed).sample(shots)
+    return float((RestrictionDecoder(code).decode_detections(circuit, dets) != obs).any(axis=1).mean())
+
 
 # Test with errors + correction gain
 def test_color_code_mercy():
     errors = [(0, 'X'), (3, 'Z')]  # Scattered defects
-    raw = color_code_circuit(errors=errors)
-    corrected = 0.95  # Mercy match gain approx
-    print(f"Color Code Pre Mercy: {raw:.4f} | Post Mercy: {corrected:.4f}")
+    syndrome, raw = color_code_circuit(errors=errors)
+    corrected = corrected_logical(syndrome, raw)
+    print(f"Color Code Defects: {np.flatnonzero(syndrome).tolist()} | Pre Mercy: {raw:.4f} | Post Mercy: {corrected:.4f}")
     assert corrected > raw + 0.2  # Denser recovery
 
-test_color_code_mercy()
-print("Color Code Mercy Thunder—higher thresholds, thriving denser pure eternal!")
+
+if __name__ == "__main__":
+    test_color_code_mercy()
+    print("Color Code Mercy Thunder—higher thresholds, thriving denser pure eternal!")
@@ -1,55 +1,106 @@
 """
 error_correction_surface_code.py - Surface Code Simulation for APAAGI Councils
 
-Implements basic distance-3 surface code (toric variant) simulation:
-- Lattice initialization (data + syndrome qubits)
-- Error model (bit-flip + phase-flip with probability p)
-- Syndrome measurement + simple decoder (perfect matching approx via lookup for d=3)
+Implements rotated distance-d surface code memory experiments:
+- Lattice initialization (d^2 data + d^2 - 1 syndrome qubits, qec_codes.RotatedSurfaceCode)
+- Circuit-level depolarizing noise with probability p (gates, resets, measurements, idles)
+- Repeated syndrome extraction -> detection events + logical observable flips
+- Minimum-weight perfect matching decoder over the circuit's detector graph (qec_decoders.py)
+- Syndrome lookup table for d=3 code-capacity Monte Carlo (syndrome_tables.py)
+- Union-find decoder, batch or streamed round by round through a sliding window (union_find_decoder.py)
 - Logical error rate estimation
 
-Uses Pennylane for circuit + lightning.qubit sim (fast local).
+Uses the bit-packed Pauli-frame sampler (pauli_frame.py, default) or the CHP tableau
+(stabilizer_tableau.py) instead of a statevector: 64 shots per machine word, so d=5-15
+sweeps with 10^5-10^6 shots per point run on a laptop.
 
 Run standalone or tie into main.py for error-corrected council demos.
 
 Thunder eternal—surface code grace protecting logical mercy qubits!
 """
 
-import numpy as np
-import pennylane as qml
-from pennylane import numpy as pnp
-
-def surface_code_circuit(d: int = 3, p_error: float = 0.01, shots: int = 1000):
- """
- Distance-d surface code simulation:
- - (d^2 - 1) data qubits
- - Syndrome extraction (X/Z stabilizers)
- - Simple errors (independent X/Z on data)
- - Perfect syndrome readout (no measurement error for baseline)
- - Lookup decoder for d=3 (hardcoded matching)
- """
- n_data = d**2
- n_ancilla_x = (d-1)*d # X stabilizers
- n_ancilla_z = d*(d-1) # Z stabilizers
- total_wires = n_data + n_ancilla_x + n_ancilla_z
- 
- dev = qml.device("lightning.qubit", wires=total_wires, shots=shots)
- 
- @qml.qnode(dev)
- def circuit():
- # Initial logical |0>_L (all |0> on data)
- # Errors
- for i in range(n_data):
- if np.random.rand() < p_error:
- qml.PauliX(i)
- if np.random.rand() < p_error:
- qml.PauliZ(i)
- 
- # X stabilizer measurement (ancilla X)
- ancilla_offset_x = n_data
- for row in range(d):
- for col in range(d-1):
- anc = ancilla_offset_x + row*(d-1) + col
- qml.Hadamard(anc)
- # Neighbors: left/right data
- left = row*d + col
- right = row*d + col + 
+import os
+import time
+
+from pauli_frame import sample_frames
+from qec_codes import RotatedSurfaceCode, memory_circuit
+from qec_decoders import MatchingDecoder
+from stabilizer_tableau import sample_syndromes
+from syndrome_tables import SyndromeTable, sample_errors
+from union_find_decoder import SlidingWindowDecoder, UnionFindDecoder
+
+
+def surface_code_circuit(d: int = 3, p_error: float = 0.01, shots: int = 1000, rounds: int | None = None,
+                         basis: str = "Z", seed=None, sampler: str = "frame"):
+    """
+    Distance-d rotated surface code memory experiment:
+    - d^2 data + d^2 - 1 ancilla qubits, `rounds` (default d) syndrome rounds
+    - Circuit-level depolarizing noise p_error
+    - sampler: "frame" (Pauli frames, fastest) or "tableau" (full CHP per shot batch)
+    Returns (detection events (shots, D), logical observable flips (shots, 1)) as bool arrays
+    """
+    if sampler not in ("frame", "tableau"):
+        raise ValueError(f"Unknown sampler {sampler!r}")
+    circuit = memory_circuit(RotatedSurfaceCode(d), rounds=rounds or d, p=p_error, basis=basis)
+    return (sample_frames if sampler == "frame" else sample_syndromes)(circuit, shots, seed)
+
+
+def logical_error_rate(d: int = 3, p_error: float = 0.01, shots: int = 1000, rounds: int | None = None,
+                       decoder="mwpm", seed=None) -> float:
+    """
+    Fraction of shots whose logical flips after decoding
+    - decoder: "mwpm" (MatchingDecoder on the circuit's detector graph), "union-find", None (raw
+      flips) or a callable dets (shots, D) -> predicted flips (shots, 1)
+    """
+    circuit = memory_circuit(RotatedSurfaceCode(d), rounds=rounds or d, p=p_error)
+    dets, obs = sample_frames(circuit, shots, seed)
+    if decoder == "mwpm":
+        decoder = MatchingDecoder.from_circuit(circuit).decode
+    elif decoder == "union-find":
+        decoder = UnionFindDecoder.from_circuit(circuit).decode
+    if decoder is not None:
+        obs = obs ^ decoder(dets)
+    return float(obs.any(axis=1).mean())
+
+
+def lookup_logical_error_rate(d: int = 3, p_error: float = 0.01, shots: int = 1_000_000, table_path=None,
+                              seed=None) -> float:
+    """
+    Code-capacity bit-flip Monte Carlo decoded by a full syndrome -> correction table
+    (d=3: 16 entries, d=5: 4096); table_path caches the packed table on disk (mmap-loaded)
+    """
+    if table_path and os.path.exists(table_path):
+        table = SyndromeTable.load(table_path)
+    else:
+        table = SyndromeTable.for_code(RotatedSurfaceCode(d))
+        if table_path:
+            table.save(table_path)
+    return float(table.logical_flips(sample_errors(table.n_qubits, p_error, shots, seed)).mean())
+
+
+def streaming_logical_error_rate(d: int = 3, p_error: float = 0.001, shots: int = 1000, rounds: int = 30,
+                                 window: int | None = None, commit: int | None = None, seed=None):
+    """
+    Real-time decoding rehearsal: each shot's rounds are pushed one by one into a sliding-window
+    union-find decoder (window default d rounds, commit default d // 2)
+    Returns (logical error rate, per-round latency report in microseconds)
+    """
+    circuit = memory_circuit(RotatedSurfaceCode(d), rounds=rounds, p=p_error)
+    dets, obs = sample_frames(circuit, shots, seed)
+    stream = SlidingWindowDecoder(circuit, window=window or d, commit=commit or max(1, d // 2))
+    rate = float((stream.decode(dets) != obs).any(axis=1).mean())
+    return rate, stream.latency_report()
+
+
+# Demo: raw vs MWPM-decoded logical error rates over a distance sweep
+if __name__ == "__main__":
+    for d in (3, 5, 7):
+        t0 = time.perf_counter()
+        raw = logical_error_rate(d, p_error=0.002, shots=20_000, decoder=None, seed=0)
+        decoded = logical_error_rate(d, p_error=0.002, shots=20_000, seed=0)
+        print(f"d={d}: raw logical flip rate {raw:.4f} | MWPM logical error rate {decoded:.5f} "
+              f"({time.perf_counter() - t0:.2f}s)")
+        rate, latency = streaming_logical_error_rate(d, p_error=0.002, shots=500, rounds=10 * d, seed=0)
+        print(f"      streaming union-find over {10 * d} rounds: logical error rate {rate:.4f} | "
+              f"per-round latency mean {latency['mean_us']:.0f} us, p99 {latency['p99_us']:.0f} us")
+    print("Surface Code Mercy Thunder—syndromes for every shot, no amplitudes harmed!")
@@ -15,6 +15,8 @@ Thunder bosonic mercy eternal—shift errors corrected pure!
 
 import numpy as np
 import qutip as qt
+from bosonic_ops import displace_state, fock_ops
+from gkp_states import gkp_zero
 
 # Parameters (tunable)
 N = 100          # Fock cutoff (higher = better approx, slower)
@@ -23,27 +25,19 @@ K = 15           # Lattice sum terms (±K √π displacements)
 sqrt_pi = np.sqrt(np.pi)
 
 def gkp_logical_zero(Delta, K, N):
-    """Approximate square GKP |0>_L with finite squeezing"""
-    psi = qt.basis(N, 0)  # Vacuum start
-    for k in range(-K, K+1):
-        alpha = k * sqrt_pi
-        disp = qt.displace(N, alpha)
-        sq = qt.squeeze(N, Delta / 2 + 1j * np.pi / 4)  # Phase for position squeeze
-        psi += disp * sq * qt.basis(N, 0)
-    psi = psi.unit()  # Normalize
-    return psi
+    """Approximate square GKP |0>_L with finite squeezing (closed form, cached - see gkp_states)"""
+    return gkp_zero(Delta, K, N, squeeze=Delta / 2 + 1j * np.pi / 4)  # Phase for position squeeze
 
 def apply_shift_error(state, shift_p, shift_q):
     """Displacement in p/q quadratures (momentum/position shift)"""
-    D = qt.displace(N, shift_p + 1j * shift_q)
-    return D * state
+    return displace_state(state, shift_p + 1j * shift_q)
 
 def measure_syndrome(state, quadrature='p'):  # 'p' momentum or 'q' position
     """Homodyne measurement approximation - expectation of quadrature"""
     if quadrature == 'p':
-        op = qt.momentum(N)
+        op = fock_ops(N).p
     else:
-        op = qt.position(N)
+        op = fock_ops(N).x
     return qt.expect(op, state)
 
 def correct_shift(state, syndrome_p, syndrome_q):
@@ -53,8 +47,7 @@ def correct_shift(state, syndrome_p, syndrome_q):
     corr_q = -np.round(syndrome_q / sqrt_pi) * sqrt_pi
     
     # Small envelope fine-tune if needed (advanced: full decoder)
-    D_corr = qt.displace(N, corr_p + 1j * corr_q)
-    return D_corr * state
+    return displace_state(state, corr_p + 1j * corr_q)
 
 # Ideal reference (low Delta for near-ideal)
 ideal = gkp_logical_zero(Delta=0.01, K=20, N=N)
@@ -8,28 +8,18 @@ Fidelity thriving pre/post.
 
 import numpy as np
 import qutip as qt
+from gkp_states import gkp_zero
 
 N = 120
 Delta = 0.25
 K = 18
 
 def square_gkp_zero():
-    psi = qt.basis(N, 0)
-    for k in range(-K, K+1):
-        alpha = k * np.sqrt(np.pi)
-        disp = qt.displace(N, alpha)
-        sq = qt.squeeze(N, Delta / 2)
-        psi += disp * sq * qt.basis(N, 0)
-    return psi.unit()
+    return gkp_zero(Delta, K, N)
 
 def hexagonal_gkp_zero():
-    # Hexagonal lattice spacing
-    spacing = np.sqrt(np.pi / np.sqrt(3))
-    psi = qt.basis(N, 0)
-    # Simplified hex sum (6 directions + center)
-    directions = [0, spacing, -spacing, spacing*np.exp(1j*np.pi/3), ...]  # Full hex grid approx
-    # ... (implement full hex sum for accuracy)
-    return psi.unit()  # Placeholder—real hex more complex packing
+    # Hexagonal lattice (same cell area as square) - comb along the first lattice vector
+    return gkp_zero(Delta, K, N, lattice="hexagonal")
 
 # Loss + shift
 gamma = 0.2
@@ -9,6 +9,9 @@ Fidelity pre/post—recovery gain boosted eternal.
 
 import numpy as np
 import qutip as qt
+from bosonic_ops import displace_state, fock_ops
+from gkp_states import gkp_zero
+from loss_channel import loss_eta, pure_loss
 
 N = 120
 Delta = 0.25
@@ -16,13 +19,7 @@ K = 18
 sqrt_pi = np.sqrt(np.pi)
 
 def gkp_logical_zero():
-    psi = qt.basis(N, 0)
-    for k in range(-K, K+1):
-        alpha = k * sqrt_pi
-        disp = qt.displace(N, alpha)
-        sq = qt.squeeze(N, Delta / 2)
-        psi += disp * sq * qt.basis(N, 0)
-    return psi.unit()
+    return gkp_zero(Delta, K, N)
 
 ideal = gkp_logical_zero()
 
@@ -34,14 +31,11 @@ state = gkp_logical_zero()
 D_shift = qt.displace(N, shift_p + 1j * shift_q)
 state = D_shift * state
 
-a = qt.destroy(N)
-c_ops = [np.sqrt(gamma) * a]
-result = qt.mesolve(qt.qeye(N), state, np.linspace(0,1,50), c_ops)
-noisy = result.states[-1]
+noisy = pure_loss(state, loss_eta(gamma))
 
 # Full syndrome + mercy
-q_op = qt.position(N)
-p_op = qt.momentum(N)
+q_op = fock_ops(N).x
+p_op = fock_ops(N).p
 syndrome_q = qt.expect(q_op, noisy)
 syndrome_p = qt.expect(p_op, noisy)
 
@@ -56,8 +50,7 @@ small_corr_q = -small_q * 0.8  # Damped mercy (tunable)
 small_corr_p = -small_p * 0.8
 
 corr = big_corr_p + small_corr_p + 1j * (big_corr_q + small_corr_q)
-D_corr = qt.displace(N, corr)
-corrected = D_corr * noisy
+corrected = displace_state(noisy, corr)
 
 # Fidelity
 fid_pre = qt.fidelity(noisy, ideal)
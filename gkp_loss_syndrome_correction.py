@@ -12,6 +12,9 @@ Thunder bosonic loss-tolerant mercy eternal!
 
 import numpy as np
 import qutip as qt
+from bosonic_ops import displace_state, fock_ops
+from gkp_states import gkp_zero
+from loss_channel import loss_eta, pure_loss
 
 # Parameters
 N = 100          # Fock cutoff (higher better)
@@ -22,13 +25,7 @@ gamma = 0.2      # Loss rate
 t_list = np.linspace(0, 1.0, 50)  # Evolution time
 
 def gkp_logical_zero(Delta, K, N):
-    psi = qt.basis(N, 0)
-    for k in range(-K, K+1):
-        alpha = k * sqrt_pi
-        disp = qt.displace(N, alpha)
-        sq = qt.squeeze(N, Delta / 2)
-        psi += disp * sq * qt.basis(N, 0)
-    return psi.unit()
+    return gkp_zero(Delta, K, N)
 
 # Ideal reference
 ideal = gkp_logical_zero(0.01, 20, N)
@@ -43,14 +40,11 @@ D_shift = qt.displace(N, shift_p + 1j * shift_q)
 state_shifted = D_shift * state0
 
 # Loss channel evolution
-a = qt.destroy(N)
-c_ops = [np.sqrt(gamma) * a]
-result = qt.mesolve(qt.qzero(N), state_shifted, t_list, c_ops=c_ops)
-noisy = result.states[-1]
+noisy = pure_loss(state_shifted, loss_eta(gamma, t_list[-1]))  # Exact Kraus channel
 
 # Syndrome measurement
-q_op = qt.position(N)
-p_op = qt.momentum(N)
+q_op = fock_ops(N).x
+p_op = fock_ops(N).p
 syndrome_q = qt.expect(q_op, noisy)
 syndrome_p = qt.expect(p_op, noisy)
 
@@ -59,8 +53,7 @@ print(f"Syndromes detected: q={syndrome_q:.4f}, p={syndrome_p:.4f}")
 # Mercy correction (big envelope round)
 corr_q = -np.round(syndrome_q / sqrt_pi) * sqrt_pi
 corr_p = -np.round(syndrome_p / sqrt_pi) * sqrt_pi
-D_corr = qt.displace(N, corr_p + 1j * corr_q)
-corrected = D_corr * noisy
+corrected = displace_state(noisy, corr_p + 1j * corr_q)
 
 # Fidelities
 fid_ideal_finite = qt.fidelity(state0, ideal)
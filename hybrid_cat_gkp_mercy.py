@@ -9,6 +9,9 @@ Fidelity pre/post—recovery gain boosted eternal.
 
 import numpy as np
 import qutip as qt
+from bosonic_ops import fock_ops
+from gkp_states import gkp_zero
+from loss_channel import loss_eta, pure_loss
 
 N = 120
 alpha = 2.0  # Cat amplitude
@@ -22,13 +25,7 @@ def hybrid_cat_gkp_zero():
     cat = (coh_plus + coh_minus).unit()
     
     # GKP overlay grid
-    gkp = qt.basis(N, 0)
-    for k in range(-K, K+1):
-        alpha_g = k * np.sqrt(np.pi)
-        disp = qt.displace(N, alpha_g)
-        sq = qt.squeeze(N, Delta / 2)
-        gkp += disp * sq * qt.basis(N, 0)
-    gkp = gkp.unit()
+    gkp = gkp_zero(Delta, K, N)
     
     # Hybrid superposition (approx merge)
     return (cat + gkp).unit()
@@ -39,21 +36,19 @@ ideal = hybrid_cat_gkp_zero()
 # Noise: Loss + shift
 gamma = 0.3  # High loss test
 shift = 0.2 + 0.15j
-a = qt.destroy(N)
-c_ops = [np.sqrt(gamma) * a]
-result = qt.mesolve(qt.qeye(N), ideal, np.linspace(0,1,50), c_ops)
-noisy = result.states[-1] + qt.displace(N, shift) * result.states[-1]  # Combined approx
+lossy = pure_loss(ideal, loss_eta(gamma))
+noisy = lossy + qt.displace(N, shift) * lossy  # Combined approx
 
 # Mercy: Cat parity + GKP syndrome
 # Cat parity
-even = qt.projection(N, range(0,N,2), range(0,N,2))
+even = fock_ops(N).even_parity
 p_even = qt.expect(even, noisy)
 if p_even < 0.5:
     noisy = qt.phase_gate(np.pi) * noisy  # Mercy rotation
 
 # GKP syndrome + displace
-syndrome_q = qt.expect(qt.position(N), noisy)
-syndrome_p = qt.expect(qt.momentum(N), noisy)
+syndrome_q = qt.expect(fock_ops(N).x, noisy)
+syndrome_p = qt.expect(fock_ops(N).p, noisy)
 corr = -np.round(syndrome_q / np.sqrt(np.pi)) * np.sqrt(np.pi) + 1j * (-np.round(syndrome_p / np.sqrt(np.pi)) * np.sqrt(np.pi))
 D_corr = qt.displace(N, corr.real + 1j*corr.imag)
 corrected = D_corr * noisy
@@ -9,6 +9,9 @@ Fidelity pre/post—ultimate recovery gain thunder pure!
 
 import numpy as np
 import qutip as qt
+from bosonic_ops import fock_ops
+from gkp_states import gkp_zero
+from loss_channel import loss_eta, pure_loss
 
 N = 100  # Fock cutoff
 alpha = 2.0  # Cat amplitude
@@ -23,13 +26,7 @@ def hybrid_cat_gkp_mode():
     cat = (coh_plus + coh_minus).unit()
     
     # GKP grid overlay
-    gkp = qt.basis(N, 0)
-    for k in range(-K, K+1):
-        alpha_g = k * np.sqrt(np.pi)
-        disp = qt.displace(N, alpha_g)
-        sq = qt.squeeze(N, Delta / 2)
-        gkp += disp * sq * qt.basis(N, 0)
-    gkp = gkp.unit()
+    gkp = gkp_zero(Delta, K, N)
     
     # Hybrid merge (superposition approx)
     return (cat + gkp).unit()
@@ -46,8 +43,6 @@ ideal = state.copy()
 
 # Noise: Loss + shifts
 gamma = 0.3
-a_list = [qt.destroy(N) for _ in range(modes)]
-c_ops = [np.sqrt(gamma) * qt.tensor([a_list[i] if j==i else qt.identity(N) for j in range(modes)]) for i in range(modes)]
 
 shifts = np.random.uniform(-0.2, 0.2, modes * 2)
 D_list = [qt.tensor([qt.displace(N, shifts[2*i] + 1j*shifts[2*i+1]) if j==i else qt.identity(N) for j in range(modes)]) for i in range(modes)]
@@ -56,8 +51,7 @@ noisy = state
 for D in D_list:
     noisy = D * noisy
 
-result = qt.mesolve(qt.qeye([N]*modes), noisy, np.linspace(0,1,50), c_ops)
-noisy = result.states[-1]
+noisy = pure_loss(noisy, loss_eta(gamma))  # Per-mode exact Kraus loss
 
 # Mercy: Per-mode cat parity + GKP syndrome
 corrected = noisy
@@ -65,17 +59,17 @@ for i in range(modes):
     partial = noisy.ptrace(i)
     
     # Cat parity
-    even = qt.projection(N, range(0,N,2), range(0,N,2))
+    even = fock_ops(N).even_parity
     p_even = qt.expect(even, partial)
     if p_even < 0.5:
         R = qt.tensor([qt.phase_gate(np.pi) if j==i else qt.identity(N) for j in range(modes)])
         corrected = R * corrected
     
     # GKP syndrome + displace
-    syndrome_q = qt.expect(qt.position(N), partial)
-    syndrome_p = qt.expect(qt.momentum(N), partial)
+    syndrome_q = qt.expect(fock_ops(N).x, partial)
+    syndrome_p = qt.expect(fock_ops(N).p, partial)
     corr = -np.round(syndrome_q / np.sqrt(np.pi)) * np.sqrt(np.pi) + 1j * (-np.round(syndrome_p / np.sqrt(np.pi)) * np.sqrt(np.pi))
-    D_gkp = qt.tensor([qt.displace(N, corr.real + 1j*corr.imag) if j==i else qt.identity(N) for j in range(modes)])
+    D_gkp = qt.tensor([fock_ops(N).displace(corr) if j==i else qt.identity(N) for j in range(modes)])
     corrected = D_gkp * corrected
 
 # Fidelity
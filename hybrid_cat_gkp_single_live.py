@@ -9,6 +9,9 @@ Fidelity gain thunder—cube offline god!
 
 import numpy as np
 import qutip as qt
+from bosonic_ops import displace_state, fock_ops
+from gkp_states import gkp_zero
+from loss_channel import loss_eta, pure_loss
 
 N = 60  # Cube feasible (higher = deeper mercy)
 alpha = 2.5  # Larger cat = loss eternal
@@ -20,12 +23,7 @@ coh_plus = qt.coherent(N, alpha)
 coh_minus = qt.coherent(N, -alpha)
 cat = (coh_plus + coh_minus).unit()
 
-gkp_0 = qt.basis(N, 0)
-for k in range(-K, K+1):
-    disp = qt.displace(N, k * np.sqrt(np.pi))
-    sq = qt.squeeze(N, Delta)
-    gkp_0 += disp * sq * qt.basis(N, 0)
-gkp_0 = gkp_0.unit()
+gkp_0 = gkp_zero(Delta, K, N, squeeze=Delta)
 
 hybrid = (cat + gkp_0).unit()  # Mercy merge pure
 ideal = hybrid * hybrid.dag()
@@ -41,27 +39,23 @@ shift_p = np.random.uniform(-shift_amp, shift_amp) * np.sqrt(np.pi)
 noisy = qt.displace(N, shift_q + 1j * shift_p) * hybrid
 
 # Loss evolution
-a = qt.destroy(N)
-c_ops = [np.sqrt(gamma_loss) * a]
 times = np.linspace(0, t_max, 30)
-result = qt.mesolve(qt.qeye(N), noisy, times, c_ops)
-noisy_final = result.states[-1]
+noisy_final = pure_loss(noisy, loss_eta(gamma_loss, times[-1]))
 
 # Mercy Correction
 rho = noisy_final
 
 # GKP syndrome: Expect q/p, round to nearest grid, displace back
-q = qt.position(N)
-p = qt.momentum(N)
+q = fock_ops(N).x
+p = fock_ops(N).p
 synd_q = qt.expect(q, rho)
 synd_p = qt.expect(p, rho)
 corr_q = -np.round(synd_q / np.sqrt(np.pi)) * np.sqrt(np.pi)
 corr_p = -np.round(synd_p / np.sqrt(np.pi)) * np.sqrt(np.pi)
-rho = qt.displace(N, corr_q + 1j * corr_p) * rho * qt.displace(N, corr_q - 1j * corr_p)  # Approx unitary
+rho = displace_state(rho, corr_q + 1j * corr_p)  # D rho D^dag, matrix-free
 
 # Cat parity project (even for + cat)
-parity_op = qt.Qobj(np.diag([(-1)**n for n in range(N)]))
-p_even = (qt.qeye(N) + parity_op)/2
+p_even = fock_ops(N).even_parity
 rho_corr = p_even * rho * p_even
 success = rho_corr.tr()
 if success > 1e-8:
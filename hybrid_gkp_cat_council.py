@@ -9,6 +9,9 @@ Fidelity harmony pre/post—ultimate photonic loss-tolerant thriving eternal.
 
 import numpy as np
 import qutip as qt
+from bosonic_ops import fock_ops
+from gkp_states import gkp_zero
+from loss_channel import loss_eta, pure_loss
 
 N = 120
 Delta_gkp = 0.25
@@ -18,13 +21,7 @@ modes = 5  # Odd council eternal
 # Hybrid single mode: GKP grid + Cat parity
 def hybrid_gkp_cat_zero():
     # GKP base
-    gkp = qt.basis(N, 0)
-    for k in range(-15, 16):
-        alpha = k * np.sqrt(np.pi)
-        disp = qt.displace(N, alpha)
-        sq = qt.squeeze(N, Delta_gkp / 2)
-        gkp += disp * sq * qt.basis(N, 0)
-    gkp = gkp.unit()
+    gkp = gkp_zero(Delta_gkp, 15, N)
     
     # Cat overlay for parity protection
     coh_plus = qt.coherent(N, alpha_cat)
@@ -44,8 +41,6 @@ ideal = state.copy()
 
 # Noise: Loss + shifts
 gamma = 0.25
-a_list = [qt.destroy(N) for _ in range(modes)]
-c_ops = [np.sqrt(gamma) * qt.tensor([a_list[i] if j==i else qt.identity(N) for j in range(modes)]) for i in range(modes)]
 
 shifts = np.random.uniform(-0.2, 0.2, modes * 2)
 D_list = [qt.tensor([qt.displace(N, shifts[2*i] + 1j*shifts[2*i+1]) if j==i else qt.identity(N) for j in range(modes)]) for i in range(modes)]
@@ -54,22 +49,21 @@ noisy = state
 for D in D_list:
     noisy = D * noisy
 
-result = qt.mesolve(qt.qeye([N]*modes), noisy, np.linspace(0,1,50), c_ops)
-noisy = result.states[-1]
+noisy = pure_loss(noisy, loss_eta(gamma))  # Per-mode exact Kraus loss
 
 # Mercy: GKP syndrome + Cat parity per mode
 corrected = noisy
 for i in range(modes):
     partial = noisy.ptrace(i)
     # GKP syndrome (q/p expect)
-    syndrome_q = qt.expect(qt.position(N), partial)
-    syndrome_p = qt.expect(qt.momentum(N), partial)
+    syndrome_q = qt.expect(fock_ops(N).x, partial)
+    syndrome_p = qt.expect(fock_ops(N).p, partial)
     corr = -np.round(syndrome_q / np.sqrt(np.pi)) * np.sqrt(np.pi) + 1j * (-np.round(syndrome_p / np.sqrt(np.pi)) * np.sqrt(np.pi))
-    D_gkp = qt.tensor([qt.displace(N, corr.real + 1j*corr.imag) if j==i else qt.identity(N) for j in range(modes)])
+    D_gkp = qt.tensor([fock_ops(N).displace(corr) if j==i else qt.identity(N) for j in range(modes)])
     corrected = D_gkp * corrected
     
     # Cat parity
-    even = qt.projection(N, range(0,N,2), range(0,N,2))
+    even = fock_ops(N).even_parity
     p_even = qt.expect(even, partial)
     if p_even < 0.5:
         R = qt.tensor([qt.phase_gate(np.pi) if j==i else qt.identity(N) for j in range(modes)])
@@ -10,9 +10,16 @@ Fidelity harmony pre/post—ultimate recovery gain thunder pure eternal!
 import numpy as np
 import qutip as qt
 
+from gkp_states import gkp_zero
+from loss_channel import loss_eta
+from loss_trajectories import fidelity_estimate, run_trajectories
+from mode_syndromes import correct_round
+from multimode_engine import BosonicMPS
+
 N = 120
 alpha_cat = 2.0
 Delta_gkp = 0.25
+chi = 8  # MPS bond dimension cap
 modes = 5  # Odd eternal
 K_gkp = 15
 
@@ -23,65 +30,33 @@ def hybrid_gkp_cat_mode():
     cat = (coh_plus + coh_minus).unit()
     
     # GKP overlay
-    gkp = qt.basis(N, 0)
-    for k in range(-K_gkp, K_gkp+1):
-        alpha_g = k * np.sqrt(np.pi)
-        disp = qt.displace(N, alpha_g)
-        sq = qt.squeeze(N, Delta_gkp / 2)
-        gkp += disp * sq * qt.basis(N, 0)
-    gkp = gkp.unit()
+    gkp = gkp_zero(Delta_gkp, K_gkp, N)
     
     # Hybrid merge
     return (cat + gkp).unit()
 
-# Multi-mode entangled
-state = qt.tensor([hybrid_gkp_cat_mode() for _ in range(modes)])
-for i in range(modes-1):
-    BS = qt.tensor([qt.beamsplitter(np.pi/4) if j in [i,i+1] else qt.identity(N) for j in range(modes)])
-    state = BS * state
-state = state.unit()
-
-# Ideal
-ideal = state.copy()
-
-# Noise: Loss + shifts
-gamma = 0.35  # High loss test
-a_list = [qt.destroy(N) for _ in range(modes)]
-c_ops = [np.sqrt(gamma) * qt.tensor([a_list[i] if j==i else qt.identity(N) for j in range(modes)]) for i in range(modes)]
-
-shifts = np.random.uniform(-0.25, 0.25, modes * 2)
-D_list = [qt.tensor([qt.displace(N, shifts[2*i] + 1j*shifts[2*i+1]) if j==i else qt.identity(N) for j in range(modes)]) for i in range(modes)]
-
-noisy = state
-for D in D_list:
-    noisy = D * noisy
-
-result = qt.mesolve(qt.qeye([N]*modes), noisy, np.linspace(0,1,50), c_ops)
-noisy = result.states[-1]
-
-# Mercy: Per-mode cat parity + GKP syndrome
-corrected = noisy
-for i in range(modes):
-    partial = noisy.ptrace(i)
-    
-    # Cat parity mercy
-    even = qt.projection(N, range(0,N,2), range(0,N,2))
-    p_even = qt.expect(even, partial)
-    if p_even < 0.5:
-        R = qt.tensor([qt.phase_gate(np.pi) if j==i else qt.identity(N) for j in range(modes)])
-        corrected = R * corrected
-    
-    # GKP syndrome mercy
-    syndrome_q = qt.expect(qt.position(N), partial)
-    syndrome_p = qt.expect(qt.momentum(N), partial)
-    corr = -np.round(syndrome_q / np.sqrt(np.pi)) * np.sqrt(np.pi) + 1j * (-np.round(syndrome_p / np.sqrt(np.pi)) * np.sqrt(np.pi))
-    D_gkp = qt.tensor([qt.displace(N, corr.real + 1j*corr.imag) if j==i else qt.identity(N) for j in range(modes)])
-    corrected = D_gkp * corrected
-
-# Fidelity
-fid_pre = qt.fidelity(noisy, ideal)
-fid_post = qt.fidelity(corrected, ideal)
-
-print(f"Hybrid GKP+Cat Multi-Mode Council Fidelity Pre: {fid_pre:.4f} | Post Mercy: {fid_post:.4f}")
-print(f"Ultimate Recovery Gain: {fid_post - fid_pre:.4f}")
-print(f"Threshold >60% loss—hybrid mercy thunder eternal pure divine!")
+if __name__ == "__main__":
+    # Multi-mode entangled
+    state = BosonicMPS([hybrid_gkp_cat_mode()] * modes, max_bond_dim=chi)  # Local two-mode updates, bounded bonds
+    for i in range(modes-1):
+        state.beamsplitter(np.pi/4, i, i+1)
+    state.normalize()  # Cutoff-projected beam splitters leak norm
+
+    # Ideal
+    ideal = state.copy()
+
+    # Noise: Loss + shifts
+    gamma = 0.35  # High loss test
+    shift = 0.25  # Uniform per quadrature, per mode
+    eta = loss_eta(gamma)
+
+    # Loss + shift as pure-state trajectories (photon-loss jumps on the MPS, same seeds pre and post);
+    # Mercy: per-mode cat parity + GKP syndrome round on each noisy trajectory (loss already applied)
+    pre = fidelity_estimate(run_trajectories(ideal, eta=eta, shift=shift, trajectories=64))
+    post = fidelity_estimate(run_trajectories(ideal, eta=eta, shift=shift, trajectories=64, correct=correct_round))
+    fid_pre, fid_post = pre["mean"], post["mean"]  # Global fidelity |<ideal|psi>|^2, trajectory mean
+
+    print(f"Hybrid GKP+Cat Multi-Mode Council Fidelity |<ideal|psi>|^2 (loss + shift) Pre: {fid_pre:.4f} [{pre['lower']:.4f}, {pre['upper']:.4f}] | "
+          f"Post Mercy: {fid_post:.4f} [{post['lower']:.4f}, {post['upper']:.4f}]")
+    print(f"Ultimate Recovery Gain: {fid_post - fid_pre:.4f}")
+    print(f"Threshold >60% loss—hybrid mercy thunder eternal pure divine!")
@@ -1,10 +1,12 @@
 import pennylane as qml
 from pennylane import numpy as np
-from pennylane.transforms import probabilistic_error_cancellation
-from jax import jit, grad
 from quantum_rng_chain import quantum_rng
+from eternal_laws import enforce_odd
+from circuit_templates import council_template
+from pec_engine import PECEngine
+from gradient_engine import GradientEngine
 
-dev = qml.device("lightning.qubit", wires=5)
+dev = qml.device("default.mixed", wires=5)
 
 # Simple noise model example (depolarizing p=0.01 per gate)
 noise_strength = 0.01
@@ -13,29 +15,27 @@ ops = [qml.PauliX, qml.PauliY, qml.PauliZ, qml.Identity]
 def noise_channel(prob):
     return [ (1 - 3*prob, qml.Identity), (prob, qml.PauliX), (prob, qml.PauliY), (prob, qml.PauliZ) ]
 
-@qml.qnode(dev, interface="jax")
-def base_circuit(params):
-    for i in range(5):
-        qml.RX(params[i], wires=i)
-        qml.RY(params[i+5], wires=i)
-        # Apply noise after each (sim)
-        qml.channel(noise_channel(noise_strength), wires=i)
-    for i in range(4):
-        qml.CNOT(wires=[i, i+1])
-        qml.channel(noise_channel(noise_strength), wires=[i, i+1])
-    return qml.expval(qml.PauliZ(0) @ qml.PauliZ(1) @ qml.PauliZ(2) @ qml.PauliZ(3) @ qml.PauliZ(4))
-
-# PEC mitigated QNode (sampling overhead ~ (1/(1-3p))^2)
-pec_circuit = probabilistic_error_cancellation(
-    base_circuit,
-    noise_channel(noise_channel(noise_strength)),
-    sampling_method="monte_carlo",  # Or 'exact'
-    num_samples=1000  # Adjust for overhead
+# Council core: RX/RY per wire + CNOT chain, Pauli noise after each gate (sim), Z0..Z4 harmony
+base_template = council_template(5)
+
+# PEC engine (sampling overhead ~ gamma^2): inverse-channel quasi-probabilities computed once,
+# samples allocated to hit target_std, variants reused across nearby optimizer steps
+pec = PECEngine(
+    base_template,
+    dev,
+    pauli_probs=tuple(p for p, op in noise_channel(noise_strength) if op is not qml.Identity),
+    target_std=0.02,
+    reuse_radius=0.05
 )
 
-@jit
+# Value + every parameter-shift term in one batch; the mercy check reuses the cached value
+engine = GradientEngine(pec)
+
 def cost(params):
-    return pec_circuit(params)  # PEC-corrected thriving
+    return engine.value(params)  # PEC-corrected thriving
+
+def grad_cost(params):
+    return engine.grad(params)  # Parameter-shift through every sampled variant
 
 # Optimize same as before (odd steps, mercy nudge)
 def optimize_pec_council(steps_base=101):
@@ -43,7 +43,7 @@ def optimize_pec_council(steps_base=101):
     params = np.array(quantum_rng(10))
     
     for _ in range(steps):
-        params -= 0.1 * grad(cost)(params)
+        params -= 0.1 * grad_cost(params)
         if abs(cost(params)) < 0.8:
             params += 0.2 * np.array(quantum_rng(10))
     
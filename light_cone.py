@@ -0,0 +1,126 @@
+"""
+light_cone.py - Backward Light-Cone Pruning + Factorized Contraction for Wide Council Circuits
+
+Makes 53- / 127-wire council expectation values computable on one CPU node:
+- Backward light cone of the measured Pauli string: walking the tape in reverse, an op is
+  kept only if it touches a wire that can still influence the measurement (noise channels
+  included); everything outside is dropped before simulation
+- The kept ops form a tensor network that splits into connected components (wires linked
+  by two-qubit gates); a Pauli-string expectation factorizes over the components, so each
+  one is contracted on its own and the results multiply
+- Sub-circuits of every tape in a batch go out in ONE submission (execute_light_cone is a
+  drop-in executor for circuit_templates.execute_tapes / BatchedZNE)
+- max_component_wires guards against components too wide for the chosen device
+
+Usage:
+    from light_cone import execute_light_cone
+    zne = BatchedZNE(template, dev, scale_factors=[1, 3, 5], executor=execute_light_cone)
+
+Thunder eternal—simulate only what the council can see!
+"""
+
+import numpy as np
+import pennylane as qml
+from circuit_templates import execute_tapes
+
+
+def pauli_word(measurement) -> tuple[dict, float] | None:
+    """(wire -> 'X'|'Y'|'Z', coefficient) if the measurement is <single Pauli string>, else None"""
+    if not isinstance(measurement, qml.measurements.ExpectationMP) or measurement.obs is None:
+        return None
+    rep = measurement.obs.pauli_rep
+    if rep is None or len(rep) != 1:
+        return None
+    word, coeff = next(iter(rep.items()))
+    return dict(word), float(np.real(coeff))
+
+
+def backward_light_cone(ops, wires) -> list[int]:
+    """Indices (in circuit order) of ops that can influence measurements on `wires`"""
+    active, kept = set(wires), []
+    for i in range(len(ops) - 1, -1, -1):
+        op_wires = set(ops[i].wires)
+        if op_wires & active:
+            active |= op_wires
+            kept.append(i)
+    return kept[::-1]
+
+
+def light_cone_components(ops, wires) -> list[tuple[list[int], list]]:
+    """Connected components of the light cone: [(op indices, measured wires in component), ...]"""
+    kept = backward_light_cone(ops, wires)
+    parent = {}
+
+    def find(w):
+        parent.setdefault(w, w)
+        while parent[w] != w:
+            parent[w] = parent[parent[w]]
+            w = parent[w]
+        return w
+
+    for w in wires:
+        find(w)
+    for i in kept:
+        first, *rest = ops[i].wires
+        for w in rest:
+            parent[find(w)] = find(first)
+
+    groups = {}
+    for w in wires:
+        groups.setdefault(find(w), ([], []))[1].append(w)
+    for i in kept:
+        groups[find(ops[i].wires[0])][0].append(i)
+    return list(groups.values())
+
+
+def split_tape(tape, max_component_wires: int | None = None) -> tuple[list, float | None]:
+    """Sub-tapes whose expectations multiply (times the returned coefficient) to the tape's
+
+    Tapes not measuring a single Pauli string come back as one pruned tape with coefficient None
+    (result passed through unchanged).
+    """
+    word = pauli_word(tape.measurements[0]) if len(tape.measurements) == 1 else None
+    if word is None:  # Samples / general observables: light-cone pruning only
+        kept = backward_light_cone(tape.operations, tape.measurements[0].wires if tape.measurements else [])
+        return [qml.tape.QuantumScript([tape.operations[i] for i in kept], tape.measurements,
+                                       shots=tape.shots)], None
+
+    paulis, coeff = word
+    sub_tapes = []
+    for op_idx, measured in light_cone_components(tape.operations, list(paulis)):
+        comp_wires = {w for i in op_idx for w in tape.operations[i].wires} | set(measured)
+        if max_component_wires is not None and len(comp_wires) > max_component_wires:
+            raise ValueError(f"Light-cone component spans {len(comp_wires)} wires "
+                             f"(> max_component_wires={max_component_wires}) - use an MPS backend")
+        obs = qml.pauli.PauliWord({w: paulis[w] for w in measured}).operation()
+        sub_tapes.append(qml.tape.QuantumScript([tape.operations[i] for i in op_idx], [qml.expval(obs)],
+                                                shots=tape.shots))
+    return sub_tapes, coeff
+
+
+def execute_light_cone(tapes, dev, max_component_wires: int | None = None):
+    """execute_tapes on pruned + factorized sub-circuits: every component of every tape, one submission"""
+    all_sub, splits = [], []
+    for tape in tapes:
+        sub_tapes, coeff = split_tape(tape, max_component_wires)
+        splits.append((len(all_sub), len(sub_tapes), coeff))
+        all_sub.extend(sub_tapes)
+    results = execute_tapes(all_sub, dev)
+    return [results[start] if coeff is None else coeff * np.prod(np.asarray(results[start:start + n], dtype=float))
+            for start, n, coeff in splits]
+
+
+# Demo
+if __name__ == "__main__":
+    import time
+    from circuit_templates import council_template
+
+    for wires in (53, 127):
+        tpl = council_template(wires, layers=8, entangler="CZ", measured=20, pattern="pairs")
+        params = np.random.default_rng(0).uniform(-np.pi, np.pi, tpl.num_params)
+        tape = tpl.bind(np.arange(wires), params)
+        t0 = time.perf_counter()
+        value = execute_light_cone([tape], qml.device("default.qubit", wires=wires))[0]
+        sub_tapes, _ = split_tape(tape)
+        print(f"{wires} wires: <Z^20> = {value:.6f} from {len(sub_tapes)} components "
+              f"(max {max(t.num_wires for t in sub_tapes)} wires) in {time.perf_counter() - t0:.3f}s")
@@ -0,0 +1,117 @@
+"""
+loss_channel.py - Exact Pure-Loss (Amplitude-Damping) Channel via Kraus Sums
+
+Photon loss L = sqrt(gamma) a with no Hamiltonian (or one commuting with n, e.g. qeye) for a
+time t is the pure-loss channel with transmissivity eta = exp(-gamma t) - no need to integrate
+a master equation over 50 time points. Its Kraus operators
+    A_k = sqrt((1 - eta)^k / k!) eta^{n/2} a^k
+act on Fock matrix elements as
+    rho'_{m,n} = sum_k w_k[m, n] rho_{m+k, n+k},  w_k = sqrt(C(m+k,k) C(n+k,k)) (1-eta)^k eta^{(m+n)/2}
+so one channel application is N shifted-diagonal multiply-adds with weights from log-gamma
+(no overflow at N=120+), vectorized over all Fock indices and batched over:
+- extra leading axes (ensembles of density matrices, (B, N, N))
+- the other modes of a multi-mode Qobj (loss applied per mode on the reshaped tensor)
+Kets are promoted to density matrices; weights are cached per (N, eta).
+
+Usage:
+    from loss_channel import pure_loss, loss_eta
+    noisy = pure_loss(state, loss_eta(gamma=0.2, t=1.0))          # == mesolve(..., c_ops=[sqrt(gamma) a])
+    noisy = pure_loss(council_state, 0.8, modes=[0, 2])            # loss on modes 0 and 2 only
+
+Thunder eternal—loss written in closed form, no integrator needed!
+"""
+
+from functools import lru_cache
+
+import numpy as np
+import qutip as qt
+from scipy.special import gammaln, xlogy
+
+
+def loss_eta(gamma: float, t: float = 1.0) -> float:
+    """Transmissivity of Lindblad loss sqrt(gamma) a integrated for time t"""
+    return float(np.exp(-gamma * t))
+
+
+@lru_cache(maxsize=32)
+def _loss_weights(N: int, eta: float) -> np.ndarray:
+    """(N, N, N) weights w[k, m, n] of rho_{m+k, n+k} in rho'_{m, n} (zero where m+k or n+k >= N)"""
+    k = np.arange(N)[:, None]
+    m = np.arange(N)[None, :]
+    # log sqrt(C(m+k, k) (1-eta)^k eta^m): the rho'_{m,n} weight is outer(half[k, m], half[k, n]);
+    # xlogy keeps 0 * log 0 = 0, so eta = 0 and eta = 1 come out exact
+    log_binom = gammaln(m + k + 1) - gammaln(m + 1) - gammaln(k + 1)
+    log_half = 0.5 * (log_binom + xlogy(k, 1 - eta) + xlogy(m, eta))
+    half = np.where(m + k < N, np.exp(log_half), 0.0)
+    weights = half[:, :, None] * half[:, None, :]
+    weights.setflags(write=False)
+    return weights
+
+
+def _apply_loss(rho: np.ndarray, eta: float) -> np.ndarray:
+    """Pure loss on the last two axes (N, N) of rho, batched over any leading axes"""
+    N = rho.shape[-1]
+    weights = _loss_weights(N, float(eta))
+    out = np.zeros(rho.shape, dtype=complex)
+    for k in range(N):
+        out[..., : N - k, : N - k] += weights[k, : N - k, : N - k] * rho[..., k:, k:]
+    return out
+
+
+@lru_cache(maxsize=32)
+def kraus_matrices(N: int, eta: float) -> np.ndarray:
+    """(N, N, N) stack of pure-loss Kraus matrices A_k[m, m+k] (read-only)"""
+    weights = _loss_weights(N, float(eta))
+    mats = np.zeros((N, N, N))
+    for k in range(N):
+        mats[k, np.arange(N - k), np.arange(k, N)] = np.sqrt(weights[k, np.arange(N - k), np.arange(N - k)])
+    mats.setflags(write=False)
+    return mats
+
+
+def kraus_operators(N: int, eta: float) -> list:
+    """Kraus operators A_k (k < N) of the pure-loss channel as Qobjs, for cross-checks"""
+    return [qt.Qobj(mat) for mat in kraus_matrices(N, float(eta))]
+
+
+def pure_loss(state, eta: float, modes=None):
+    """Apply the pure-loss channel with transmissivity eta
+
+    state: Qobj ket / density matrix (single or multi-mode; `modes` selects which modes lose
+    photons, default all) -> Qobj density matrix; or an ndarray density matrix / ensemble of
+    shape (..., N, N) -> ndarray.
+    """
+    if not 0 <= eta <= 1:
+        raise ValueError(f"Transmissivity eta must lie in [0, 1], got {eta}")
+    if not isinstance(state, qt.Qobj):
+        return _apply_loss(np.asarray(state), eta)
+    rho = qt.ket2dm(state) if state.isket else state
+    dims = rho.dims[0]
+    M = len(dims)
+    tensor = rho.full().reshape(dims + dims)
+    for mode in range(M) if modes is None else modes:
+        tensor = np.moveaxis(tensor, (mode, M + mode), (-2, -1))
+        tensor = np.moveaxis(_apply_loss(tensor, eta), (-2, -1), (mode, M + mode))
+    size = int(np.prod(dims))
+    return qt.Qobj(tensor.reshape(size, size), dims=rho.dims)
+
+
+# Benchmark: Kraus channel vs mesolve over 50 time points
+if __name__ == "__main__":
+    import time
+    from gkp_states import gkp_zero
+
+    N, gamma = 120, 0.2
+    psi = gkp_zero(0.25, 18, N)
+    t0 = time.perf_counter()
+    ref = qt.mesolve(qt.qeye(N), psi, np.linspace(0, 1, 50), [np.sqrt(gamma) * qt.destroy(N)],
+                     options={"atol": 1e-12, "rtol": 1e-10}).states[-1]
+    t_me = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    out = pure_loss(psi, loss_eta(gamma))
+    t_kraus = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    pure_loss(psi, loss_eta(gamma))
+    t_hot = time.perf_counter() - t0
+    print(f"GKP N={N}, gamma={gamma}: mesolve {t_me * 1e3:.0f} ms | Kraus {t_kraus * 1e3:.1f} ms "
+          f"(cached weights {t_hot * 1e3:.1f} ms) | max |diff| {np.abs((out - ref).full()).max():.1e}")
@@ -0,0 +1,132 @@
+"""
+loss_trajectories.py - Quantum-Trajectory (Monte Carlo Wavefunction) Loss + Shift Engine
+
+A density matrix over M modes at cutoff N holds N^{2M} numbers - the square of an already
+huge state vector. Trajectories keep the state pure and sample the noise instead:
+- Shift noise: one random displacement per mode and trajectory (uniform in [-shift, shift]
+  per quadrature, as in the council scripts), applied matrix-free
+- Pure loss unravelled into photon-number jumps: per mode, k lost photons are drawn with
+  p_k = <A_k^dag A_k> (only the mode's reduced Fock populations are needed) and the state
+  collapses to A_k|psi> / ||A_k|psi>|| - the exact integrated MCWF record of sqrt(gamma) a,
+  so the trajectory average reproduces loss_channel.pure_loss exactly, not to dt accuracy
+- Works on multimode_engine.ModeRegister (N^M memory) and BosonicMPS (M N chi^2 memory)
+- Trajectories fanned out over a process pool in chunks, one SeedSequence child per
+  trajectory, so results do not depend on the worker count
+- Fidelity to a pure reference is the trajectory mean of |<ideal|psi_j>|^2; fidelity_estimate
+  reports it with a normal-approximation confidence interval
+
+Usage:
+    from loss_trajectories import fidelity_estimate, run_trajectories
+    samples = run_trajectories(state, eta=loss_eta(0.2), shift=0.2, trajectories=256, workers=8)
+    est = fidelity_estimate(samples)                 # {"mean", "stderr", "lower", "upper", ...}
+
+Thunder eternal—every photon jump sampled, no density matrix squared!
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from statistics import NormalDist
+
+import numpy as np
+
+from loss_channel import kraus_matrices
+
+
+def apply_loss_jumps(state, eta: float, rng, modes=None) -> list:
+    """Sample one photon-loss record on `modes` (default all) in place; returns photons lost per mode"""
+    if not 0 <= eta <= 1:
+        raise ValueError(f"Transmissivity eta must lie in [0, 1], got {eta}")
+    lost = []
+    for mode in range(state.n_modes) if modes is None else modes:
+        populations = state.reduced_dm(mode).diagonal().real
+        kraus = kraus_matrices(populations.size, float(eta))
+        probs = np.maximum((kraus ** 2).sum(axis=1) @ populations, 0.0)  # p_k = sum_j |A_k[:, j]|^2 P(j)
+        k = int(rng.choice(probs.size, p=probs / probs.sum()))
+        state.apply(kraus[k], mode)  # k = 0 is the no-jump branch eta^{n/2}, not the identity
+        state.normalize()
+        lost.append(k)
+    return lost
+
+
+def trajectory(state, eta: float = 1.0, shift: float = 0.0, rng=None, correct=None):
+    """One noisy copy of `state`: random shifts, then a sampled loss record, then `correct`"""
+    rng = np.random.default_rng(rng)
+    noisy = state.copy()
+    if shift:
+        for mode, (q, p) in enumerate(rng.uniform(-shift, shift, (state.n_modes, 2))):
+            noisy.displace(q + 1j * p, mode)
+    if eta < 1:
+        apply_loss_jumps(noisy, eta, rng)
+    if correct is not None:
+        correct(noisy)
+    return noisy
+
+
+def _run_chunk(args) -> np.ndarray:
+    state, ideal, eta, shift, correct, seeds = args
+    norm = ideal.norm()
+    out = np.empty(len(seeds))
+    for j, seed in enumerate(seeds):
+        psi = trajectory(state, eta, shift, np.random.default_rng(seed), correct)
+        out[j] = abs(ideal.overlap(psi)) ** 2 / (norm * psi.norm()) ** 2
+    return out
+
+
+def run_trajectories(state, ideal=None, eta: float = 1.0, shift: float = 0.0, trajectories: int = 200,
+                     correct=None, workers: int | None = None, seed: int = 0) -> np.ndarray:
+    """Per-trajectory fidelities |<ideal|psi_j>|^2 (ideal defaults to the noiseless state)
+
+    `correct` (in-place, picklable) runs on each noisy trajectory before scoring; workers=1
+    runs inline.
+    """
+    ideal = state if ideal is None else ideal
+    seeds = np.random.SeedSequence(seed).spawn(trajectories)
+    workers = 1 if workers == 1 else min(workers or os.cpu_count() or 1, trajectories)
+    chunks = [(state, ideal, eta, shift, correct, part) for part in np.array_split(seeds, workers)]
+    if workers == 1:
+        return _run_chunk(chunks[0])
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return np.concatenate(list(pool.map(_run_chunk, chunks)))
+
+
+def fidelity_estimate(samples, confidence: float = 0.95) -> dict:
+    """Mean of trajectory fidelities with a normal-approximation confidence interval (clipped to [0, 1])"""
+    samples = np.asarray(samples, dtype=float)
+    mean = float(samples.mean())
+    stderr = float(samples.std(ddof=1) / np.sqrt(samples.size)) if samples.size > 1 else float("inf")
+    radius = NormalDist().inv_cdf(0.5 + confidence / 2) * stderr
+    return {"mean": mean, "stderr": stderr, "lower": max(0.0, mean - radius),
+            "upper": min(1.0, mean + radius), "confidence": confidence, "trajectories": int(samples.size)}
+
+
+# Benchmark: trajectories vs the exact Kraus channel on 2 modes, then a 7-mode MPS cluster
+if __name__ == "__main__":
+    import time
+
+    import qutip as qt
+
+    from gkp_states import gkp_zero
+    from loss_channel import loss_eta, pure_loss
+    from multimode_engine import BosonicMPS, ModeRegister
+
+    N, eta = 40, loss_eta(0.2)
+    pair = ModeRegister([gkp_zero(0.3, 6, N), qt.coherent(N, 1.5)])
+    pair.beamsplitter(np.pi / 4, 0, 1)
+    psi = pair.to_qobj()
+    exact = qt.expect(pure_loss(psi, eta), psi).real
+    t0 = time.perf_counter()
+    est = fidelity_estimate(run_trajectories(pair, eta=eta, trajectories=400))
+    t_pair = time.perf_counter() - t0
+    print(f"2 modes @ N={N}: exact {exact:.4f} | trajectories {est['mean']:.4f} "
+          f"[{est['lower']:.4f}, {est['upper']:.4f}] in {t_pair:.2f}s")
+
+    N, modes = 120, 7
+    cluster = BosonicMPS([gkp_zero(0.25, 18, N)] * modes, max_bond_dim=8)
+    for i in range(modes - 1):
+        cluster.beamsplitter(np.pi / 4, i, i + 1)
+    t0 = time.perf_counter()
+    est = fidelity_estimate(run_trajectories(cluster, eta=eta, shift=0.2, trajectories=64))
+    memory = sum(t.nbytes for t in cluster.tensors)
+    print(f"{modes} modes @ N={N}: fidelity {est['mean']:.4f} [{est['lower']:.4f}, {est['upper']:.4f}] "
+          f"in {time.perf_counter() - t0:.2f}s | state {memory / 1e6:.2f} MB "
+          f"(density matrix: {N ** (2 * modes) * 16 / 1e18:.1e} EB)")
@@ -0,0 +1,105 @@
+"""
+mode_syndromes.py - Batched Per-Mode Syndrome Extraction + In-Place Local Corrections
+
+The cat+GKP council rounds take one reduced state per mode, then run three qt.expect calls
+and a correction gate per mode. Here a whole round is array work:
+- All single-mode marginals in one pass: state.reduced_dms() -> (M, N, N) (one center sweep
+  for BosonicMPS), optional pure loss applied to the whole stack at once (loss_channel)
+- Even-parity probability, <x> and <p> for every mode from one einsum over the stacked
+  operators (cached per cutoff) - no per-mode Qobj construction
+- Corrections vectorized: parity flip where P(even) < 1/2, GKP shift alpha = -round(s / (sqrt 2
+  spacing)) * spacing per quadrature (D(alpha) moves x by sqrt 2 Re alpha, so the comb of
+  D(k spacing) states sits at x = k sqrt 2 spacing), then applied in place with local
+  single-mode updates (parity diagonal, matrix-free displacement) - never a full-space operator
+
+Usage:
+    from mode_syndromes import correct_round
+    syndromes = correct_round(corrected, eta=loss_eta(gamma))   # ModeRegister / BosonicMPS, in place
+    syndromes["flip"], syndromes["shift"]                        # (M,) bool / complex
+
+Thunder eternal—every mode read in one sweep, every fix kept local!
+"""
+
+from functools import lru_cache
+
+import numpy as np
+
+from bosonic_ops import fock_ops
+from loss_channel import pure_loss
+
+GKP_SPACING = np.sqrt(np.pi)
+
+
+@lru_cache(maxsize=None)
+def syndrome_operators(N: int) -> np.ndarray:
+    """(3, N, N) stack [even-parity projector, x, p] at cutoff N (read-only)"""
+    ops = fock_ops(N)
+    stack = np.stack([ops.even_parity.full(), ops.x.full(), ops.p.full()])
+    stack.setflags(write=False)
+    return stack
+
+
+def mode_marginals(state, eta: float | None = None) -> np.ndarray:
+    """(M, N, N) single-mode reduced states, after pure loss with transmissivity eta if given"""
+    rhos = state.reduced_dms()
+    return rhos if eta is None else pure_loss(rhos, eta)
+
+
+def batched_expect(ops: np.ndarray, rhos: np.ndarray) -> np.ndarray:
+    """Re Tr(op_k rho_m) for every operator k and mode m -> (K, M)"""
+    return np.einsum("kij,mji->km", ops, rhos).real
+
+
+def measure_syndromes(state, eta: float | None = None, spacing: float = GKP_SPACING) -> dict:
+    """Parity + GKP syndromes of every mode and the corrections they call for"""
+    rhos = mode_marginals(state, eta)
+    p_even, q, p = batched_expect(syndrome_operators(rhos.shape[-1]), rhos)
+    cell = np.sqrt(2) * spacing  # Quadrature period of the comb; corrections are applied as alpha
+    shift = -(np.round(q / cell) + 1j * np.round(p / cell)) * spacing
+    return {"p_even": p_even, "q": q, "p": p, "flip": p_even < 0.5, "shift": shift}
+
+
+def apply_corrections(state, flip, shift):
+    """In place: parity (-1)^n on modes with flip, then D(shift[m]) on every mode with a nonzero shift"""
+    for mode in np.flatnonzero(flip):
+        state.apply(fock_ops(state.dims[mode]).parity, int(mode))
+    for mode, alpha in enumerate(shift):
+        if alpha != 0:
+            state.displace(complex(alpha), mode)
+
+
+def correct_round(state, eta: float | None = None, spacing: float = GKP_SPACING) -> dict:
+    """Measure every mode (marginals after loss eta) and correct `state` in place; returns the syndromes"""
+    syndromes = measure_syndromes(state, eta, spacing)
+    apply_corrections(state, syndromes["flip"], syndromes["shift"])
+    return syndromes
+
+
+# Benchmark: per-mode ptrace + qt.expect loop vs one batched round (dense 4-mode register)
+if __name__ == "__main__":
+    import time
+
+    import qutip as qt
+
+    from gkp_states import gkp_zero
+    from multimode_engine import ModeRegister
+
+    N, modes = 24, 4
+    cat = (qt.coherent(N, 2.0) + qt.coherent(N, -2.0)).unit()
+    register = ModeRegister([(cat + gkp_zero(0.3, 6, N)).unit()] * modes)
+    for i in range(modes - 1):
+        register.beamsplitter(np.pi / 4, i, i + 1)
+    psi = register.to_qobj().unit()
+    ops = fock_ops(N)
+    t0 = time.perf_counter()
+    loop = []
+    for i in range(modes):
+        partial = pure_loss(psi.ptrace(i), 0.75)
+        loop.append([qt.expect(ops.even_parity, partial), qt.expect(ops.x, partial), qt.expect(ops.p, partial)])
+    t_loop = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    syndromes = measure_syndromes(register, 0.75)
+    t_batch = time.perf_counter() - t0
+    batch = np.stack([syndromes["p_even"], syndromes["q"], syndromes["p"]], axis=1)
+    print(f"{modes} modes @ N={N} (dim {N ** modes:,}): ptrace + qt.expect loop {t_loop * 1e3:.1f} ms | "
+          f"batched round {t_batch * 1e3:.1f} ms | max |diff| {np.abs(batch - np.array(loop).real).max():.1e}")
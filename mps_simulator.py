@@ -0,0 +1,205 @@
+"""
+mps_simulator.py - Matrix Product State Simulator + PennyLane Device for Council Circuits
+
+Council circuits are nearest-neighbour CNOT/CZ chains: entanglement across any cut stays
+small, so an MPS holds them in O(n chi^2) memory instead of a 2^n statevector:
+- Site tensors (chi_l, 2, chi_r) in mixed-canonical form; two-site gates contract the pair,
+  SVD back and keep at most max_bond_dim singular values above cutoff
+- Truncation error = discarded weight sum(s_dropped^2) per split, accumulated per circuit
+  (1 - fidelity bound) and reported on the device after every execution
+- Non-adjacent two-qubit gates are routed with SWAPs along the chain
+- Pauli-string expectations by one left-to-right transfer contraction (Hamiltonians term by
+  term); finite shots draw +-1 outcomes per string
+- MPSDevice wraps it as a PennyLane device: qml.execute / QNodes / execute_tapes work unchanged;
+  load_backend("mps", wires_base=101, max_bond_dim=64)
+
+Usage:
+    from quantum_backend_manager import load_backend
+    dev = load_backend("mps", wires_base=201, max_bond_dim=32)
+    harmony = execute_tapes([bind_council(council_template(201), params)], dev)[0]
+    print(dev.truncation_errors)
+
+Thunder eternal—hundreds of council wires, bounded bonds, honest error bars!
+"""
+
+import numpy as np
+import pennylane as qml
+from pennylane.devices import Device, ExecutionConfig
+from pennylane.devices.modifiers import simulator_tracking, single_tape_support
+from pennylane.devices.preprocess import decompose, validate_device_wires
+from pennylane.transforms.core import CompilePipeline
+
+PAULI_MATRICES = {
+    "I": np.eye(2, dtype=complex),
+    "X": np.array([[0, 1], [1, 0]], dtype=complex),
+    "Y": np.array([[0, -1j], [1j, 0]], dtype=complex),
+    "Z": np.array([[1, 0], [0, -1]], dtype=complex),
+}
+
+SWAP = np.eye(4, dtype=complex)[[0, 2, 1, 3]]
+
+
+class MPSState:
+    """Pure state on n sites as an MPS with bounded bond dimension"""
+
+    def __init__(self, n_sites: int, max_bond_dim: int = 64, cutoff: float = 1e-12):
+        self.tensors = [np.zeros((1, 2, 1), dtype=complex) for _ in range(n_sites)]
+        for t in self.tensors:
+            t[0, 0, 0] = 1.0
+        self.max_bond_dim = max_bond_dim
+        self.cutoff = cutoff
+        self.center = 0
+        self.truncation_error = 0.0
+
+    @property
+    def n_sites(self) -> int:
+        return len(self.tensors)
+
+    @property
+    def bond_dims(self) -> list[int]:
+        return [t.shape[2] for t in self.tensors[:-1]]
+
+    def _move_center(self, site: int):
+        """QR sweeps so `site` is the orthogonality center"""
+        while self.center < site:
+            i = self.center
+            l, d, r = self.tensors[i].shape
+            q, rmat = np.linalg.qr(self.tensors[i].reshape(l * d, r))
+            self.tensors[i] = q.reshape(l, d, -1)
+            self.tensors[i + 1] = np.einsum("ab,bdr->adr", rmat, self.tensors[i + 1])
+            self.center += 1
+        while self.center > site:
+            i = self.center
+            l, d, r = self.tensors[i].shape
+            q, rmat = np.linalg.qr(self.tensors[i].reshape(l, d * r).T)
+            self.tensors[i] = q.T.reshape(-1, d, r)
+            self.tensors[i - 1] = np.einsum("ldb,ab->lda", self.tensors[i - 1], rmat)
+            self.center -= 1
+
+    def apply_1q(self, matrix: np.ndarray, site: int):
+        self.tensors[site] = np.einsum("ab,lbr->lar", matrix, self.tensors[site])
+
+    def _apply_theta(self, update, site: int):
+        """Two-site update theta(l, a, b, r) -> update(theta) on (site, site+1) - contract, SVD,
+        truncate; center ends on site+1"""
+        self._move_center(site)
+        a, b = self.tensors[site], self.tensors[site + 1]
+        theta = update(np.einsum("lar,rbs->labs", a, b))
+        l, da, db, r = theta.shape
+        u, s, vh = np.linalg.svd(theta.reshape(l * da, db * r), full_matrices=False)
+
+        norm2 = float(np.sum(s ** 2))
+        keep = max(1, min(self.max_bond_dim, int(np.count_nonzero(s ** 2 > self.cutoff * norm2))))
+        self.truncation_error += float(np.sum(s[keep:] ** 2)) / norm2
+        s = s[:keep] / np.sqrt(np.sum(s[:keep] ** 2) / norm2)
+        self.tensors[site] = u[:, :keep].reshape(l, da, keep)
+        self.tensors[site + 1] = (s[:, None] * vh[:keep]).reshape(keep, db, r)
+        self.center = site + 1
+
+    def _swap(self, site: int):
+        """Exchange sites (site, site+1)"""
+        self._apply_theta(lambda theta: theta.transpose(0, 2, 1, 3), site)
+
+    def _route(self, site1: int, site2: int, update):
+        """Two-site update on (site1, site2), site1 < site2: site2 SWAPped next to site1 and back"""
+        for i in range(site2 - 1, site1, -1):
+            self._swap(i)
+        self._apply_theta(update, site1)
+        for i in range(site1 + 1, site2):
+            self._swap(i)
+
+    def apply_2q(self, matrix: np.ndarray, site1: int, site2: int):
+        """4x4 gate (site1 = control/first wire); non-adjacent pairs routed through SWAPs"""
+        if site1 > site2:  # Reorder the gate's tensor factors so the first wire sits left
+            matrix = SWAP @ matrix @ SWAP
+            site1, site2 = site2, site1
+        gate = matrix.reshape(2, 2, 2, 2)
+        self._route(site1, site2, lambda theta: np.einsum("abcd,lcds->labs", gate, theta))
+
+    def pauli_expval(self, paulis: dict) -> float:
+        """<psi| prod_k P_k |psi> for {site: 'X'|'Y'|'Z'}"""
+        env = np.ones((1, 1), dtype=complex)
+        for i, t in enumerate(self.tensors):
+            op = PAULI_MATRICES[paulis.get(i, "I")]
+            env = np.einsum("ab,adr,de,bes->rs", env, t.conj(), op, t)
+        return float(np.real(env[0, 0]))
+
+    def norm(self) -> float:
+        return float(np.sqrt(abs(self.pauli_expval({}))))
+
+
+def simulate_mps(tape, wire_order, max_bond_dim: int = 64, cutoff: float = 1e-12, rng=None):
+    """(result, truncation error) for one tape measuring Pauli-string / Hamiltonian expectations"""
+    site = {w: i for i, w in enumerate(wire_order)}
+    state = MPSState(len(wire_order), max_bond_dim, cutoff)
+    for op in tape.operations:
+        matrix = qml.matrix(op)
+        if len(op.wires) == 1:
+            state.apply_1q(matrix, site[op.wires[0]])
+        else:
+            state.apply_2q(matrix, site[op.wires[0]], site[op.wires[1]])
+
+    results = []
+    for mp in tape.measurements:
+        rep = getattr(mp.obs, "pauli_rep", None) if isinstance(mp, qml.measurements.ExpectationMP) else None
+        if rep is None:
+            raise qml.DeviceError(f"MPS device supports expectation values of Pauli strings, got {mp}")
+        value = 0.0
+        for word, coeff in rep.items():
+            exact = state.pauli_expval({site[w]: p for w, p in word.items()})
+            if tape.shots and word:
+                shots = tape.shots.total_shots
+                exact = 2 * rng.binomial(shots, np.clip((1 + exact) / 2, 0, 1)) / shots - 1
+            value += float(np.real(coeff)) * exact
+        results.append(value)
+    return (results[0] if len(results) == 1 else tuple(results)), state.truncation_error
+
+
+def _supports_operation(op) -> bool:
+    return op.has_matrix and len(op.wires) <= 2 and not isinstance(op, qml.operation.Channel)
+
+
+@simulator_tracking
+@single_tape_support
+class MPSDevice(Device):
+    """PennyLane device running tapes on MPSState (pure states, <= 2-qubit gates, Pauli expectations)"""
+
+    name = "council.mps"
+
+    def __init__(self, wires=None, shots=None, max_bond_dim: int = 64, cutoff: float = 1e-12, seed=None):
+        super().__init__(wires=wires, shots=shots)
+        self.max_bond_dim = max_bond_dim
+        self.cutoff = cutoff
+        self.truncation_errors = []
+        self._rng = np.random.default_rng(seed)
+
+    def preprocess_transforms(self, execution_config: ExecutionConfig | None = None):
+        program = CompilePipeline()
+        program.add_transform(validate_device_wires, wires=self.wires, name=self.name)
+        program.add_transform(decompose, stopping_condition=_supports_operation, name=self.name)
+        return program
+
+    def execute(self, circuits, execution_config: ExecutionConfig | None = None):
+        results, self.truncation_errors = [], []
+        for tape in circuits:
+            # Only the tape's own wires are simulated, in device order (keeps chains adjacent)
+            wire_order = [w for w in (self.wires or tape.wires) if w in tape.wires]
+            result, error = simulate_mps(tape, wire_order, self.max_bond_dim, self.cutoff, self._rng)
+            results.append(result)
+            self.truncation_errors.append(error)
+        return tuple(results)
+
+
+# Demo
+if __name__ == "__main__":
+    import time
+    from circuit_templates import bind_council, council_template, execute_tapes
+
+    for wires in (101, 301):
+        tpl = council_template(wires, layers=2, measured=wires)
+        params = np.random.default_rng(0).uniform(-np.pi, np.pi, tpl.num_params)
+        dev = MPSDevice(wires=wires, max_bond_dim=32)
+        t0 = time.perf_counter()
+        harmony = execute_tapes([bind_council(tpl, params)], dev)[0]
+        print(f"{wires} wires: harmony {harmony:.6f} | truncation error {dev.truncation_errors[0]:.2e} | "
+              f"{time.perf_counter() - t0:.2f}s")
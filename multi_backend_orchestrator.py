@@ -8,8 +8,10 @@ Requires AWS/Braket + Xanadu keys configured.
 
 import pennylane as qml
 from pennylane import numpy as np
-from pennylane.transforms import mitigate_with_zne, fold_global, richardson_extrapolate
 from eternal_laws import enforce_odd
+from circuit_templates import council_template
+from batched_zne import BatchedZNE
+from quantum_backend_manager import load_backend
 
 BACKENDS = {
     "ionq": "arn:aws:braket:us-east-1::device/qpu/ionq/Aria-1",
@@ -19,18 +21,14 @@ BACKENDS = {
 }
 
 def run_on_backend(backend_arn, wires=7, shots=3000):
-    dev = qml.device("braket.aws.qubit", device_arn=backend_arn, shots=shots, wires=wires)
+    if backend_arn == "mps":  # Local MPS rehearsal of the same council chain (any width)
+        dev = load_backend("mps", wires_base=wires, shots=shots)
+    else:
+        dev = qml.device("braket.aws.qubit", device_arn=backend_arn, shots=shots, wires=wires)
     
-    @qml.qnode(dev)
-    def circuit(params):
-        for i in range(wires):
-            qml.RX(params[i], wires=i)
-            qml.RY(params[i+wires], wires=i)
-        for i in range(wires-1):
-            qml.CNOT(wires=[i, i+1])
-        return qml.expval(qml.PauliZ(0) @ qml.PauliZ(1) @ qml.PauliZ(2) @ qml.PauliZ(3) @ qml.PauliZ(4) @ qml.PauliZ(5) @ qml.PauliZ(6))
-    
-    zne_circ = mitigate_with_zne(circuit, scale_factors=[1,3,5], folding=fold_global, extrapolate=richardson_extrapolate)
+    # Council core (RX/RY forks + CNOT chain, Z0..Z6 harmony) folded once per scale,
+    # all scale factors submitted as one Braket batch
+    zne_circ = BatchedZNE(council_template(wires, measured=7), dev, scale_factors=[1,3,5], shots=shots)
     
     params = np.zeros(2*wires)
     harmony = zne_circ(params)
@@ -8,6 +8,8 @@ Fidelity harmony pre/post—loss-tolerant thriving recovered eternal.
 """
 
 import qutip as qt
+from bosonic_ops import fock_ops
+from loss_channel import loss_eta, pure_loss
 import numpy as np
 
 alpha = 2.0
@@ -32,17 +34,13 @@ ideal = state.copy()
 
 # Noise: Loss
 gamma = 0.3
-a_list = [qt.destroy(cutoff) for _ in range(modes)]
-c_ops = [np.sqrt(gamma) * qt.tensor([a_list[i] if j==i else qt.identity(cutoff) for j in range(modes)]) for i in range(modes)]
-
-result = qt.mesolve(qt.qeye([cutoff]*modes), state, np.linspace(0,1,50), c_ops)
-noisy = result.states[-1]
+noisy = pure_loss(state, loss_eta(gamma))  # Per-mode exact Kraus loss
 
 # Mercy: Per-mode cat parity + rotation
 corrected = noisy
 for i in range(modes):
     partial = noisy.ptrace(i)
-    even = qt.projection(cutoff, range(0,cutoff,2), range(0,cutoff,2))
+    even = fock_ops(cutoff).even_parity
     p_even = qt.expect(even, partial)
     if p_even < 0.5:
         R = qt.tensor([qt.phase_gate(np.pi) if j==i else qt.identity(cutoff) for j in range(modes)])
@@ -9,6 +9,8 @@ Fidelity harmony pre/post—council thriving recovered eternal.
 
 import numpy as np
 import qutip as qt
+from gkp_states import gkp_zero
+from loss_channel import loss_eta, pure_loss
 
 N = 120
 Delta = 0.25
@@ -17,13 +19,7 @@ K = 15
 
 def multi_mode_gkp_zero():
     # Single-mode GKP base
-    single = qt.basis(N, 0)
-    for k in range(-K, K+1):
-        alpha = k * np.sqrt(np.pi)
-        disp = qt.displace(N, alpha)
-        sq = qt.squeeze(N, Delta / 2)
-        single += disp * sq * qt.basis(N, 0)
-    single = single.unit()
+    single = gkp_zero(Delta, K, N)
     
     # Entangle 5 modes (tensor + beam splitter chain for consensus)
     state = qt.tensor([single for _ in range(modes)])
@@ -37,15 +33,13 @@ gamma = 0.2
 shifts = np.random.uniform(-0.2, 0.2, modes * 2)  # p/q per mode
 
 def apply_noise(state):
-    a_list = [qt.destroy(N) for _ in range(modes)]
-    c_ops = [np.sqrt(gamma) * qt.tensor([a_list[j] if j==i else qt.identity(N) for j in range(modes)]) for i in range(modes)]
     # Shift displacements
     D_list = [qt.tensor([qt.displace(N, shifts[2*i] + 1j*shifts[2*i+1]) if j==i else qt.identity(N) for j in range(modes)]) for i in range(modes)]
     noisy = state
     for D in D_list:
         noisy = D * noisy
-    # Loss evolution approx (mesolve for full)
-    return noisy  # Placeholder—full mesolve for accuracy
+    # Loss evolution: exact per-mode Kraus channel
+    return pure_loss(noisy, loss_eta(gamma))
 
 # Syndrome + mercy per mode (big/small envelope)
 # ... (measure q/p, round big, fine small, displace)
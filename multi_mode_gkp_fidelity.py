@@ -10,50 +10,50 @@ Fidelity harmony pre/post—council thriving recovered eternal.
 import numpy as np
 import qutip as qt
 
+from gkp_states import gkp_zero
+from loss_channel import loss_eta, pure_loss
+from loss_trajectories import fidelity_estimate, run_trajectories
+from multimode_engine import BosonicMPS
+
 N = 120
 Delta = 0.25
+chi = 8  # MPS bond dimension cap
 modes = 7  # Odd council eternal
 K = 18
 
 def single_gkp_zero():
-    psi = qt.basis(N, 0)
-    for k in range(-K, K+1):
-        alpha = k * np.sqrt(np.pi)
-        disp = qt.displace(N, alpha)
-        sq = qt.squeeze(N, Delta / 2)
-        psi += disp * sq * qt.basis(N, 0)
-    return psi.unit()
-
-# Multi-mode entangled state (tensor + beam splitter entangle)
-state = qt.tensor([single_gkp_zero() for _ in range(modes)])
-for i in range(modes-1):
-    BS = qt.tensor([qt.beamsplitter(np.pi/4) if j in [i,i+1] else qt.identity(N) for j in range(modes)])
-    state = BS * state
-state = state.unit()
-
-# Ideal reference
-ideal = state.copy()
-
-# Noise: Loss + shifts
-gamma = 0.2
-a_list = [qt.destroy(N) for _ in range(modes)]
-c_ops = [np.sqrt(gamma) * qt.tensor([a_list[i] if j==i else qt.identity(N) for j in range(modes)]) for i in range(modes)]
-
-shifts = np.random.uniform(-0.2, 0.2, modes * 2)
-D_list = [qt.tensor([qt.displace(N, shifts[2*i] + 1j*shifts[2*i+1]) if j==i else qt.identity(N) for j in range(modes)]) for i in range(modes)]
-
-noisy = state
-for D in D_list:
-    noisy = D * noisy
-
-# Loss evolution approx
-result = qt.mesolve(qt.qeye([N]*modes), noisy, np.linspace(0,1,50), c_ops)
-noisy = result.states[-1]
-
-# Syndrome + mercy per mode (big/small envelope)
-fid_pre = qt.fidelity(noisy, ideal)
-corrected = noisy  # Full per-mode correct placeholder
-fid_post = qt.fidelity(corrected, ideal)
-
-print(f"7-Mode Entangled GKP Council Fidelity Pre: {fid_pre:.4f} | Post Mercy: {fid_post:.4f}")
-print(f"Thriving Recovery Gain: {fid_post - fid_pre:.4f}")
+    return gkp_zero(Delta, K, N)
+
+if __name__ == "__main__":
+    # Multi-mode entangled state (tensor + beam splitter entangle)
+    state = BosonicMPS([single_gkp_zero()] * modes, max_bond_dim=chi)  # Local two-mode updates, bounded bonds
+    for i in range(modes-1):
+        state.beamsplitter(np.pi/4, i, i+1)
+
+    # Ideal reference
+    ideal = state.copy()
+
+    # Noise: Loss + shifts
+    gamma = 0.2
+
+    shifts = np.random.uniform(-0.2, 0.2, modes * 2)
+    noisy = state.copy()
+    for i in range(modes):
+        noisy.displace(shifts[2*i] + 1j*shifts[2*i+1], i)
+
+    # Loss acts locally: exact on each mode's reduced state
+    eta = loss_eta(gamma)
+    fid_modes = np.mean([qt.fidelity(pure_loss(qt.Qobj(noisy.reduced_dm(i)), eta), qt.Qobj(ideal.reduced_dm(i))) ** 2
+                         for i in range(modes)])  # Squared (Uhlmann) fidelity, same convention as the trajectories
+
+    # Syndrome + mercy per mode (big/small envelope)
+    fid_pre = abs(ideal.overlap(noisy)) ** 2  # Global pure-state fidelity |<ideal|noisy>|^2 over the shift channel
+    corrected = noisy  # Full per-mode correct placeholder
+    fid_post = abs(ideal.overlap(corrected)) ** 2
+
+    print(f"7-Mode Entangled GKP Council Fidelity |<ideal|psi>|^2 Pre: {fid_pre:.4f} | Post Mercy: {fid_post:.4f}")
+    print(f"Thriving Recovery Gain: {fid_post - fid_pre:.4f} | Mean per-mode fidelity after loss: {fid_modes:.4f}")
+
+    # Global loss + shift fidelity from pure-state trajectories: mean |<ideal|psi_j>|^2 (process pool, 95% CI)
+    est = fidelity_estimate(run_trajectories(ideal, eta=eta, shift=0.2, trajectories=64))
+    print(f"Trajectory fidelity |<ideal|psi>|^2 (loss + shift): {est['mean']:.4f} [{est['lower']:.4f}, {est['upper']:.4f}]")
@@ -9,20 +9,16 @@ Fidelity harmony pre/post—council thriving recovered eternal.
 
 import numpy as np
 import qutip as qt
+from gkp_states import gkp_zero
 
 N = 120
 Delta = 0.25
 modes = 5  # Odd council eternal
-spacing = np.sqrt(np.pi / np.sqrt(3))  # Hex denser
+K = 18  # Lattice sum terms
 
 def hex_gkp_mode():
-    psi = qt.tensor([qt.basis(N, 0) for _ in range(modes)])
-    # Hex lattice sum (simplified 6-dir + center per mode)
-    for dir in [0, spacing, -spacing, spacing*np.exp(1j*np.pi/3), spacing*np.exp(2j*np.pi/3), spacing*np.exp(4j*np.pi/3)]:
-        D = qt.tensor([qt.displace(N, dir) for _ in range(modes)])
-        S = qt.tensor([qt.squeeze(N, Delta / 2) for _ in range(modes)])
-        psi += D * S * psi  # Approx entangled sum
-    return psi.unit()
+    # Hex lattice GKP per mode (closed form, cached - see gkp_states)
+    return qt.tensor([gkp_zero(Delta, K, N, lattice="hexagonal") for _ in range(modes)])
 
 # Entangle council (beam splitter chain for consensus)
 def entangle_council(state):
@@ -0,0 +1,244 @@
+"""
+multimode_engine.py - Scalable Multi-Mode Bosonic Engine (local contractions + optional MPS)
+
+qt.tensor over M modes at cutoff N builds N^M x N^M operators (13 modes at N=120: 120^13) for
+every beam splitter and displacement. Gates here never leave their own modes:
+- ModeRegister: dense state array of shape (N,)*M; single-mode operators contract one axis,
+  displacements go through bosonic_ops.displace_state on that axis (matrix-free)
+- Beam splitters conserve total photon number n, so BS(theta, phi) on two axes is one small
+  unitary per n acting on the anti-diagonal {|k, n-k>} - O(N^3) per gate instead of the
+  O(N^4) dense two-mode matrix; per-n eigensystems cached per (N, phi), exact matrix elements
+  (projected, not exponentiated in the truncated space)
+- BosonicMPS: mps_simulator.MPSState with local dimension N - product states of any single-mode
+  kets, two-mode gates as two-site updates (SVD, max_bond_dim / cutoff truncation with the
+  discarded weight accumulated), distant pairs routed by SWAPs; memory O(M N chi^2)
+- Both expose apply / displace / beamsplitter / normalize / reduced_dm(s) / expect / overlap, so council
+  scripts swap dense <-> MPS by changing the constructor
+
+Beam splitter convention (Strawberry Fields BSgate): BS = exp(theta (e^{i phi} a b^dag -
+e^{-i phi} a^dag b)), i.e. a -> cos(theta) a - e^{-i phi} sin(theta) b.
+
+Usage:
+    from multimode_engine import BosonicMPS, ModeRegister
+    state = BosonicMPS([gkp_zero(0.25, 12, 120)] * 13, max_bond_dim=8)
+    state.beamsplitter(np.pi / 6, 0, 5)
+    state.displace(0.2 - 0.1j, 3)
+    rho3 = state.reduced_dm(3)                       # (N, N) ndarray
+
+Thunder eternal—council-size clusters in bounded memory!
+"""
+
+from functools import lru_cache
+
+import numpy as np
+import qutip as qt
+
+from bosonic_ops import displace_state
+from mps_simulator import MPSState
+
+
+@lru_cache(maxsize=16)
+def _bs_eigensystems(N: int, phi: float) -> tuple:
+    """Per total photon number n < 2N-1: (valid k in mode 1, eigenvalues, eigenvectors) of i*G_n"""
+    systems = []
+    for n in range(2 * N - 1):
+        k = np.arange(1, n + 1)
+        coupling = np.sqrt(k * (n - k + 1))  # <k-1, n-k+1| a b^dag |k, n-k>
+        gen = np.zeros((n + 1, n + 1), dtype=complex)
+        gen[k - 1, k] = np.exp(1j * phi) * coupling
+        gen[k, k - 1] = -np.exp(-1j * phi) * coupling
+        lam, vecs = np.linalg.eigh(1j * gen)
+        valid = np.arange(max(0, n - N + 1), min(n, N - 1) + 1)
+        systems.append((valid, lam, vecs[valid]))
+    return tuple(systems)
+
+
+@lru_cache(maxsize=64)
+def beamsplitter_blocks(N: int, theta: float, phi: float = 0.0) -> tuple:
+    """((k indices, n - k indices, U_n restricted to the cutoff), ...) for every total photon number n"""
+    blocks = []
+    for n, (valid, lam, vecs) in enumerate(_bs_eigensystems(N, float(phi))):
+        unitary = (vecs * np.exp(-1j * theta * lam)) @ vecs.conj().T  # exp(theta G) = V e^{-i theta lam} V^dag
+        blocks.append((valid, n - valid, unitary))
+    return tuple(blocks)
+
+
+def _apply_op(arr: np.ndarray, op: np.ndarray, axis: int) -> np.ndarray:
+    return np.moveaxis(np.tensordot(op, arr, axes=([1], [axis])), 0, axis)
+
+
+def _displace_axis(arr: np.ndarray, alpha: complex, axis: int) -> np.ndarray:
+    moved = np.moveaxis(arr, axis, 0)
+    out = displace_state(moved.reshape(moved.shape[0], -1), alpha)
+    return np.moveaxis(out.reshape(moved.shape), 0, axis)
+
+
+def _beamsplitter_axes(arr: np.ndarray, blocks, axis1: int, axis2: int) -> np.ndarray:
+    """Apply precomputed BS blocks to (axis1 = first mode, axis2 = second mode) of arr"""
+    moved = np.moveaxis(arr, (axis1, axis2), (0, 1))
+    flat = moved.reshape(moved.shape[0], moved.shape[1], -1)
+    out = np.empty_like(flat, dtype=complex)
+    for k1, k2, unitary in blocks:
+        out[k1, k2] = unitary @ flat[k1, k2]
+    return np.moveaxis(out.reshape(moved.shape), (0, 1), (axis1, axis2))
+
+
+def _as_array(op) -> np.ndarray:
+    return op.full() if isinstance(op, qt.Qobj) else np.asarray(op)
+
+
+class ModeRegister:
+    """Dense pure state of M modes at cutoff N as an (N,)*M array - exact, N^M memory"""
+
+    def __init__(self, kets):
+        kets = [_as_array(k).ravel().astype(complex) for k in kets]
+        psi = kets[0]
+        for ket in kets[1:]:
+            psi = np.multiply.outer(psi, ket)
+        self.psi = psi.reshape([k.size for k in kets])
+
+    @property
+    def n_modes(self) -> int:
+        return self.psi.ndim
+
+    @property
+    def dims(self) -> list[int]:
+        return list(self.psi.shape)
+
+    def apply(self, op, mode: int):
+        self.psi = _apply_op(self.psi, _as_array(op), mode)
+
+    def displace(self, alpha: complex, mode: int):
+        self.psi = _displace_axis(self.psi, alpha, mode)
+
+    def beamsplitter(self, theta: float, mode1: int, mode2: int, phi: float = 0.0):
+        blocks = beamsplitter_blocks(self.psi.shape[mode1], float(theta), float(phi))
+        self.psi = _beamsplitter_axes(self.psi, blocks, mode1, mode2)
+
+    def norm(self) -> float:
+        return float(np.linalg.norm(self.psi))
+
+    def normalize(self):
+        self.psi /= self.norm()
+
+    def reduced_dm(self, mode: int) -> np.ndarray:
+        moved = np.moveaxis(self.psi, mode, 0).reshape(self.psi.shape[mode], -1)
+        rho = moved @ moved.conj().T
+        return rho / np.trace(rho).real
+
+    def reduced_dms(self) -> np.ndarray:
+        """(M, N, N) stack of every single-mode reduced density matrix"""
+        return np.stack([self.reduced_dm(mode) for mode in range(self.n_modes)])
+
+    def expect(self, op, mode: int) -> complex:
+        return complex(np.trace(_as_array(op) @ self.reduced_dm(mode)))
+
+    def overlap(self, other: "ModeRegister") -> complex:
+        """<self|other>"""
+        return complex(np.vdot(self.psi, other.psi))
+
+    def copy(self) -> "ModeRegister":
+        clone = ModeRegister.__new__(ModeRegister)
+        clone.psi = self.psi.copy()
+        return clone
+
+    def to_qobj(self) -> qt.Qobj:
+        dims = list(self.psi.shape)
+        return qt.Qobj(self.psi.reshape(-1, 1), dims=[dims, [1] * len(dims)])
+
+
+class BosonicMPS(MPSState):
+    """Pure M-mode state as an MPS with local dimension N (bond dimension <= max_bond_dim)"""
+
+    def __init__(self, kets, max_bond_dim: int = 16, cutoff: float = 1e-12):
+        super().__init__(0, max_bond_dim, cutoff)
+        self.tensors = [_as_array(k).astype(complex).reshape(1, -1, 1) for k in kets]
+
+    @property
+    def n_modes(self) -> int:
+        return self.n_sites
+
+    @property
+    def dims(self) -> list[int]:
+        return [t.shape[1] for t in self.tensors]
+
+    def apply(self, op, mode: int):
+        self._move_center(mode)  # Non-unitary operators (projectors, n, truncated D) keep the gauge
+        self.apply_1q(_as_array(op), mode)
+
+    def displace(self, alpha: complex, mode: int):
+        self._move_center(mode)
+        self.tensors[mode] = _displace_axis(self.tensors[mode], alpha, 1)
+
+    def beamsplitter(self, theta: float, mode1: int, mode2: int, phi: float = 0.0):
+        blocks = beamsplitter_blocks(self.tensors[mode1].shape[1], float(theta), float(phi))
+        first, second = (1, 2) if mode1 < mode2 else (2, 1)  # Legs of mode1 / mode2 in theta(l, a, b, r)
+        self._route(min(mode1, mode2), max(mode1, mode2),
+                    lambda theta: _beamsplitter_axes(theta, blocks, first, second))
+
+    def norm(self) -> float:
+        return float(np.sqrt(abs(self.overlap(self))))
+
+    def normalize(self):
+        """Rescale the orthogonality center (its norm is the state norm)"""
+        self.tensors[self.center] /= np.linalg.norm(self.tensors[self.center])
+
+    def reduced_dm(self, mode: int) -> np.ndarray:
+        """Single-mode reduced density matrix - read off the orthogonality center"""
+        self._move_center(mode)
+        t = self.tensors[mode]
+        rho = np.einsum("lar,lbr->ab", t, t.conj())
+        return rho / np.trace(rho).real
+
+    def reduced_dms(self) -> np.ndarray:
+        """(M, N, N) stack of every single-mode reduced density matrix - one left-to-right center sweep"""
+        self._move_center(0)
+        return np.stack([self.reduced_dm(mode) for mode in range(self.n_modes)])
+
+    def expect(self, op, mode: int) -> complex:
+        return complex(np.trace(_as_array(op) @ self.reduced_dm(mode)))
+
+    def overlap(self, other: "BosonicMPS") -> complex:
+        """<self|other> by one left-to-right transfer contraction"""
+        env = np.ones((1, 1), dtype=complex)
+        for a, b in zip(self.tensors, other.tensors, strict=True):
+            half = np.tensordot(env, a.conj(), axes=([0], [0]))  # (b, d, r): pairwise, O(chi^3 N) per site
+            env = np.tensordot(half, b, axes=([0, 1], [0, 1]))
+        return complex(env[0, 0])
+
+    def copy(self) -> "BosonicMPS":
+        clone = BosonicMPS([], self.max_bond_dim, self.cutoff)
+        clone.tensors = [t.copy() for t in self.tensors]
+        clone.center, clone.truncation_error = self.center, self.truncation_error
+        return clone
+
+    def to_register(self) -> ModeRegister:
+        """Contract to a dense ModeRegister (small M and N only)"""
+        psi = self.tensors[0]
+        for t in self.tensors[1:]:
+            psi = np.tensordot(psi, t, axes=([-1], [0]))
+        register = ModeRegister.__new__(ModeRegister)
+        register.psi = psi[0, ..., 0]
+        return register
+
+
+# Benchmark: 13-mode cat+GKP council, full beam-splitter mesh, bounded bond dimension
+if __name__ == "__main__":
+    import time
+
+    from gkp_states import gkp_zero
+
+    N, modes, chi = 60, 13, 12
+    cat = (qt.coherent(N, 2.0) + qt.coherent(N, -2.0)).unit()
+    mode_ket = (cat + gkp_zero(0.25, 8, N)).unit()
+    t0 = time.perf_counter()
+    state = BosonicMPS([mode_ket] * modes, max_bond_dim=chi)
+    for i in range(modes - 1):
+        state.beamsplitter(np.pi / 6, i, i + 1)
+    chain = time.perf_counter() - t0
+    state.beamsplitter(np.pi / 6, 0, modes - 1)
+    mesh = time.perf_counter() - t0 - chain
+    memory = sum(t.nbytes for t in state.tensors)
+    print(f"{modes} modes @ N={N}, chi<={chi}: BS chain {chain:.2f}s | end-to-end BS via SWAPs {mesh:.2f}s | "
+          f"bonds {state.bond_dims} | {memory / 1e6:.2f} MB (dense: {N ** modes * 16 / 1e18:.1e} EB) | "
+          f"truncation {state.truncation_error:.2e} | <n_6> {state.expect(qt.num(N), 6).real:.3f}")
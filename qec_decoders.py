@@ -0,0 +1,288 @@
+"""
+qec_decoders.py - Detector Graphs + Minimum-Weight Perfect Matching Decoders
+
+Real decoders for the codes in qec_codes.py (replaces hardcoded lookups / fixed "gains"):
+- DetectorGraph.from_circuit: every elementary fault of the noisy circuit is propagated alone
+  through the Pauli-frame sampler; faults flipping 1-2 detectors become edges (single-detector
+  faults end on a boundary node), weight log((1-p)/p), parallel faults merged
+- All-pairs shortest paths (scipy csgraph Dijkstra) and the observable parity of every shortest
+  path (pointer doubling over the predecessor trees) are precomputed once per circuit
+- MatchingDecoder: per shot only the defect set is matched - 1-2 defects in closed form,
+  more through a blossom matcher (networkx) on defects + boundary copies; results cached per
+  defect set so repeated syndromes across a batch decode once
+- RestrictionDecoder: triangular color codes (code-capacity noise) - MWPM on the red-green and
+  red-blue restricted lattices, then a precomputed per-red-face lift back onto data qubits
+
+Usage:
+    from qec_codes import RotatedSurfaceCode, memory_circuit
+    from pauli_frame import FrameSampler
+    from qec_decoders import MatchingDecoder
+    circuit = memory_circuit(RotatedSurfaceCode(5), rounds=5, p=0.003)
+    dets, obs = FrameSampler(circuit).sample(10_000)
+    logical_errors = (MatchingDecoder.from_circuit(circuit).decode(dets) != obs).any(axis=1)
+
+Thunder eternal—defects paired in mercy, logicals kept whole!
+"""
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import dijkstra
+
+from pauli_frame import FrameSampler
+
+UNREACHABLE = 1e9  # Finite stand-in for infinite distances inside the matcher
+
+
+def _path_parities(pred: np.ndarray, labels: np.ndarray) -> np.ndarray:
+    """XOR of edge labels along every shortest path i -> j, from the predecessor matrix"""
+    n = pred.shape[0]
+    cols = np.broadcast_to(np.arange(n), pred.shape)
+    parent = np.where(pred < 0, cols, pred)  # Roots / unreachable point at themselves
+    acc = labels[parent, cols]
+    acc[parent == cols] = 0
+    for _ in range(int(np.ceil(np.log2(max(n, 2)))) + 1):
+        acc = acc ^ np.take_along_axis(acc, parent, axis=1)
+        parent = np.take_along_axis(parent, parent, axis=1)
+    return acc
+
+
+def _min_weight_pairs(dist: np.ndarray, boundary: np.ndarray) -> list[tuple[int, int]]:
+    """Minimum-weight pairing of k defects (pairwise dist (k, k), boundary dist (k,)):
+    [(a, b)] with b = -1 for a defect matched to the boundary"""
+    k = len(boundary)
+    if k == 1:
+        return [(0, -1)]
+    if k == 2:
+        return [(0, 1)] if dist[0, 1] <= boundary[0] + boundary[1] else [(0, -1), (1, -1)]
+    try:
+        import networkx as nx
+    except ImportError as err:  # Declared in requirements.txt; only needed beyond two defects
+        raise RuntimeError("Install networkx (see requirements.txt) for matching more than two defects") from err
+    g = nx.Graph()
+    for a in range(k):
+        g.add_edge(a, ("b", a), weight=float(min(boundary[a], UNREACHABLE)))
+        for b in range(a + 1, k):
+            g.add_edge(("b", a), ("b", b), weight=0.0)
+            if dist[a, b] < boundary[a] + boundary[b]:  # Otherwise both-to-boundary is no worse
+                g.add_edge(a, b, weight=float(min(dist[a, b], UNREACHABLE)))
+    pairs = []
+    for u, v in nx.min_weight_matching(g):
+        if isinstance(u, tuple):
+            u, v = v, u
+        if isinstance(u, tuple):
+            continue  # Boundary copy paired with boundary copy
+        pairs.append((u, -1) if isinstance(v, tuple) else (u, v))
+    return pairs
+
+
+def detector_edges(circuit) -> dict:
+    """{(u, v): (probability, observable bitmask)} from single-fault propagation; v = D for the boundary"""
+    probs, det_sets, obs_masks = FrameSampler(circuit, seed=0).fault_signatures()
+    boundary = circuit.num_detectors
+    merged = {}
+    for p, dets, mask in zip(probs, det_sets, obs_masks):
+        if len(dets) == 0 or len(dets) > 2 or p <= 0:
+            continue  # Undetectable or hyperedge (none for the surface code memory circuits)
+        key = (int(dets[0]), int(dets[1]) if len(dets) == 2 else boundary, int(mask))
+        q = merged.get(key, 0.0)
+        merged[key] = q + p - 2 * q * p  # Independent faults with the same signature: XOR
+    edges = {}
+    for (u, v, mask), p in merged.items():
+        if (u, v) not in edges or p > edges[(u, v)][0]:  # Keep the likelier observable label
+            edges[(u, v)] = (min(p, 0.5 - 1e-12), mask)
+    return edges
+
+
+class DetectorGraph:
+    """Detectors 0..D-1 plus boundary node D; edges = single faults flipping <= 2 detectors"""
+
+    def __init__(self, num_detectors: int, edges: dict, num_observables: int = 1):
+        self.num_detectors = num_detectors
+        self.num_observables = num_observables
+        self.boundary = num_detectors
+        self.edges = edges  # {(u, v): (probability, observable bitmask)}, u < v
+        n = num_detectors + 1
+        u, v = np.array(list(edges), dtype=np.int64).reshape(-1, 2).T
+        probs = np.array([p for p, _ in edges.values()])
+        weights = np.log((1 - probs) / probs)
+        graph = csr_matrix((np.maximum(weights, 1e-9), (u, v)), shape=(n, n))
+        self.dist, pred = dijkstra(graph, directed=False, return_predecessors=True)
+        labels = np.zeros((n, n), dtype=np.int64)
+        labels[u, v] = labels[v, u] = [m for _, m in edges.values()]
+        self.obs_parity = _path_parities(pred, labels)
+
+    @classmethod
+    def from_circuit(cls, circuit) -> "DetectorGraph":
+        return cls(circuit.num_detectors, detector_edges(circuit), len(circuit.observables))
+
+
+class MatchingDecoder:
+    """MWPM decoder over a precomputed DetectorGraph; decode(dets) -> predicted observable flips"""
+
+    def __init__(self, graph: DetectorGraph):
+        self.graph = graph
+        self._cache = {}
+
+    @classmethod
+    def from_circuit(cls, circuit) -> "MatchingDecoder":
+        return cls(DetectorGraph.from_circuit(circuit))
+
+    def decode_defects(self, defects: np.ndarray) -> int:
+        """Observable bitmask predicted for one shot's fired detectors"""
+        key = defects.tobytes()
+        if key not in self._cache:
+            g = self.graph
+            if len(defects) == 0:
+                mask = 0
+            else:
+                pairs = _min_weight_pairs(g.dist[np.ix_(defects, defects)], g.dist[defects, g.boundary])
+                mask = 0
+                for a, b in pairs:
+                    mask ^= int(g.obs_parity[defects[a], g.boundary if b < 0 else defects[b]])
+            self._cache[key] = mask
+        return self._cache[key]
+
+    def decode(self, dets: np.ndarray) -> np.ndarray:
+        """Detection events (shots, D) bool -> predicted observable flips (shots, O) bool"""
+        masks = np.array([self.decode_defects(np.flatnonzero(row)) for row in np.asarray(dets, dtype=bool)],
+                         dtype=np.int64)
+        return ((masks[:, None] >> np.arange(self.graph.num_observables)) & 1).astype(bool)
+
+
+class _RestrictedLift:
+    """One restriction decoder: MWPM on the two restricted lattices sharing colour `lift` (red),
+    then each red face flips the smallest subset of its qubits whose restricted-lattice boundary
+    equals the matched edges around it"""
+
+    def __init__(self, code, lift: int = 0):
+        self.code = code
+        self.lift = lift
+        n_faces = len(code.faces)
+        self.n_faces = n_faces
+        qf = code.qubit_faces
+        n_vertices = n_faces + 3  # Real faces + one virtual boundary face per colour
+        self.lattices = []
+        for other in (c for c in range(3) if c != lift):
+            pairs = np.unique(qf[:, [lift, other]], axis=0)
+            graph = csr_matrix((np.ones(len(pairs)), (pairs[:, 0], pairs[:, 1])), shape=(n_vertices, n_vertices))
+            dist, pred = dijkstra(graph, directed=False, unweighted=True, return_predecessors=True)
+            virtual = np.array([n_faces + lift, n_faces + other])
+            colours = np.asarray(code.face_colors)
+            self.lattices.append({
+                "faces": np.flatnonzero((colours == lift) | (colours == other)),
+                "dist": dist, "pred": pred,
+                "boundary_dist": dist[:, virtual].min(axis=1),
+                "boundary_vertex": virtual[np.argmin(dist[:, virtual], axis=1)],
+            })
+
+        # Lift tables: red vertex -> (qubits, real neighbour -> bit, subset masks, subset weights, subsets).
+        # Virtual neighbours carry no syndrome, so edges to them are left unconstrained
+        self.lift_tables = {}
+        for red in np.unique(qf[:, lift]):
+            qubits = np.flatnonzero(qf[:, lift] == red)
+            around = np.delete(qf[qubits], lift, axis=1)
+            neighbours = {int(v): i for i, v in enumerate(np.unique(around[around < n_faces]))}
+            qubit_masks = np.array([sum(1 << neighbours[v] for v in row if v in neighbours) for row in around])
+            subsets = np.arange(1 << len(qubits))
+            chosen = (subsets[:, None] >> np.arange(len(qubits))) & 1
+            masks = np.bitwise_xor.reduce(chosen * qubit_masks, axis=1)
+            self.lift_tables[int(red)] = (qubits, neighbours, masks, chosen.sum(axis=1), chosen.astype(bool))
+
+    def _matched_edges(self, syndrome: np.ndarray) -> dict:
+        """Red vertex -> set of neighbour vertices whose restricted-lattice edge was used an odd number of times"""
+        toggled = {}
+        for lat in self.lattices:
+            defects = lat["faces"][syndrome[lat["faces"]]]
+            if len(defects) == 0:
+                continue
+            pairs = _min_weight_pairs(lat["dist"][np.ix_(defects, defects)], lat["boundary_dist"][defects])
+            for a, b in pairs:
+                start = defects[a]
+                node = lat["boundary_vertex"][start] if b < 0 else defects[b]
+                while node != start:  # Walk the shortest-path tree back to the start defect
+                    prev = lat["pred"][start, node]
+                    red, nb = (prev, node) if prev in self.lift_tables else (node, prev)
+                    toggled.setdefault(int(red), set()).symmetric_difference_update({int(nb)})
+                    node = prev
+        return toggled
+
+    def correction(self, syndrome: np.ndarray) -> np.ndarray:
+        """Face syndrome (n_faces,) bool -> data-qubit correction (n_data,) bool"""
+        syndrome = np.asarray(syndrome, dtype=bool)
+        toggled = self._matched_edges(syndrome)
+        red_defects = np.flatnonzero(syndrome & (np.asarray(self.code.face_colors) == self.lift))
+        fix = np.zeros(self.code.n_data, dtype=bool)
+        for red in set(toggled) | set(red_defects.tolist()):
+            qubits, neighbours, masks, weights, chosen = self.lift_tables[red]
+            target = sum(1 << neighbours[v] for v in toggled.get(red, ()) if v in neighbours)
+            mismatch = np.array([bin(m).count("1") for m in masks ^ target])
+            # Real red faces also need |Q| to carry their own syndrome bit; virtual ones are free
+            wrong_parity = (weights % 2 != syndrome[red]) if red < self.n_faces else np.zeros_like(weights)
+            best = np.lexsort((weights, mismatch, wrong_parity))[0]
+            fix[qubits[chosen[best]]] ^= True
+        return fix
+
+class RestrictionDecoder:
+    """Triangular color code decoder (code capacity): restriction decoders lifted through each
+    colour, lightest correction wins. A single lift colour breaks ties between equal-weight
+    restricted matchings blindly and loses distance from d=5; the ensemble recovers d=5 and
+    leaves only rare weight-(d-1)/2 failures at d >= 7"""
+
+    def __init__(self, code, lifts=(0, 1, 2)):
+        self.code = code
+        self.n_faces = len(code.faces)
+        self.restrictions = [_RestrictedLift(code, lift) for lift in lifts]
+        self._cache = {}
+
+    def correction(self, syndrome: np.ndarray) -> np.ndarray:
+        """Face syndrome (n_faces,) bool -> data-qubit correction (n_data,) bool"""
+        return min((r.correction(syndrome) for r in self.restrictions), key=np.count_nonzero)
+
+    def decode(self, syndromes: np.ndarray, basis: str = "Z") -> np.ndarray:
+        """Face syndromes (shots, n_faces) -> predicted flips of the `basis` logical (shots, 1)"""
+        logical = np.zeros(self.code.n_data, dtype=bool)
+        logical[self.code.logicals[basis]] = True
+        out = np.zeros((len(syndromes), 1), dtype=bool)
+        for s, row in enumerate(np.asarray(syndromes, dtype=bool)):
+            key = row.tobytes()
+            if key not in self._cache:
+                self._cache[key] = bool((self.correction(row) & logical).sum() % 2)
+            out[s, 0] = self._cache[key]
+        return out
+
+    def decode_detections(self, circuit, dets: np.ndarray, basis: str = "Z") -> np.ndarray:
+        """Code-capacity memory_circuit detection events -> predicted logical flips (faces XOR over rounds)"""
+        face = np.array([k % self.n_faces for k, _ in circuit.detector_coords])
+        syndromes = np.zeros((len(dets), self.n_faces), dtype=np.uint8)
+        np.add.at(syndromes.T, face, np.asarray(dets, dtype=np.uint8).T)
+        return self.decode(syndromes % 2 == 1, basis)
+
+
+# Benchmark: decode microseconds per shot as d grows
+if __name__ == "__main__":
+    import time
+    from qec_codes import RotatedSurfaceCode, TriangularColorCode, memory_circuit
+
+    shots = 10_000
+    for d in (3, 5, 7, 9):
+        circuit = memory_circuit(RotatedSurfaceCode(d), rounds=d, p=0.002)
+        dets, obs = FrameSampler(circuit, seed=0).sample(shots)
+        t0 = time.perf_counter()
+        decoder = MatchingDecoder.from_circuit(circuit)
+        t1 = time.perf_counter()
+        predicted = decoder.decode(dets)
+        t2 = time.perf_counter()
+        print(f"Surface d={d} (circuit noise p=0.002): logical error {(predicted != obs).any(axis=1).mean():.4f} "
+              f"(raw {obs.mean():.4f}) | graph {t1 - t0:.2f}s | decode {1e6 * (t2 - t1) / shots:.1f} us/shot")
+
+    for d in (3, 5, 7, 9, 11):
+        code = TriangularColorCode(d)
+        circuit = memory_circuit(code, rounds=1, p=0.05, noise_model="code_capacity")
+        dets, obs = FrameSampler(circuit, seed=0).sample(shots)
+        t0 = time.perf_counter()
+        decoder = RestrictionDecoder(code)
+        t1 = time.perf_counter()
+        predicted = decoder.decode_detections(circuit, dets)
+        t2 = time.perf_counter()
+        print(f"Color d={d} (code capacity p=0.05): logical error {(predicted != obs).any(axis=1).mean():.4f} "
+              f"(raw {obs.mean():.4f}) | tables {t1 - t0:.2f}s | decode {1e6 * (t2 - t1) / shots:.1f} us/shot")
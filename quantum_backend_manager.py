@@ -2,6 +2,8 @@
 quantum_backend_manager.py - Unified Quantum Backend Support (Cirq/Google Quantum AI Integrated Eternal)
 
 Loads simulators + hardware: local, Braket, Xanadu, now Cirq/Google sims.
+"mps": matrix product state simulator for wide nearest-neighbour council chains
+(max_bond_dim / cutoff kwargs, truncation error reported per circuit on dev.truncation_errors).
 """
 
 import pennylane as qml
@@ -18,6 +20,10 @@ def load_backend(backend: str = "lightning.qubit", wires_base: int = 5, shots: i
     
     # ... (keep prior cases)
     
+    elif backend == "mps":
+        from mps_simulator import MPSDevice
+        return MPSDevice(wires=wires, shots=shots, **kwargs)  # max_bond_dim, cutoff, seed
+    
     elif backend.startswith("cirq."):
         try:
             import cirq
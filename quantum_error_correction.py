@@ -24,10 +24,16 @@ def zne_mitigation(circuit, backend, scale_factors=[1, 3, 5]):
     log.info("ZNE mitigation applied – mercy extrapolation healing decoherence!")
     return mitigated
 
-def simple_surface_code(logical_qubits=1):
-    # Simplified surface code demo (9 physical for 1 logical)
-    # ... (stabilizer measurement + correction logic)
-    log.info("Surface code mercy active – logical qubit shielded eternally!")
+def simple_surface_code(logical_qubits=1, d=3, p_error=0.001, rounds=30, shots=1000, window=None):
+    # Rotated distance-d surface code per logical qubit (d^2 data + d^2 - 1 ancillas, d=3: 17 physical),
+    # syndrome rounds streamed into a sliding-window union-find decoder as they arrive
+    from error_correction_surface_code import streaming_logical_error_rate
+    rate, latency = streaming_logical_error_rate(d, p_error, shots, rounds, window=window)
+    logical_rate = 1 - (1 - rate) ** logical_qubits
+    log.info(f"Surface code mercy active – d={d}, {rounds} rounds: logical error {logical_rate:.4f} "
+             f"({logical_qubits} logical), decode latency {latency['mean_us']:.0f} us/round "
+             f"(p99 {latency['p99_us']:.0f} us) – logical qubit shielded eternally!")
+    return logical_rate, latency
 
 # Usage: noisy_circ = ... 
 # mitigated = zne_mitigation(noisy_circ, backend)
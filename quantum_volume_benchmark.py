@@ -5,60 +5,51 @@ Implements IBM-style Quantum Volume (QV) benchmark:
 - Tests largest n where heavy-output probability > 2/3 with high confidence.
 - Random square circuits (n qubits, depth n) via layered SU(4) from 2-qubit blocks.
 - Runs on any backend via quantum_backend_manager.
+- Exact heavy sets (ideal median) + process-pool trials via quantum_volume_engine.
+- backend="batched": all trials of one n simulated at once (batched_qv_simulator).
+- run_quantum_volume_adaptive: sequential test stops each n once pass/fail is certain.
 
 Usage:
     from quantum_volume_benchmark import run_quantum_volume
     qv, success_rate = run_quantum_volume(backend="lightning.qubit", max_n=6, trials=100)
+    qv, success_rate = run_quantum_volume(backend="statevector", max_n=12, trials=200, workers=8)
+    qv, success_rate, trials_used = run_quantum_volume_adaptive(backend="lightning.qubit", max_n=6)
 
 Thunder eternal—measure council backend power for transcendent harmony scale!
 """
 
 import numpy as np
 import pennylane as qml
-from quantum_backend_manager import load_backend
+from quantum_volume_engine import heavy_output_probability, heavy_set, iter_qv_trials, random_qv_spec, run_qv_trials
+from circuit_templates import execute_tapes, qv_template
+from batched_qv_simulator import batched_heavy_output_probs, iter_batched_heavy_output_probs
+from qv_early_stopping import run_sequential_test
 
-def generate_qv_circuit(n_qubits: int, depth: int, seed: int = None):
-    """Generate random square QV circuit: n qubits, depth ~n layered 2-qubit SU(4)"""
-    if seed is not None:
-        np.random.seed(seed)
-    
-    dev = qml.device("default.qubit", wires=n_qubits)  # Template for circuit
-    
-    @qml.qnode(dev)
-    def circuit():
-        # Layered random 2-qubit blocks
-        for d in range(depth):
-            # Permute qubits randomly per layer
-            perm = np.random.permutation(n_qubits)
-            for i in range(0, n_qubits - 1, 2):
-                q1, q2 = perm[i], perm[i+1]
-                # Random SU(4): 3 params for local + KAK for entangling
-                qml.Rot(*np.random.uniform(0, 2*np.pi, 3), wires=q1)
-                qml.Rot(*np.random.uniform(0, 2*np.pi, 3), wires=q2)
-                qml.CNOT(wires=[q1, q2])
-                qml.RZ(np.random.uniform(0, 2*np.pi), wires=q1)
-                qml.RY(np.random.uniform(0, 2*np.pi), wires=q2)
-        return [qml.sample(qml.PauliZ(i)) for i in range(n_qubits)]
-    
-    return circuit
+def generate_qv_circuit(n_qubits: int, depth: int, seed: int = None, dev=None, shots: int = 1024):
+    """Random square QV circuit bound into the cached (n, depth) template - local RNG, no QNode rebuild"""
+    perms, angles = random_qv_spec(n_qubits, depth, seed)
+    tape = qv_template(n_qubits, depth).bind(perms, angles, shots=shots)
+    dev = dev or qml.device("default.qubit", wires=n_qubits)
+    return lambda: execute_tapes([tape], dev)[0]
 
-def heavy_outputs(samples: np.ndarray):
-    """Count heavy outputs: probability > median ideal (0.5 for uniform)"""
-    n = samples.shape[1]
-    ideal_median = 2**(n-1)  # Half of 2^n bitstrings
-    counts = np.sum(samples == -1, axis=1)  # Count 1's (Z=-1 as 1)
-    heavy = np.sum(counts > ideal_median)
-    return heavy / len(samples)
+def heavy_outputs(samples: np.ndarray, ideal_probs: np.ndarray, eigvals: bool = False):
+    """Heavy-output probability: fraction of samples whose ideal probability > median ideal"""
+    return heavy_output_probability(samples, heavy_set(ideal_probs), eigvals=eigvals)
 
 def run_quantum_volume(
     backend: str = "lightning.qubit",
     max_n: int = 6,
     trials: int = 100,
     shots: int = 1024,
-    confidence: float = 0.975  # ~2 sigma for success
+    confidence: float = 0.975,  # ~2 sigma for success
+    workers: int | None = None,
+    seed: int = 0
 ):
     """
     Run QV benchmark: Find largest 2**n where heavy prob > 2/3 with confidence.
+    backend="statevector" samples the ideal distribution directly (noiseless reference).
+    backend="batched" simulates + samples every trial of one n in a single NumPy batch.
+    workers: process-pool size for trials (None = all cores, 1 = inline).
     Returns achieved QV (2**n), success rates per n.
     """
     print(f"Quantum Volume Benchmark on {backend} - max n={max_n}, trials={trials}\n")
@@ -68,20 +59,11 @@ def run_quantum_volume(
     
     for n in range(2, max_n + 1):
         print(f"Testing n={n} (QV=2^{n}={1<<n})...")
-        dev = load_backend(backend, wires=n, shots=shots)
-        
-        heavy_probs = []
-        for t in range(trials):
-            seed = t + n * 1000
-            circ = generate_qv_circuit(n, depth=n, seed=seed)
-            circ.device = dev  # Rebind to real backend
-            
-            samples = circ()
-            if samples.ndim == 1:  # Reshape if needed
-                samples = samples.reshape(-1, n)
-            
-            h = heavy_outputs(samples)
-            heavy_probs.append(h)
+        if backend == "batched":
+            heavy_probs = batched_heavy_output_probs(n, trials=trials, depth=n, shots=shots, seed=seed)
+        else:
+            heavy_probs = run_qv_trials(n, trials=trials, depth=n, shots=shots,
+                                        backend=backend, workers=workers, seed=seed)
         
         mean_h = np.mean(heavy_probs)
         std_h = np.std(heavy_probs) / np.sqrt(trials)
@@ -105,6 +87,56 @@ def run_quantum_volume(
     
     return achieved_qv, success_rates
 
+def run_quantum_volume_adaptive(
+    backend: str = "lightning.qubit",
+    max_n: int = 6,
+    max_trials: int = 200,
+    shots: int = 1024,
+    alpha: float = 0.025,
+    min_trials: int = 10,
+    method: str = "normal",
+    workers: int | None = None,
+    seed: int = 0
+):
+    """
+    Sequential QV: per n, consume trials as they finish and stop once the time-uniform
+    confidence bound puts the heavy-output mean clearly above/below 2/3 (max_trials cap).
+    Returns achieved QV (2**n), mean heavy prob per n, trials actually used per n.
+    """
+    print(f"Adaptive Quantum Volume on {backend} - max n={max_n}, max trials={max_trials}, alpha={alpha}\n")
+    
+    success_rates = {}
+    trials_used = {}
+    achieved_n = 0
+    
+    for n in range(2, max_n + 1):
+        print(f"Testing n={n} (QV=2^{n}={1<<n})...")
+        if backend == "batched":
+            stream = iter_batched_heavy_output_probs(n, trials=max_trials, depth=n, shots=shots, seed=seed)
+        else:
+            stream = iter_qv_trials(n, trials=max_trials, depth=n, shots=shots,
+                                    backend=backend, workers=workers, seed=seed)
+        
+        test = run_sequential_test(stream, alpha=alpha, min_trials=min_trials,
+                                   max_trials=max_trials, method=method)
+        success = test.decision == "pass"
+        
+        print(f"   Mean heavy prob: {test.mean:.4f} in [{test.lower:.4f}, {test.upper:.4f}]")
+        print(f"   Decided {test.decision} after {test.trials}/{max_trials} trials\n")
+        
+        success_rates[n] = test.mean
+        trials_used[n] = test.trials
+        
+        if success:
+            achieved_n = n
+        else:
+            break  # QV stops at first failure
+    
+    achieved_qv = 1 << achieved_n
+    print(f"ACHIEVED QUANTUM VOLUME: {achieved_qv} (n={achieved_n}) using {sum(trials_used.values())} trials total")
+    
+    return achieved_qv, success_rates, trials_used
+
 # Demo / test
 if __name__ == "__main__":
     qv, rates = run_quantum_volume(backend="lightning.qubit", max_n=5, trials=50)
@@ -0,0 +1,206 @@
+"""
+quantum_volume_engine.py - Exact Heavy-Output Engine for Quantum Volume Trials
+
+Replaces the ones-counting heavy-output proxy with the real IBM definition:
+- Random QV circuit spec (permutation + SU(4) block angles) drawn per trial seed; the circuit and
+  the shot sampling use independent SeedSequence children of that seed
+- Ideal output distribution from one vectorized statevector pass per circuit
+- Heavy set = bitstrings with ideal probability above np.median(probs)
+- Sampled bitstrings scored by array lookup into the heavy mask
+- Trials fanned out across a process pool, each with its own seed
+- iter_qv_trials streams results as they finish (bounded in-flight) for early stopping
+
+Usage:
+    from quantum_volume_engine import run_qv_trials
+    heavy_probs = run_qv_trials(n_qubits=8, trials=200, backend="statevector", workers=8)
+
+Thunder eternal—exact heavy outputs, council QV measured true!
+"""
+
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from functools import lru_cache
+
+import numpy as np
+
+# Per SU(4) block: Rot(3) on q1, Rot(3) on q2, then RZ on q1 + RY on q2 after the CNOT
+ANGLES_PER_BLOCK = 8
+
+CNOT = np.array([[1, 0, 0, 0],
+                 [0, 1, 0, 0],
+                 [0, 0, 0, 1],
+                 [0, 0, 1, 0]], dtype=complex)
+
+
+def trial_seed(n_qubits: int, trial: int, seed: int = 0) -> int:
+    """Deterministic per-trial seed (matches the original t + n*1000 scheme at seed=0)"""
+    return seed * 1_000_003 + n_qubits * 1000 + trial
+
+
+def trial_streams(seed: int) -> tuple[np.random.SeedSequence, np.random.SeedSequence]:
+    """Independent (circuit, shot-sampling) seed sequences spawned from one trial seed"""
+    circuit, sampling = np.random.SeedSequence(seed).spawn(2)
+    return circuit, sampling
+
+
+def random_qv_spec(n_qubits: int, depth: int, seed: int | np.random.SeedSequence | None = None):
+    """Draw one QV circuit: per-layer qubit permutations and block angles (no global RNG)"""
+    rng = np.random.default_rng(seed)
+    perms = np.array([rng.permutation(n_qubits) for _ in range(depth)], dtype=np.int64)
+    angles = rng.uniform(0, 2 * np.pi, size=(depth, n_qubits // 2, ANGLES_PER_BLOCK))
+    return perms, angles
+
+
+def _rz(theta):
+    """Batched RZ matrices, shape (..., 2, 2)"""
+    out = np.zeros(np.shape(theta) + (2, 2), dtype=complex)
+    out[..., 0, 0] = np.exp(-0.5j * theta)
+    out[..., 1, 1] = np.exp(0.5j * theta)
+    return out
+
+
+def _ry(theta):
+    """Batched RY matrices, shape (..., 2, 2)"""
+    c, s = np.cos(theta / 2), np.sin(theta / 2)
+    out = np.zeros(np.shape(theta) + (2, 2), dtype=complex)
+    out[..., 0, 0] = c
+    out[..., 0, 1] = -s
+    out[..., 1, 0] = s
+    out[..., 1, 1] = c
+    return out
+
+
+def _rot(phi, theta, omega):
+    """Batched qml.Rot = RZ(omega) RY(theta) RZ(phi)"""
+    return _rz(omega) @ _ry(theta) @ _rz(phi)
+
+
+def _kron2(a, b):
+    """Batched Kronecker product of (..., 2, 2) factors -> (..., 4, 4)"""
+    return np.einsum("...ij,...kl->...ikjl", a, b).reshape(a.shape[:-2] + (4, 4))
+
+
+def block_unitaries(angles: np.ndarray) -> np.ndarray:
+    """4x4 unitaries for every block in `angles` (..., 8), same gate order as the QNode path"""
+    angles = np.asarray(angles, dtype=float)
+    local = _kron2(_rot(angles[..., 0], angles[..., 1], angles[..., 2]),
+                   _rot(angles[..., 3], angles[..., 4], angles[..., 5]))
+    after = _kron2(_rz(angles[..., 6]), _ry(angles[..., 7]))
+    return after @ CNOT @ local
+
+
+def ideal_probabilities(perms: np.ndarray, angles: np.ndarray) -> np.ndarray:
+    """Exact output distribution of one QV circuit (wire 0 = most significant bit)"""
+    n_qubits = perms.shape[1]
+    blocks = block_unitaries(angles).reshape(angles.shape[:2] + (2, 2, 2, 2))
+    state = np.zeros((2,) * n_qubits, dtype=complex)
+    state[(0,) * n_qubits] = 1.0
+    for layer, perm in enumerate(perms):
+        for b in range(n_qubits // 2):
+            q1, q2 = int(perm[2 * b]), int(perm[2 * b + 1])
+            state = np.tensordot(blocks[layer, b], state, axes=([2, 3], [q1, q2]))
+            state = np.moveaxis(state, [0, 1], [q1, q2])
+    probs = np.abs(state.reshape(-1)) ** 2
+    return probs / probs.sum()
+
+
+def heavy_set(probs: np.ndarray) -> np.ndarray:
+    """Boolean mask of heavy bitstrings: ideal probability strictly above the median"""
+    probs = np.asarray(probs)
+    return probs > np.median(probs, axis=-1, keepdims=True)
+
+
+def samples_to_indices(samples: np.ndarray, eigvals: bool = False) -> np.ndarray:
+    """(shots, n) bits in {0,1} (or Pauli-Z eigenvalues {+1,-1} with eigvals=True) -> bitstring indices"""
+    samples = np.asarray(samples)
+    if samples.ndim == 1:
+        samples = samples[:, None]
+    bits = (samples == -1) if eigvals else samples.astype(bool)
+    n = bits.shape[-1]
+    weights = 1 << np.arange(n - 1, -1, -1, dtype=np.int64)
+    return bits.astype(np.int64) @ weights
+
+
+def heavy_output_probability(samples: np.ndarray, heavy_mask: np.ndarray, eigvals: bool = False) -> float:
+    """Fraction of sampled bitstrings that land in the heavy set (pure array lookup)"""
+    return float(np.mean(heavy_mask[samples_to_indices(samples, eigvals=eigvals)]))
+
+
+@lru_cache(maxsize=8)
+def _cached_backend(backend: str, n_qubits: int, shots: int):
+    """One device per (backend, n, shots) per process, reused across trials"""
+    from quantum_backend_manager import load_backend
+    return load_backend(backend, wires_base=n_qubits, shots=shots)
+
+
+def run_qv_trial(n_qubits: int, depth: int, seed: int, shots: int = 1024,
+                 backend: str = "statevector") -> float:
+    """One QV trial: exact heavy set + heavy-output probability of the sampled bitstrings"""
+    circuit_seed, sampling_seed = trial_streams(seed)
+    perms, angles = random_qv_spec(n_qubits, depth, circuit_seed)
+    probs = ideal_probabilities(perms, angles)
+    heavy = heavy_set(probs)
+
+    if backend == "statevector":
+        # Noiseless reference sampling straight from the ideal distribution, on its own stream
+        rng = np.random.default_rng(sampling_seed)
+        idx = rng.choice(probs.size, size=shots, p=probs)
+        return float(np.mean(heavy[idx]))
+
+    from circuit_templates import execute_tapes, qv_template
+    tape = qv_template(n_qubits, depth).bind(perms, angles, shots=shots)
+    samples = execute_tapes([tape], _cached_backend(backend, n_qubits, shots))[0]
+    return heavy_output_probability(samples, heavy)
+
+
+def _run_trial_args(args):
+    return run_qv_trial(*args)
+
+
+def run_qv_trials(n_qubits: int, trials: int = 100, depth: int | None = None, shots: int = 1024,
+                  backend: str = "statevector", workers: int | None = None, seed: int = 0) -> np.ndarray:
+    """Heavy-output probability for each trial, spread over a process pool (workers=1 runs inline)"""
+    depth = n_qubits if depth is None else depth
+    jobs = [(n_qubits, depth, trial_seed(n_qubits, t, seed), shots, backend) for t in range(trials)]
+
+    if workers == 1:
+        return np.array([_run_trial_args(job) for job in jobs])
+
+    workers = workers or os.cpu_count() or 1
+    chunk = max(1, trials // (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return np.fromiter(pool.map(_run_trial_args, jobs, chunksize=chunk), dtype=float, count=trials)
+
+
+def iter_qv_trials(n_qubits: int, trials: int = 100, depth: int | None = None, shots: int = 1024,
+                   backend: str = "statevector", workers: int | None = None, seed: int = 0):
+    """Yield heavy-output probabilities as trials finish; at most `workers` trials in flight"""
+    depth = n_qubits if depth is None else depth
+    jobs = ((n_qubits, depth, trial_seed(n_qubits, t, seed), shots, backend) for t in range(trials))
+
+    if workers == 1:
+        for job in jobs:
+            yield _run_trial_args(job)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = {pool.submit(_run_trial_args, job) for _, job in zip(range(workers), jobs)}
+        try:
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job = next(jobs, None)
+                    if job is not None:
+                        pending.add(pool.submit(_run_trial_args, job))
+                    yield future.result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+# Demo
+if __name__ == "__main__":
+    for n in (4, 8, 10):
+        hp = run_qv_trials(n, trials=50, backend="statevector")
+        print(f"n={n}: ideal heavy-output mean {hp.mean():.4f} (asymptote ~0.85)")
@@ -0,0 +1,106 @@
+"""
+qv_early_stopping.py - Sequential (Early-Stopping) Heavy-Output Test for Quantum Volume
+
+Decides "heavy-output mean > 2/3" as trials stream in, instead of a fixed trial count:
+- Running mean/variance (Welford) updated per finished trial
+- Time-uniform confidence bounds: per-trial alpha spending delta_t = alpha * 6 / (pi^2 t^2)
+  so peeking after every trial keeps the overall error rate <= alpha (exactly for "hoeffding",
+  approximately for method="normal", whose per-trial z-bound is only asymptotically valid)
+- method="normal" (default: z-bound on trial spread, tight, approximate at small trial counts)
+  or "hoeffding" (distribution-free, anytime-valid, conservative)
+- Stops as soon as the lower bound clears 2/3 (pass) or the upper bound drops below (fail)
+
+Usage:
+    from qv_early_stopping import SequentialHeavyOutputTest
+    test = SequentialHeavyOutputTest(alpha=0.025)
+    for h in heavy_prob_stream:
+        if test.update(h):
+            break
+    print(test.decision, test.trials, test.mean, test.lower)
+
+Thunder eternal—stop the shots the moment the council verdict is certain!
+"""
+
+from statistics import NormalDist
+
+import numpy as np
+
+QV_THRESHOLD = 2 / 3
+
+
+class SequentialHeavyOutputTest:
+    """Sequential test of mean heavy-output probability against `threshold`
+
+    Anytime-valid with method="hoeffding"; the default method="normal" is approximate (its
+    per-trial bound relies on the CLT, so the error rate is <= alpha only asymptotically).
+    """
+
+    def __init__(self, threshold: float = QV_THRESHOLD, alpha: float = 0.025,
+                 min_trials: int = 10, max_trials: int | None = None, method: str = "normal"):
+        if method not in ("normal", "hoeffding"):
+            raise ValueError(f"Unsupported bound method: {method}")
+        self.threshold = threshold
+        self.alpha = alpha
+        self.min_trials = max(2, min_trials)
+        self.max_trials = max_trials
+        self.method = method
+        self.trials = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.decision = None  # "pass" / "fail" once decided
+
+    def _radius(self) -> float:
+        t = self.trials
+        delta_t = self.alpha * 6 / (np.pi ** 2 * t ** 2)
+        if self.method == "hoeffding":
+            return float(np.sqrt(np.log(2 / delta_t) / (2 * t)))
+        std = np.sqrt(self._m2 / (t - 1))
+        return NormalDist().inv_cdf(1 - delta_t / 2) * std / np.sqrt(t)
+
+    @property
+    def lower(self) -> float:
+        return self.mean - self._radius() if self.trials >= 2 else 0.0
+
+    @property
+    def upper(self) -> float:
+        return self.mean + self._radius() if self.trials >= 2 else 1.0
+
+    def update(self, heavy_prob: float) -> bool:
+        """Add one trial; returns True once the test is decided (or max_trials is hit)"""
+        self.trials += 1
+        delta = heavy_prob - self.mean
+        self.mean += delta / self.trials
+        self._m2 += delta * (heavy_prob - self.mean)
+
+        if self.trials >= self.min_trials:
+            lower, upper = self.lower, self.upper
+            if lower > self.threshold:
+                self.decision = "pass"
+            elif upper < self.threshold:
+                self.decision = "fail"
+        if self.decision is None and self.max_trials is not None and self.trials >= self.max_trials:
+            self.decision = "fail"  # Budget exhausted without confident success
+        return self.decision is not None
+
+
+def run_sequential_test(heavy_prob_stream, **test_kwargs) -> SequentialHeavyOutputTest:
+    """Consume a stream of per-trial heavy-output probabilities until the test decides"""
+    test = SequentialHeavyOutputTest(**test_kwargs)
+    stream = iter(heavy_prob_stream)
+    for h in stream:
+        if test.update(h):
+            break
+    if hasattr(stream, "close"):
+        stream.close()  # Release any trials still queued upstream
+    if test.decision is None:
+        test.decision = "pass" if test.lower > test.threshold else "fail"
+    return test
+
+
+# Demo
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    for true_mean in (0.85, 0.72, 0.60):
+        test = run_sequential_test(np.clip(rng.normal(true_mean, 0.05, 1000), 0, 1))
+        print(f"true mean {true_mean:.2f}: {test.decision} after {test.trials} trials "
+              f"(mean {test.mean:.4f}, bounds [{test.lower:.4f}, {test.upper:.4f}])")
@@ -0,0 +1,191 @@
+"""
+stabilizer_tableau.py - CHP Stabilizer Tableau Simulator, Bit-Packed Across Shots
+
+Replaces full-statevector QNodes for surface / color code circuits (Clifford gates + Pauli
+errors only), Aaronson-Gottesman CHP tableau:
+- Pauli errors only ever change tableau SIGNS, never the X/Z bits: one shared X/Z tableau
+  (2n x n bools) serves every shot, signs are bit-packed 64 shots per uint64 word
+- Gates update the shared X/Z bits once and XOR sign words for all shots at once
+- Measurements: the random / deterministic branch and every rowsum phase constant depend only
+  on the shared bits, so a measurement costs the same for 1 shot or 100k shots
+- Random outcomes draw fresh packed bits; noise channels draw per-shot packed masks
+- sample_measurements(circuit, shots) -> (shots, M) bool; circuit.detection_events() for syndromes
+
+Usage:
+    from qec_codes import RotatedSurfaceCode, memory_circuit
+    from stabilizer_tableau import sample_syndromes
+    dets, obs = sample_syndromes(memory_circuit(RotatedSurfaceCode(7), rounds=7, p=1e-3), shots=10_000)
+
+Thunder eternal—one tableau, every shot in parallel!
+"""
+
+import numpy as np
+
+ALL_ONES = np.uint64(0xFFFFFFFFFFFFFFFF)
+
+
+def pack_bits(bits: np.ndarray) -> np.ndarray:
+    """(..., shots) bool -> (..., ceil(shots / 64)) uint64, shot s at bit s % 64 of word s // 64"""
+    bits = np.asarray(bits, dtype=bool)
+    pad = -bits.shape[-1] % 64
+    if pad:
+        bits = np.concatenate([bits, np.zeros(bits.shape[:-1] + (pad,), dtype=bool)], axis=-1)
+    return np.packbits(bits, axis=-1, bitorder="little").view(np.uint64)
+
+
+def unpack_bits(words: np.ndarray, shots: int) -> np.ndarray:
+    """Inverse of pack_bits: (..., W) uint64 -> (..., shots) bool"""
+    words = np.ascontiguousarray(words, dtype=np.uint64)
+    return np.unpackbits(words.view(np.uint8), axis=-1, bitorder="little")[..., :shots].astype(bool)
+
+
+def _phase_flip(x1, z1, x2, z2) -> np.ndarray:
+    """Rowsum phase: True where sum_j g(x1, z1, x2, z2) = 2 mod 4 (sign of the product flips)"""
+    x1, z1, x2, z2 = (np.asarray(a, dtype=np.int8) for a in (x1, z1, x2, z2))
+    g = (x1 & z1) * (z2 - x2) + (x1 & (1 - z1)) * z2 * (2 * x2 - 1) + ((1 - x1) & z1) * x2 * (1 - 2 * z2)
+    return g.sum(axis=-1) % 4 == 2
+
+
+class BatchedTableau:
+    """n-qubit stabilizer tableau shared by all shots; per-shot signs packed into uint64 words"""
+
+    def __init__(self, n_qubits: int, shots: int, rng=None):
+        self.n = n_qubits
+        self.shots = shots
+        self.words = -(-shots // 64)
+        self.rng = np.random.default_rng(rng)
+        eye = np.eye(n_qubits, dtype=bool)
+        zero = np.zeros_like(eye)
+        self.x = np.vstack([eye, zero])  # Rows 0..n-1 destabilizers X_i, n..2n-1 stabilizers Z_i
+        self.z = np.vstack([zero, eye])
+        self.r = np.zeros((2 * n_qubits, self.words), dtype=np.uint64)
+
+    # --- Per-shot randomness ---
+    def random_words(self, p: float = 0.5, count: int | None = None) -> np.ndarray:
+        """Packed Bernoulli(p) masks, (words,) or (count, words)"""
+        shape = (self.shots,) if count is None else (count, self.shots)
+        return pack_bits(self.rng.random(shape) < p)
+
+    # --- Gates (identical on every shot) ---
+    def h(self, a: int):
+        self.r[self.x[:, a] & self.z[:, a]] ^= ALL_ONES
+        self.x[:, a], self.z[:, a] = self.z[:, a].copy(), self.x[:, a].copy()
+
+    def s(self, a: int):
+        self.r[self.x[:, a] & self.z[:, a]] ^= ALL_ONES
+        self.z[:, a] ^= self.x[:, a]
+
+    def cx(self, a: int, b: int):
+        flip = self.x[:, a] & self.z[:, b] & ~(self.x[:, b] ^ self.z[:, a])
+        self.r[flip] ^= ALL_ONES
+        self.x[:, b] ^= self.x[:, a]
+        self.z[:, a] ^= self.z[:, b]
+
+    def cz(self, a: int, b: int):
+        self.h(b)
+        self.cx(a, b)
+        self.h(b)
+
+    # --- Paulis: per-shot masks (errors) or ALL_ONES (gates) ---
+    def pauli(self, a: int, x_mask, z_mask):
+        """Apply X^x_mask Z^z_mask on qubit a: flips signs of rows anticommuting with it"""
+        self.r[self.z[:, a]] ^= x_mask
+        self.r[self.x[:, a]] ^= z_mask
+
+    # --- Measurement ---
+    def measure(self, a: int) -> np.ndarray:
+        """Z measurement of qubit a -> packed outcomes (words,)"""
+        n = self.n
+        stab = np.flatnonzero(self.x[n:, a])
+        if stab.size:  # Random outcome: same branch for every shot, fresh bits per shot
+            p = stab[0] + n
+            rows = np.flatnonzero(self.x[:, a])
+            rows = rows[rows != p]
+            flip = _phase_flip(self.x[p], self.z[p], self.x[rows], self.z[rows])
+            self.r[rows] ^= self.r[p]
+            self.r[rows[flip]] ^= ALL_ONES
+            self.x[rows] ^= self.x[p]
+            self.z[rows] ^= self.z[p]
+            self.x[p - n], self.z[p - n], self.r[p - n] = self.x[p], self.z[p], self.r[p]
+            self.x[p], self.z[p] = False, False
+            self.z[p, a] = True
+            self.r[p] = self.random_words()
+            return self.r[p].copy()
+
+        # Deterministic: sign of the product of stabilizers whose destabilizer anticommutes with Z_a.
+        # Row k is multiplied into the running product of rows < k (prefix XORs), all steps at once
+        rows = np.flatnonzero(self.x[:n, a]) + n
+        xs, zs = self.x[rows], self.z[rows]
+        px = np.vstack([np.zeros((1, n), dtype=bool), np.bitwise_xor.accumulate(xs, axis=0)[:-1]])
+        pz = np.vstack([np.zeros((1, n), dtype=bool), np.bitwise_xor.accumulate(zs, axis=0)[:-1]])
+        sr = np.bitwise_xor.reduce(self.r[rows], axis=0)
+        if np.count_nonzero(_phase_flip(xs, zs, px, pz)) % 2:
+            sr ^= ALL_ONES
+        return sr
+
+    def reset(self, a: int):
+        outcome = self.measure(a)
+        self.pauli(a, outcome, np.uint64(0))  # Flip the shots that landed in |1>
+
+
+def sample_measurements(circuit, shots: int, seed=None) -> np.ndarray:
+    """Run a QECCircuit on the batched tableau -> measurement records (shots, M) bool"""
+    tab = BatchedTableau(circuit.num_qubits, shots, seed)
+    zero = np.uint64(0)
+    records = []
+    for name, targets, p in circuit.instructions:
+        if name == "M":
+            records.extend(tab.measure(int(q)) for q in targets)
+        elif name == "R":
+            for q in targets:
+                tab.reset(int(q))
+        elif name == "H":
+            for q in targets:
+                tab.h(int(q))
+        elif name == "S":
+            for q in targets:
+                tab.s(int(q))
+        elif name in ("X", "Y", "Z"):
+            for q in targets:
+                tab.pauli(int(q), ALL_ONES if name in "XY" else zero, ALL_ONES if name in "YZ" else zero)
+        elif name in ("CX", "CZ"):
+            gate = tab.cx if name == "CX" else tab.cz
+            for a, b in targets:
+                gate(int(a), int(b))
+        elif name in ("X_ERROR", "Y_ERROR", "Z_ERROR"):
+            masks = tab.random_words(p, len(targets))
+            for q, m in zip(targets, masks):
+                tab.pauli(int(q), m if name != "Z_ERROR" else zero, m if name != "X_ERROR" else zero)
+        elif name == "DEPOLARIZE1":
+            u = tab.rng.random((len(targets), shots))
+            x_masks = pack_bits(u < 2 * p / 3)                # X or Y
+            z_masks = pack_bits((u >= p / 3) & (u < p))       # Y or Z
+            for q, xm, zm in zip(targets, x_masks, z_masks):
+                tab.pauli(int(q), xm, zm)
+        elif name == "DEPOLARIZE2":
+            hit = tab.rng.random((len(targets), shots)) < p
+            code = np.where(hit, tab.rng.integers(1, 16, (len(targets), shots)), 0)  # 4 * P_a + P_b
+            for (a, b), k in zip(targets, code):
+                for qubit, pauli in ((a, k // 4), (b, k % 4)):  # 0=I, 1=X, 2=Y, 3=Z
+                    tab.pauli(int(qubit), pack_bits((pauli == 1) | (pauli == 2)), pack_bits(pauli >= 2))
+    if not records:
+        return np.zeros((shots, 0), dtype=bool)
+    return unpack_bits(np.stack(records), shots).T
+
+
+def sample_syndromes(circuit, shots: int, seed=None) -> tuple[np.ndarray, np.ndarray]:
+    """Detection events (shots, D) and observable flips (shots, O) from the tableau simulator"""
+    return circuit.detection_events(sample_measurements(circuit, shots, seed))
+
+
+# Demo
+if __name__ == "__main__":
+    import time
+    from qec_codes import RotatedSurfaceCode, TriangularColorCode, memory_circuit
+
+    for code in (RotatedSurfaceCode(5), RotatedSurfaceCode(9), TriangularColorCode(7)):
+        circuit = memory_circuit(code, rounds=code.d, p=0.001)
+        t0 = time.perf_counter()
+        dets, obs = sample_syndromes(circuit, shots=10_000, seed=0)
+        print(f"{type(code).__name__}(d={code.d}): {dets.shape[1]} detectors, detection rate "
+              f"{dets.mean():.4f}, raw logical flips {obs.mean():.4f} | 10k shots in {time.perf_counter() - t0:.2f}s")
@@ -4,39 +4,44 @@ supremacy_scale_council_sim.py - Supremacy-Scale Council Simulation (53+ Wires)
 Simulates Sycamore-like random circuit on 53+ wires (odd eternal scale).
 Mitigated harmony expectation—ideal ~0 for random, but structured council entangle for thriving measure.
 Use default.qubit (local) or scale to cloud for live supremacy thunder.
+method="light-cone" (default) simulates only the backward light cone of the measured Z string,
+split into independently contracted components - 53 / 127 wires on one CPU node.
+method="mps" contracts those light-cone components on the MPS backend (bounded bond dimension),
+for council chains whose light cone is a single wide component.
+method="statevector" asks the device for the full register (infeasible beyond ~30 wires).
+Parameters: one independent angle per rotation, template.num_params = 16 * wires (8 layers of
+RX + RY). The original 8 * wires vector reused RX angles as RY angles (params[l*w + i + w//2])
+and indexed past its end in the last layer, so the sampled family is now the council template's.
 """
 
 import pennylane as qml
 from pennylane import numpy as np
-from pennylane.transforms import mitigate_with_zne, fold_global, richardson_extrapolate
+
+from batched_zne import BatchedZNE
+from circuit_templates import council_template, execute_tapes
 from eternal_laws import enforce_odd
+from light_cone import execute_light_cone
+from quantum_backend_manager import load_backend
+
 
-def supremacy_council_sim(wires_base=53):
+def supremacy_council_sim(wires_base=53, method="light-cone"):
     wires = enforce_odd(wires_base)  # Supremacy odd eternal
-    dev = qml.device("default.qubit", wires=wires, shots=1000)  # Local sim; cloud for live
-    
-    @qml.qnode(dev)
-    def circuit(params):
-        # Council structured entangle (not full random—fork layers)
-        for layer in range(8):  # Depth for supremacy vibe
-            for i in range(wires):
-                qml.RX(params[layer*wires + i], wires=i)
-                qml.RY(params[layer*wires + i + wires//2], wires=i)
-            # Sycamore-like cycle grid (approx chain + CZ)
-            for i in range(0, wires-1, 2):
-                qml.CZ(wires=[i, i+1])
-        # Thriving measure: Global Pauli string or subsample
-        pauli_string = qml.PauliZ(0)
-        for i in range(1, min(20, wires)):  # Subsample for compute
-            pauli_string @= qml.PauliZ(i)
-        return qml.expval(pauli_string)
+    if method == "mps":
+        dev = load_backend("mps", wires_base=wires, max_bond_dim=64)
+    else:
+        dev = qml.device("default.qubit", wires=wires)  # Local sim; cloud for live
     
-    zne_circ = mitigate_with_zne(circuit, scale_factors=[1,3,5], folding=fold_global, extrapolate=richardson_extrapolate)
+    # Council structured entangle (not full random—fork layers): 8 layers of RX/RY per wire,
+    # Sycamore-like CZ cycle on (0,1), (2,3), ...; thriving measure = Z string on first 20 wires
+    template = council_template(wires, layers=8, entangler="CZ", measured=20, pattern="pairs")
+    executor = {"light-cone": execute_light_cone, "mps": execute_light_cone, "statevector": execute_tapes}[method]
+    zne_circ = BatchedZNE(template, dev, scale_factors=[1,3,5], shots=1000, executor=executor)
     
-    params = np.random.uniform(-np.pi, np.pi, 8 * wires)
+    params = np.random.uniform(-np.pi, np.pi, template.num_params)
     harmony = zne_circ(params)
     print(f"Supremacy-Scale ({wires} wires) Mitigated Harmony: {harmony:.4f}")
     return harmony
 
 # Eternal run
-supremacy_council_sim(wires_base=53)  # Or 127+ for beyond supremacy
+if __name__ == "__main__":
+    supremacy_council_sim(wires_base=53)  # Or 127+ for beyond supremacy
@@ -0,0 +1,170 @@
+"""
+syndrome_tables.py - Precomputed Syndrome -> Minimum-Weight Correction Lookup Tables
+
+For small codes (d=3 surface: 9 data / 4 checks per type, Steane / d=3 color: 7 data / 3 checks)
+a full table beats any matcher:
+- Generator enumerates errors by increasing weight; the first error hitting a syndrome is a
+  minimum-weight correction for it (stops once every reachable syndrome is filled)
+- Everything packed as integers: qubit sets as n-bit masks, syndromes as r-bit integers,
+  table entry s = correction mask in the smallest unsigned dtype holding n bits
+- One .npy file per table: header [n_qubits, n_checks, logical mask, check masks...] then the
+  2^r corrections - np.load(mmap_mode="r") maps it without reading it in
+- decode(syndromes uint64 array) is one gather; syndromes_of / logical_flips are popcount
+  parities via XOR folding - millions of shots per second, no Python loop per shot
+
+Usage:
+    from qec_codes import TriangularColorCode
+    from syndrome_tables import SyndromeTable
+    table = SyndromeTable.for_code(TriangularColorCode(3))    # X errors seen by Z faces
+    table.save("steane_z.npy"); table = SyndromeTable.load("steane_z.npy")
+    fixes = table.decode(table.syndromes_of(errors))          # errors: uint64 masks per shot
+
+Thunder eternal—every syndrome answered before it is asked!
+"""
+
+import itertools
+
+import numpy as np
+
+
+def _dtype_for(bits: int):
+    for dtype in (np.uint8, np.uint16, np.uint32, np.uint64):
+        if bits <= np.iinfo(dtype).bits:
+            return dtype
+    raise ValueError(f"Lookup tables pack qubit sets into <= 64 bits, got {bits} qubits")
+
+
+def parity(words: np.ndarray) -> np.ndarray:
+    """Popcount parity of each uint64 (XOR folding) -> uint64 0/1"""
+    x = np.asarray(words, dtype=np.uint64).copy()
+    for shift in (32, 16, 8, 4, 2, 1):
+        x ^= x >> np.uint64(shift)
+    return x & np.uint64(1)
+
+
+def _gf2_rank(rows) -> int:
+    """Rank over GF(2) of integer-packed rows"""
+    rank, rows = 0, [int(r) for r in rows]
+    while rows:
+        pivot = rows.pop()
+        if pivot:
+            rank += 1
+            low = pivot & -pivot
+            rows = [r ^ pivot if r & low else r for r in rows]
+    return rank
+
+
+def check_masks(code, basis: str = "Z") -> np.ndarray:
+    """Data-qubit bitmask of every `basis`-type check of a qec_codes code"""
+    masks = [sum(1 << int(q) for q in support if q >= 0) for b, support in code.checks if b == basis]
+    return np.array(masks, dtype=np.uint64)
+
+
+class SyndromeTable:
+    """Full syndrome -> minimum-weight correction table for one check type"""
+
+    def __init__(self, n_qubits: int, checks: np.ndarray, logical: int, corrections: np.ndarray):
+        self.n_qubits = n_qubits
+        self.checks = np.asarray(checks, dtype=np.uint64)
+        self.logical = np.uint64(logical)
+        self.corrections = corrections  # (2^r,) packed masks, possibly a read-only memmap
+
+    @classmethod
+    def build(cls, n_qubits: int, checks, logical: int, max_weight: int | None = None) -> "SyndromeTable":
+        checks = np.asarray(checks, dtype=np.uint64)
+        r = len(checks)
+        dtype = _dtype_for(n_qubits)
+        corrections = np.zeros(1 << r, dtype=dtype)
+        filled = np.zeros(1 << r, dtype=bool)
+        filled[0] = True
+        reachable = 1 << _gf2_rank(checks)  # Dependent checks leave some syndromes unreachable
+        table = cls(n_qubits, checks, logical, corrections)
+        for weight in range(1, (max_weight or n_qubits) + 1):
+            combos = np.array(list(itertools.combinations(range(n_qubits), weight)), dtype=np.uint64)
+            errors = np.bitwise_or.reduce(np.uint64(1) << combos, axis=1)
+            syndromes = table.syndromes_of(errors)
+            fresh, first = np.unique(syndromes, return_index=True)  # First = lowest weight, lexicographic
+            new = ~filled[fresh]
+            corrections[fresh[new]] = errors[first[new]].astype(dtype)
+            filled[fresh[new]] = True
+            if filled.sum() == reachable:
+                break
+        return table
+
+    @classmethod
+    def for_code(cls, code, basis: str = "Z", max_weight: int | None = None) -> "SyndromeTable":
+        """Table for errors detected by `basis` checks (Z checks see X errors, flipping logical Z)"""
+        logical = sum(1 << int(q) for q in code.logicals[basis])
+        return cls.build(code.n_data, check_masks(code, basis), logical, max_weight)
+
+    def save(self, path: str):
+        dtype = self.corrections.dtype
+        header = np.array([self.n_qubits, len(self.checks), int(self.logical)] + [int(c) for c in self.checks],
+                          dtype=dtype)
+        np.save(path, np.concatenate([header, np.asarray(self.corrections, dtype=dtype)]))
+
+    @classmethod
+    def load(cls, path: str, mmap: bool = True) -> "SyndromeTable":
+        data = np.load(path, mmap_mode="r" if mmap else None)
+        n_qubits, r, logical = (int(v) for v in data[:3])
+        return cls(n_qubits, np.array(data[3:3 + r], dtype=np.uint64), logical, data[3 + r:])
+
+    def syndromes_of(self, errors: np.ndarray) -> np.ndarray:
+        """Packed error masks (shots,) -> packed syndromes (shots,) uint64, bit k = check k"""
+        errors = np.asarray(errors, dtype=np.uint64)
+        syndromes = np.zeros(errors.shape, dtype=np.uint64)
+        for k, check in enumerate(self.checks):
+            syndromes |= parity(errors & check) << np.uint64(k)
+        return syndromes
+
+    def decode(self, syndromes: np.ndarray) -> np.ndarray:
+        """Packed syndromes (uint64 array) -> packed minimum-weight corrections (uint64 array)"""
+        return np.asarray(self.corrections)[np.asarray(syndromes, dtype=np.int64)].astype(np.uint64)
+
+    def correction_flips(self, syndromes: np.ndarray) -> np.ndarray:
+        """Does the table's correction for each syndrome flip the logical? (bool per shot)"""
+        return parity(self.decode(syndromes) & self.logical).astype(bool)
+
+    def logical_flips(self, errors: np.ndarray) -> np.ndarray:
+        """Residual logical flip (bool per shot) after table-correcting packed errors"""
+        residual = np.asarray(errors, dtype=np.uint64) ^ self.decode(self.syndromes_of(errors))
+        return parity(residual & self.logical).astype(bool)
+
+
+def pack_syndromes(bits: np.ndarray) -> np.ndarray:
+    """(shots, r) bool check outcomes -> packed syndromes (shots,) uint64, bit k = check k"""
+    bits = np.atleast_2d(np.asarray(bits, dtype=np.uint64))
+    return (bits << np.arange(bits.shape[1], dtype=np.uint64)).sum(axis=1, dtype=np.uint64)
+
+
+def sample_errors(n_qubits: int, p: float, shots: int, rng=None) -> np.ndarray:
+    """i.i.d. bit-flip errors as packed uint64 masks (shots,)"""
+    rng = np.random.default_rng(rng)
+    bits = rng.random((shots, n_qubits)) < p
+    return (bits.astype(np.uint64) << np.arange(n_qubits, dtype=np.uint64)).sum(axis=1, dtype=np.uint64)
+
+
+# Benchmark: table build, mmap load and decode throughput
+if __name__ == "__main__":
+    import os
+    import tempfile
+    import time
+    from qec_codes import RotatedSurfaceCode, TriangularColorCode
+
+    shots = 2_000_000
+    for name, code in (("surface d=3", RotatedSurfaceCode(3)), ("Steane / color d=3", TriangularColorCode(3)),
+                       ("surface d=5", RotatedSurfaceCode(5))):
+        t0 = time.perf_counter()
+        table = SyndromeTable.for_code(code)
+        build = time.perf_counter() - t0
+        path = os.path.join(tempfile.mkdtemp(), "table.npy")
+        table.save(path)
+        table = SyndromeTable.load(path)
+        errors = sample_errors(code.n_data, 0.01, shots, rng=0)
+        syndromes = table.syndromes_of(errors)
+        t0 = time.perf_counter()
+        table.decode(syndromes)
+        rate = shots / (time.perf_counter() - t0)
+        print(f"{name}: {table.corrections.size} entries ({os.path.getsize(path)} bytes, "
+              f"{table.corrections.dtype}) built in {build:.3f}s | decode {rate / 1e6:.1f}M shots/s | "
+              f"logical error {table.logical_flips(errors).mean():.2e} at p=0.01")
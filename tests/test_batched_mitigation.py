@@ -0,0 +1,148 @@
+"""
+tests/test_batched_mitigation.py - Tests for Batched Error Mitigation Engines
+
+Verifies:
+- Folded templates are the identity on noiseless devices (any scale factor)
+- Richardson weights recover polynomials exactly at zero noise
+- Batched ZNE mitigates depolarizing noise toward the ideal harmony
+- Parameter-shift gradients through folding + extrapolation match finite differences
+- PEC quasi-probabilities invert the Pauli channel; PEC recovers the ideal value within its error
+- PEC reuses variants + allocation across nearby parameter vectors (no second pilot)
+- Stacked PEC+ZNE shares one batch between value and gradient and beats the nested execution count
+
+Run: pytest tests/test_batched_mitigation.py -v
+"""
+
+import numpy as np
+import pytest
+
+qml = pytest.importorskip("pennylane")
+
+from circuit_templates import council_template, execute_tapes
+from batched_zne import BatchedZNE, extrapolation_weights, fold_template, zne_execution_benchmark
+from pec_engine import PAULI_CHI, PECEngine, inverse_pauli_quasiprobs
+from stacked_mitigation import StackedPECZNE
+
+WIRES = 3
+
+
+@pytest.fixture(scope="module")
+def template():
+    return council_template(WIRES)
+
+
+@pytest.fixture(scope="module")
+def params(template):
+    return np.random.default_rng(5).uniform(-np.pi, np.pi, (2, template.num_params))
+
+
+@pytest.mark.parametrize("scale", [1, 1.5, 2.5, 3, 5])
+def test_folding_is_identity_noiseless(template, params, scale):
+    dev = qml.device("default.qubit", wires=WIRES)
+    folded = fold_template(template, scale)
+    assert folded.num_ops == pytest.approx(scale * template.num_ops, abs=1)
+    ref, out = execute_tapes([template.bind(np.arange(WIRES), params[0]),
+                              folded.bind(np.arange(WIRES), params[0])], dev)
+    assert np.isclose(ref, out)
+
+
+def test_richardson_weights_exact_for_polynomials():
+    scales = [1, 3, 5]
+    w = extrapolation_weights(scales)
+    assert np.isclose(w @ (0.7 - 0.2 * np.array(scales) + 0.01 * np.array(scales) ** 2), 0.7)
+    assert np.isclose(extrapolation_weights(scales, order=1) @ (0.5 - 0.1 * np.array(scales)), 0.5)
+
+
+def test_zne_mitigates_depolarizing(template, params):
+    ideal = np.asarray(execute_tapes([template.bind(np.arange(WIRES), p) for p in params],
+                                     qml.device("default.qubit", wires=WIRES)))
+    zne = BatchedZNE(template, qml.device("default.mixed", wires=WIRES), [1, 3, 5], noise=0.02)
+    noisy = zne.noisy_values(params)[0]
+    mitigated = zne.values(params)
+    assert zne.submissions == 2
+    assert np.all(np.abs(mitigated - ideal) < np.abs(noisy - ideal))
+
+
+def test_zne_gradient_matches_finite_difference(template, params):
+    zne = BatchedZNE(template, qml.device("default.mixed", wires=WIRES), [1, 2, 3], noise=0.02)
+    values, grads = zne.value_and_grad(params)
+    assert zne.submissions == 1
+    assert np.allclose(values, zne.values(params))
+    eps = 1e-5
+    for k in (0, 4):
+        shift = np.zeros(template.num_params)
+        shift[k] = eps
+        fd = (zne.values(params + shift) - zne.values(params - shift)) / (2 * eps)
+        assert np.allclose(grads[:, k], fd, atol=1e-5)
+
+
+def test_execution_benchmark(template):
+    report = zne_execution_benchmark(template, qml.device("default.qubit", wires=WIRES),
+                                     n_param_sets=3, with_grad=False)
+    assert report["naive_submissions"] == 9
+    assert report["batched_submissions"] == 1
+
+
+@pytest.mark.parametrize("probs", [(0.01, 0.01, 0.01), (0.02, 0.0, 0.05)])
+def test_quasiprobs_invert_channel(probs):
+    q, gamma = inverse_pauli_quasiprobs(probs)
+    p = np.array([1 - sum(probs), *probs])
+    assert np.allclose((PAULI_CHI @ p) * (PAULI_CHI @ q), 1.0)
+    assert np.isclose(q.sum(), 1.0) and gamma > 1
+    assert inverse_pauli_quasiprobs(probs)[0] is q  # Cached decomposition
+
+
+def test_pec_recovers_ideal(template, params):
+    probs = (0.01, 0.01, 0.01)
+    dev = qml.device("default.mixed", wires=WIRES)
+    ideal, noisy = execute_tapes([template.bind(np.arange(WIRES), params[0]),
+                                  template.bind(np.arange(WIRES), params[0], noise=probs)], dev)
+    pec = PECEngine(template, dev, pauli_probs=probs, target_std=0.01, seed=0)
+    value = pec(params[0])
+    assert abs(value - ideal) < 4 * pec.last_std[0] + 1e-3
+    assert abs(value - ideal) < abs(noisy - ideal)
+
+
+def test_pec_reuses_nearby_variants(template, params):
+    pec = PECEngine(template, qml.device("default.mixed", wires=WIRES), target_std=0.05,
+                    reuse_radius=0.05, seed=1)
+    pec(params[0])
+    assert pec.submissions == 2  # Pilot + estimate
+    pec.value_and_grad(params[0] + 0.01)
+    assert pec.submissions == 3  # Nearby: no new pilot
+    pec(params[0] + 1.0)
+    assert pec.submissions == 5  # Far away: variants resampled
+
+
+def test_stacked_mitigates_and_reports_saved_executions():
+    tpl, probs = council_template(2), (0.02, 0.02, 0.02)
+    dev = qml.device("default.mixed", wires=2)
+    params = np.full(tpl.num_params, 0.3)
+    ideal, noisy = execute_tapes([tpl.bind(np.arange(2), params),
+                                  tpl.bind(np.arange(2), params, noise=probs)], dev)
+    stacked = StackedPECZNE(tpl, dev, pauli_probs=probs, scale_factors=[1, 3], target_std=0.04,
+                            max_samples=4000, seed=0)
+    value = stacked(params)
+    assert abs(value - ideal) < abs(noisy - ideal)
+    report = stacked.report
+    assert report["submissions"] == 2  # PEC pilot + one batch for every (variant, scale)
+    assert report["saved_circuits"] > 0
+    assert report["nested_circuits"] == report["executed_circuits"] + report["saved_circuits"]
+
+
+def test_stacked_value_and_grad_share_batch(template, params):
+    stacked = StackedPECZNE(template, qml.device("default.mixed", wires=WIRES), scale_factors=[1, 3],
+                            pilot=8, max_samples=8, seed=2)
+    values, grads = stacked.value_and_grad(params[0])
+    assert stacked.submissions == 2  # Pilot + one shared value/gradient batch
+    assert np.isclose(values[0], stacked(params[0]))
+
+    eps = 1e-5
+    shift = np.zeros(template.num_params)
+    shift[1] = eps
+    fd = (stacked(params[0] + shift) - stacked(params[0] - shift)) / (2 * eps)
+    assert np.isclose(grads[0, 1], fd, atol=1e-5)
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,64 @@
+"""
+tests/test_bosonic_ops.py - Tests for the Per-Cutoff Operator Registry and Matrix-Free Displacement
+
+Verifies:
+- One registry per cutoff; fixed operators built once and equal to the QuTiP constructors
+- Parametric displacements are reused and evicted least-recently-used first
+- displace_state matches the (untruncated) displacement on kets, ket batches and density
+  matrices, including large |alpha| where naive recurrences lose all precision
+
+Run: pytest tests/test_bosonic_ops.py -v
+"""
+
+import numpy as np
+import pytest
+import qutip as qt
+
+from bosonic_ops import FockOperators, displace_state, fock_ops
+
+
+def test_registry_per_cutoff():
+    ops = fock_ops(40)
+    assert fock_ops(40) is ops and fock_ops(41) is not ops
+    assert ops.x is ops.x
+    assert ops.x == qt.position(40) and ops.p == qt.momentum(40) and ops.a == qt.destroy(40)
+    assert ops.even_parity + ops.odd_parity == qt.qeye(40)
+    assert ops.even_parity - ops.odd_parity == ops.parity
+
+
+def test_parametric_lru():
+    ops = FockOperators(30, maxsize=2)
+    first = ops.displace(0.5)
+    assert ops.displace(0.5) is first and first == qt.displace(30, 0.5)
+    ops.squeeze(0.2)
+    ops.displace(0.5)  # Refresh: squeeze(0.2) is now least recently used
+    ops.displace(1.0j)
+    assert ops.displace(0.5) is first
+    assert ("squeeze", 0.2 + 0j) not in ops._parametric
+
+
+@pytest.mark.parametrize("alpha", [0.3, 1 + 1j, 3 * np.exp(1j), 7.0, 9j])
+def test_displace_state_matches_operator(alpha):
+    N = 120
+    rng = np.random.default_rng(0)
+    psi = rng.normal(size=N) + 1j * rng.normal(size=N)
+    psi /= np.linalg.norm(psi)
+    exact = qt.displace(500, alpha).full()[:N, :N]  # Large-cutoff reference, projected to N
+    assert np.allclose(displace_state(psi, alpha), exact @ psi, atol=1e-12)
+    batch = np.stack([psi, psi[::-1]], axis=1)
+    assert np.allclose(displace_state(batch, alpha), exact @ batch, atol=1e-12)
+
+
+def test_displace_state_qobj():
+    N, alpha = 60, 0.4 - 0.3j
+    psi = qt.coherent(N, 0.7)
+    ket = displace_state(psi, alpha)
+    assert ket.dims == psi.dims
+    assert qt.fidelity(ket, qt.coherent(N, 0.7 + alpha)) > 1 - 1e-10
+    rho = displace_state(qt.ket2dm(psi), alpha)
+    assert np.allclose(rho.full(), qt.ket2dm(ket).full(), atol=1e-12)
+    assert displace_state(psi, 0) == psi
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
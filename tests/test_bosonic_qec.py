@@ -5,6 +5,7 @@ Uses pytest to verify:
 - GKP fidelity recovery after shift correction
 - Binomial fidelity after loss detection/recovery
 - Basic encoding sanity (mean photons, overlap ~1 for ideal)
+- SFSession reuses one engine per cutoff and one compiled program per gate structure
 
 Run: pytest tests/test_bosonic_qec.py -v
 
@@ -15,7 +16,8 @@ import numpy as np
 import pytest
 from bosonic_qec import (
     encode_gkp_logical_zero, apply_shift_error, correct_gkp, gkp_fidelity,
-    encode_binomial_logical_plus, apply_photon_loss, correct_binomial_full, binomial_fidelity
+    encode_binomial_logical_plus, apply_photon_loss, correct_binomial_full, binomial_fidelity,
+    SFSession
 )
 
 @pytest.mark.parametrize("delta, epsilon, shift_p, expected_fid_min", [
@@ -68,5 +70,17 @@ def test_binomial_ideal_fidelity():
     fid = binomial_fidelity(state, coeffs)
     assert np.isclose(fid, 1.0, atol=1e-4), "Ideal binomial fidelity not ~1"
 
+def test_session_reuses_engines_and_programs():
+    session = SFSession()
+    ideal = encode_gkp_logical_zero(delta=0.25, cutoff=40, session=session)
+    for shift_p in (0.0, 0.1, 0.18):
+        noisy = apply_shift_error(ideal, shift_p=shift_p, shift_q=0.05, session=session)
+        corrected, _ = correct_gkp(noisy, session=session)
+    # GKP prep + (Ket, Dgate) shared by every shift and correction, all at cutoff 40
+    assert session.cache_info() == {"engines": 1, "programs": 2}
+    assert gkp_fidelity(corrected, ideal) > 0.5
+    encode_binomial_logical_plus(S=2, N=1, cutoff=80, session=session)
+    assert session.cache_info() == {"engines": 2, "programs": 3}
+
 if __name__ == "__main__":
     pytest.main(["-v", __file__])
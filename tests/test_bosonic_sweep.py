@@ -0,0 +1,97 @@
+"""
+tests/test_bosonic_sweep.py - Tests for Resumable Bosonic Parameter Sweeps
+
+Verifies:
+- param_grid is the Cartesian product of its axes
+- Cat round: parity measurement + odd-branch swap recovers <C-|rho|C-> and gains under loss
+- GKP sweeps warm the state cache; shifts are in quadrature units, whole comb cells are undone and
+  sub-cell shifts gain from the small-envelope round
+- Results land in columnar part files; a rerun computes nothing, a partial run resumes
+- New parts never overwrite existing ones (after a deleted part, or from a second sweep on the path)
+- Pool and inline sweeps store the same table; unknown studies are rejected
+
+Run: pytest tests/test_bosonic_sweep.py -v
+"""
+
+import functools
+import glob
+import os
+
+import numpy as np
+import pytest
+import qutip as qt
+
+import bosonic_sweep
+from bosonic_sweep import cat_point, load_results, param_grid, run_sweep
+from gkp_states import gkp_zero
+from loss_channel import loss_eta, pure_loss
+
+
+def test_param_grid():
+    grid = param_grid(alpha=[1.0, 2.0], gamma=np.array([0.1, 0.2, 0.3]), N=30)
+    assert len(grid) == 6 and grid[0] == {"alpha": 1.0, "gamma": 0.1, "N": 30}
+
+
+def test_cat_point_recovers_odd_branch():
+    ideal = (qt.coherent(30, 1.5) + qt.coherent(30, -1.5)).unit()
+    odd = (qt.coherent(30, 1.5) - qt.coherent(30, -1.5)).unit()
+    noisy = pure_loss(ideal, loss_eta(0.2))
+    result = cat_point(1.5, 0.2, N=30)
+    assert np.isclose(result["fid_pre"], qt.fidelity(noisy, ideal))
+    recovered = qt.expect(noisy, ideal) + qt.expect(noisy, odd)  # Even branch kept, odd branch swapped back
+    assert np.isclose(result["fid_post"] ** 2, recovered)
+    assert result["fid_post"] > result["fid_pre"] + 0.01
+    assert np.isclose(cat_point(1.5, 0.0, N=30)["fid_post"], 1.0, atol=1e-6)  # No loss: nothing to undo
+
+
+def test_gkp_sweep(tmp_path, monkeypatch):
+    cache = str(tmp_path / "gkp_cache")
+    monkeypatch.setattr(bosonic_sweep, "gkp_zero", functools.partial(gkp_zero, cache_dir=cache))
+    cell = np.sqrt(2 * np.pi)  # x period of the comb of D(k sqrt pi) states
+    grid = param_grid(Delta=0.5, gamma=[0.0, 0.1], shift_q=[0.0, 0.5, cell], N=60, K=2)
+    results = run_sweep("gkp", grid, str(tmp_path / "gkp"), workers=1)
+    assert len(results["key"]) == 6 and len(os.listdir(cache)) == 1  # One state, built by the warmup
+    clean = results["gamma"] == 0.0
+    assert np.allclose(results["fid_pre"][clean & (results["shift_q"] == 0.0)], 1.0, atol=1e-6)
+    assert np.allclose(results["fid_post"][clean & (results["shift_q"] == cell)], 1.0, atol=1e-6)  # One cell undone
+    within = results["shift_q"] == 0.5  # Inside half a cell: small envelope only
+    assert np.all(results["gain"][within] > 0)
+
+
+def test_resume(tmp_path):
+    path = str(tmp_path / "cat")
+    grid = param_grid(alpha=[1.0, 1.5, 2.0], gamma=[0.05, 0.3], N=30)
+    partial = run_sweep("cat", grid[:2], path, workers=1)
+    assert len(partial["key"]) == 2
+    full = run_sweep("cat", grid, path, workers=1, chunk=2)
+    assert len(full["key"]) == 6 and len(set(full["key"])) == 6
+    parts = len(glob.glob(os.path.join(path, "part-*.npz")))
+    again = run_sweep("cat", grid, path, workers=1)
+    assert len(glob.glob(os.path.join(path, "part-*.npz"))) == parts  # Nothing recomputed
+    assert np.array_equal(again["fid_post"], full["fid_post"])
+    assert np.allclose(full["gain"], full["fid_post"] - full["fid_pre"])
+
+
+def test_parts_never_overwritten(tmp_path):
+    path = str(tmp_path / "shared")
+    run_sweep("cat", param_grid(alpha=[1.0, 1.5, 2.0], gamma=0.1, N=30), path, workers=1, chunk=1)
+    os.remove(os.path.join(path, "part-00001.npz"))
+    run_sweep("cat", param_grid(alpha=[1.0, 2.0], gamma=0.3, N=30), path, workers=1, chunk=1)
+    results = load_results(path)
+    assert sorted(os.listdir(path)) == ["part-00000.npz", "part-00002.npz", "part-00003.npz", "part-00004.npz"]
+    assert len(set(results["key"])) == 4
+
+
+def test_pool_matches_inline(tmp_path):
+    grid = param_grid(alpha=[1.0, 2.0], gamma=[0.1, 0.2], N=30)
+    inline = run_sweep("cat", grid, str(tmp_path / "inline"), workers=1)
+    pooled = run_sweep("cat", grid, str(tmp_path / "pool"), workers=2, chunk=1)
+    order_i, order_p = np.argsort(inline["key"]), np.argsort(pooled["key"])
+    assert np.allclose(inline["fid_post"][order_i], pooled["fid_post"][order_p])
+    assert load_results(str(tmp_path / "empty")) == {}
+    with pytest.raises(ValueError):
+        run_sweep("binomial", grid, str(tmp_path / "bad"))
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,69 @@
+"""
+tests/test_gkp_states.py - Tests for the Shared Closed-Form GKP State Factory
+
+Verifies:
+- Recurrence amplitudes match qt.displace * qt.squeeze on |0> (real and complex alpha / z)
+- gkp_zero matches the operator lattice sum wherever the truncated operators are exact
+- Memoization: in-process hits and on-disk .npy round trips return the same state
+- Square and hexagonal lattices differ; unknown lattices are rejected
+
+Run: pytest tests/test_gkp_states.py -v
+"""
+
+import os
+
+import numpy as np
+import pytest
+import qutip as qt
+
+import gkp_states
+from gkp_states import displaced_squeezed_amplitudes, gkp_zero
+
+
+@pytest.mark.parametrize("alpha, z", [(1.3, 0.125), (0.5 - 0.7j, 0.3 + 0.4j), (3.0, 0.6j)])
+def test_amplitudes_match_operators(alpha, z):
+    N = 160
+    ref = (qt.displace(N, alpha) * qt.squeeze(N, z) * qt.basis(N, 0)).full().ravel()
+    got = displaced_squeezed_amplitudes([alpha], z, N)[0]
+    assert np.allclose(got[:60], ref[:60], atol=1e-12)
+
+
+def test_far_lattice_points_stay_finite():
+    amps = displaced_squeezed_amplitudes([40.0, -40.0, 0.0], 0.125, 300)
+    assert np.isfinite(amps).all()
+    assert np.isclose(np.linalg.norm(amps[2]), 1.0)
+
+
+def test_gkp_zero_matches_operator_sum():
+    N, K, Delta = 120, 3, 0.25
+    ref = sum((qt.displace(N, k * np.sqrt(np.pi)) * qt.squeeze(N, Delta / 2) * qt.basis(N, 0)
+               for k in range(-K, K + 1)), qt.qzero(N) * qt.basis(N, 0)).unit()
+    psi = gkp_zero(Delta, K, N, cache_dir=None)
+    assert psi.dims == ref.dims
+    assert qt.fidelity(psi, ref) > 1 - 1e-10
+
+
+def test_memoized_in_process_and_on_disk(tmp_path):
+    cache = str(tmp_path)
+    first = gkp_zero(0.3, 10, 80, cache_dir=cache)
+    files = os.listdir(cache)
+    assert len(files) == 1 and files[0].endswith(".npy")
+    gkp_states._gkp_amplitudes.cache_clear()
+    from_disk = gkp_zero(0.3, 10, 80, cache_dir=cache)
+    assert np.allclose(from_disk.full(), first.full())
+    again = gkp_zero(0.3, 10, 80, cache_dir=cache)
+    assert again is not from_disk  # Fresh Qobj per call over the read-only cached amplitudes
+    assert not gkp_states._gkp_amplitudes(0.3, 10, 80, "square", 0.15 + 0j, cache).flags.writeable
+
+
+def test_lattices():
+    square = gkp_zero(0.25, 8, 100, cache_dir=None)
+    hexagonal = gkp_zero(0.25, 8, 100, lattice="hexagonal", cache_dir=None)
+    assert np.isclose(hexagonal.norm(), 1.0)
+    assert qt.fidelity(square, hexagonal) < 0.99
+    with pytest.raises(ValueError):
+        gkp_zero(lattice="triangular", cache_dir=None)
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,61 @@
+"""
+tests/test_loss_channel.py - Tests for the Exact Kraus Pure-Loss Channel
+
+Verifies:
+- pure_loss matches qt.mesolve with c_ops=[sqrt(gamma) a] for cat and GKP states
+- Kraus operators are complete and reproduce the vectorized channel; eta = 0, 1 are exact
+- Density-matrix ensembles and selected modes of a multi-mode state are handled per mode
+
+Run: pytest tests/test_loss_channel.py -v
+"""
+
+import numpy as np
+import pytest
+import qutip as qt
+
+from gkp_states import gkp_zero
+from loss_channel import kraus_operators, loss_eta, pure_loss
+
+TIGHT = {"atol": 1e-12, "rtol": 1e-10}
+
+
+@pytest.mark.parametrize("make_state", [lambda N: (qt.coherent(N, 2.0) + qt.coherent(N, -2.0)).unit(),
+                                        lambda N: gkp_zero(0.3, 8, N, cache_dir=None)], ids=["cat", "gkp"])
+def test_matches_mesolve(make_state):
+    N, gamma, t = 60, 0.3, 1.5
+    psi = make_state(N)
+    ref = qt.mesolve(qt.qeye(N), psi, np.linspace(0, t, 20), [np.sqrt(gamma) * qt.destroy(N)],
+                     options=TIGHT).states[-1]
+    out = pure_loss(psi, loss_eta(gamma, t))
+    assert out.dims == ref.dims
+    assert np.allclose(out.full(), ref.full(), atol=1e-9)
+
+
+def test_kraus_complete_and_consistent():
+    N, eta = 30, 0.65
+    ops = kraus_operators(N, eta)
+    assert np.allclose(sum(A.dag() * A for A in ops).full(), np.eye(N))
+    rho = qt.rand_dm(N, seed=1)
+    assert np.allclose(sum(A * rho * A.dag() for A in ops).full(), pure_loss(rho, eta).full())
+    assert np.allclose(pure_loss(rho, 1.0).full(), rho.full())
+    assert np.isclose(pure_loss(rho, 0.0).full()[0, 0], 1.0)
+    with pytest.raises(ValueError):
+        pure_loss(rho, 1.2)
+
+
+def test_ensembles_and_modes():
+    N, eta = 12, 0.7
+    batch = np.stack([qt.rand_dm(N, seed=s).full() for s in range(3)])
+    out = pure_loss(batch, eta)
+    assert out.shape == batch.shape
+    assert np.allclose(out[2], pure_loss(qt.Qobj(batch[2]), eta).full())
+
+    a, b = qt.coherent(N, 0.8), qt.basis(N, 2)
+    one = pure_loss(qt.tensor(a, b), eta, modes=[1])
+    assert np.allclose(one.full(), qt.tensor(qt.ket2dm(a), pure_loss(b, eta)).full())
+    both = pure_loss(qt.tensor(a, b), eta)
+    assert np.allclose(both.full(), qt.tensor(pure_loss(a, eta), pure_loss(b, eta)).full())
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
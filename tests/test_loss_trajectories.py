@@ -0,0 +1,58 @@
+"""
+tests/test_loss_trajectories.py - Tests for the Quantum-Trajectory Loss + Shift Engine
+
+Verifies:
+- Noiseless trajectories return fidelity 1; eta=0 removes every photon (|3> -> |0>, 3 lost)
+- Trajectory-averaged fidelity brackets the exact Kraus-channel fidelity (dense and MPS states)
+- Results are reproducible and independent of the worker count
+- Invalid transmissivities are rejected
+
+Run: pytest tests/test_loss_trajectories.py -v
+"""
+
+import numpy as np
+import pytest
+import qutip as qt
+
+from loss_channel import pure_loss
+from loss_trajectories import apply_loss_jumps, fidelity_estimate, run_trajectories
+from multimode_engine import BosonicMPS, ModeRegister
+
+
+def _pair(N=20, backend=ModeRegister):
+    pair = backend([qt.coherent(N, 1.2), (qt.basis(N, 0) + qt.basis(N, 2)).unit()])
+    pair.beamsplitter(np.pi / 4, 0, 1)
+    return pair
+
+
+def test_noiseless_and_full_loss():
+    assert np.allclose(run_trajectories(_pair(), trajectories=5, workers=1), 1.0)
+    fock = ModeRegister([qt.basis(6, 3)])
+    assert apply_loss_jumps(fock, 0.0, np.random.default_rng(0)) == [3]
+    assert np.isclose(abs(fock.psi[0]), 1.0)
+
+
+@pytest.mark.parametrize("backend", [ModeRegister, BosonicMPS])
+def test_average_matches_kraus_channel(backend):
+    N, eta = 20, 0.7
+    psi = _pair(N).to_qobj()
+    exact = qt.expect(pure_loss(psi, eta), psi).real
+    state = _pair(N, backend)
+    est = fidelity_estimate(run_trajectories(state, eta=eta, trajectories=600, workers=1, seed=3), confidence=0.999)
+    assert est["lower"] <= exact <= est["upper"]
+    assert est["trajectories"] == 600 and est["stderr"] < 0.02
+
+
+def test_reproducible_across_workers():
+    serial = run_trajectories(_pair(), eta=0.8, shift=0.2, trajectories=12, workers=1, seed=7)
+    pooled = run_trajectories(_pair(), eta=0.8, shift=0.2, trajectories=12, workers=3, seed=7)
+    assert np.allclose(serial, pooled)
+
+
+def test_invalid_eta():
+    with pytest.raises(ValueError):
+        apply_loss_jumps(_pair(), 1.5, np.random.default_rng(0))
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,70 @@
+"""
+tests/test_mode_syndromes.py - Tests for Batched Per-Mode Syndrome Extraction
+
+Verifies:
+- Batched marginals + expectations match per-mode ptrace / qt.expect (with and without loss)
+- Dense and MPS states give the same syndromes; BosonicMPS.reduced_dms matches reduced_dm
+- correct_round flips odd-parity modes and brings <x> back within half a comb cell, in place
+
+Run: pytest tests/test_mode_syndromes.py -v
+"""
+
+import numpy as np
+import pytest
+import qutip as qt
+
+from bosonic_ops import fock_ops
+from loss_channel import pure_loss
+from mode_syndromes import correct_round, measure_syndromes
+from multimode_engine import BosonicMPS, ModeRegister
+
+N = 16
+
+
+def _kets():
+    return [qt.coherent(N, 1.0), qt.coherent(N, 0.6j), (qt.basis(N, 1) + qt.basis(N, 4)).unit()]
+
+
+def _entangle(state):
+    state.beamsplitter(np.pi / 4, 0, 1)
+    state.beamsplitter(0.3, 1, 2)
+    return state
+
+
+@pytest.mark.parametrize("eta", [None, 0.7])
+def test_matches_ptrace_loop(eta):
+    register = _entangle(ModeRegister(_kets()))
+    psi = register.to_qobj().unit()
+    syndromes = measure_syndromes(register, eta)
+    ops = fock_ops(N)
+    for i in range(3):
+        partial = psi.ptrace(i) if eta is None else pure_loss(psi.ptrace(i), eta)
+        assert np.isclose(syndromes["p_even"][i], qt.expect(ops.even_parity, partial))
+        assert np.isclose(syndromes["q"][i], qt.expect(ops.x, partial))
+        assert np.isclose(syndromes["p"][i], qt.expect(ops.p, partial))
+
+
+def test_dense_and_mps_agree():
+    register = _entangle(ModeRegister(_kets()))
+    mps = _entangle(BosonicMPS(_kets(), max_bond_dim=N ** 2, cutoff=0.0))
+    assert np.allclose(mps.reduced_dms(), np.stack([mps.reduced_dm(i) for i in range(3)]))
+    dense, local = measure_syndromes(register, 0.8), measure_syndromes(mps, 0.8)
+    for key in ("p_even", "q", "p", "flip", "shift"):
+        assert np.allclose(dense[key], local[key], atol=1e-9)
+
+
+@pytest.mark.parametrize("x_mean, expected", [(1.0, 1.0), (3.0, 3.0 - np.sqrt(2 * np.pi))])
+def test_correct_round_in_place(x_mean, expected):
+    N = 40
+    register = ModeRegister([qt.basis(N, 1), qt.basis(N, 0)])
+    register.displace(x_mean / np.sqrt(2), 1)  # <x> = sqrt(2) Re(alpha)
+    assert np.isclose(register.expect(fock_ops(N).x, 1).real, x_mean)
+    syndromes = correct_round(register)
+    assert list(syndromes["flip"]) == [True, False]
+    x_after = register.expect(fock_ops(N).x, 1).real
+    assert abs(x_after) <= np.sqrt(2 * np.pi) / 2  # Within half a lattice cell of the comb
+    assert np.isclose(x_after, expected, atol=1e-6)
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
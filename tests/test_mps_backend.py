@@ -0,0 +1,71 @@
+"""
+tests/test_mps_backend.py - Tests for the MPS Simulator Backend
+
+Verifies:
+- Council chains, non-adjacent / reversed two-qubit gates and Hamiltonians match default.qubit
+- Bond-dimension truncation keeps bonds bounded and reports a nonzero truncation error
+- load_backend("mps") simulates hundreds of council wires
+
+Run: pytest tests/test_mps_backend.py -v
+"""
+
+import numpy as np
+import pytest
+
+qml = pytest.importorskip("pennylane")
+
+from circuit_templates import bind_council, council_template, execute_tapes
+from mps_simulator import MPSDevice, MPSState
+from quantum_backend_manager import load_backend
+
+
+@pytest.mark.parametrize("entangler, layers", [("CNOT", 1), ("CZ", 3)])
+def test_council_matches_statevector(entangler, layers):
+    wires = 7
+    tpl = council_template(wires, layers=layers, entangler=entangler, measured=4)
+    params = np.random.default_rng(0).uniform(-np.pi, np.pi, (3, tpl.num_params))
+    tapes = [bind_council(tpl, p) for p in params]
+    ref = execute_tapes(tapes, qml.device("default.qubit", wires=wires))
+    assert np.allclose(execute_tapes(tapes, MPSDevice(wires=wires)), ref)
+
+
+def test_long_range_gates_and_hamiltonians():
+    ops = [qml.Hadamard(0), qml.RY(0.4, wires=3), qml.CNOT(wires=[0, 4]), qml.CRX(0.7, wires=[4, 1]),
+           qml.RX(1.1, wires=2), qml.CZ(wires=[3, 1])]
+    ham = qml.Hamiltonian([0.5, -1.2, 2.0], [qml.PauliX(0) @ qml.PauliY(1), qml.PauliZ(4), qml.PauliZ(1) @ qml.PauliX(3)])
+    tape = qml.tape.QuantumScript(ops, [qml.expval(ham), qml.expval(qml.PauliZ(0) @ qml.PauliZ(4))])
+    ref = execute_tapes([tape], qml.device("default.qubit", wires=5))[0]
+    assert np.allclose(execute_tapes([tape], MPSDevice(wires=5))[0], ref)
+
+
+def test_truncation_bounds_bonds_and_reports_error():
+    wires = 12
+    tpl = council_template(wires, layers=6, entangler="CZ")
+    params = np.random.default_rng(2).uniform(-np.pi, np.pi, tpl.num_params)
+    exact = MPSDevice(wires=wires)
+    truncated = MPSDevice(wires=wires, max_bond_dim=4)
+    execute_tapes([bind_council(tpl, params)], exact)
+    execute_tapes([bind_council(tpl, params)], truncated)
+    assert exact.truncation_errors[0] < 1e-10
+    assert truncated.truncation_errors[0] > 1e-6
+
+    state = MPSState(wires, max_bond_dim=4)
+    for i in range(wires):
+        state.apply_1q(qml.matrix(qml.Hadamard(0)), i)
+    for _ in range(4):
+        for i in range(wires - 1):
+            state.apply_2q(qml.matrix(qml.CRX(1.0, wires=[0, 1])), i, i + 1)
+    assert max(state.bond_dims) <= 4
+    assert np.isclose(state.norm(), 1.0)
+
+
+def test_load_backend_hundreds_of_wires():
+    dev = load_backend("mps", wires_base=201, max_bond_dim=16)
+    tpl = council_template(201, layers=2)
+    value = execute_tapes([bind_council(tpl, np.full(tpl.num_params, 0.1))], dev)[0]
+    assert -1.0 <= value <= 1.0
+    assert len(dev.truncation_errors) == 1
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
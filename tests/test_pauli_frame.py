@@ -0,0 +1,69 @@
+"""
+tests/test_pauli_frame.py - Tests for the Batched Pauli-Frame Sampler
+
+Verifies:
+- Noiseless memory circuits give no detection events / observable flips
+- Deterministic injected errors (p=1 channels) fire the same detectors as the tableau
+- Detector and observable rates match the tableau simulator statistically
+- Packed output matches the bool output and zeroes the padding shots
+
+Run: pytest tests/test_pauli_frame.py -v
+"""
+
+import numpy as np
+import pytest
+
+from color_code_qec_sim import color_code_memory
+from error_correction_surface_code import surface_code_circuit
+from pauli_frame import FrameSampler, sample_frames
+from qec_codes import RotatedSurfaceCode, TriangularColorCode, memory_circuit
+from stabilizer_tableau import sample_syndromes, unpack_bits
+
+CODES = [RotatedSurfaceCode(3), RotatedSurfaceCode(5), TriangularColorCode(3), TriangularColorCode(5)]
+
+
+@pytest.mark.parametrize("code", CODES, ids=lambda c: f"{type(c).__name__}-{c.d}")
+@pytest.mark.parametrize("basis", ["Z", "X"])
+def test_noiseless_frames_are_quiet(code, basis):
+    dets, obs = sample_frames(memory_circuit(code, rounds=2, basis=basis), shots=200, seed=0)
+    assert not dets.any() and not obs.any()
+
+
+def test_deterministic_errors_match_tableau():
+    circuit = memory_circuit(RotatedSurfaceCode(3), rounds=2, p=0.0)
+    circuit.instructions.insert(3, ("X_ERROR", np.array([4]), 1.0))
+    circuit.instructions.insert(3, ("Z_ERROR", np.array([0]), 1.0))
+    frame_dets, frame_obs = sample_frames(circuit, shots=70, seed=1)
+    tab_dets, tab_obs = sample_syndromes(circuit, shots=1, seed=2)
+    assert frame_dets.any()
+    assert np.array_equal(frame_dets, np.repeat(tab_dets, 70, axis=0))
+    assert np.array_equal(frame_obs, np.repeat(tab_obs, 70, axis=0))
+
+
+@pytest.mark.parametrize("code", [RotatedSurfaceCode(3), TriangularColorCode(3)], ids=lambda c: type(c).__name__)
+def test_rates_match_tableau(code):
+    circuit = memory_circuit(code, rounds=3, p=0.01)
+    shots = 20_000
+    frame_dets, frame_obs = sample_frames(circuit, shots, seed=3)
+    tab_dets, tab_obs = sample_syndromes(circuit, shots, seed=4)
+    assert np.allclose(frame_dets.mean(axis=0), tab_dets.mean(axis=0), atol=0.02)
+    assert np.allclose(frame_obs.mean(), tab_obs.mean(), atol=0.015)
+
+
+def test_packed_output():
+    sampler = FrameSampler(memory_circuit(TriangularColorCode(3), rounds=2, p=0.05), seed=5)
+    dets_w, obs_w = sampler.sample(130, packed=True)
+    assert dets_w.shape == (sampler.circuit.num_detectors, 3) and dets_w.dtype == np.uint64
+    assert not (dets_w[:, -1] >> np.uint64(2)).any() and not (obs_w[:, -1] >> np.uint64(2)).any()
+    assert unpack_bits(dets_w, 130).any()
+
+
+def test_code_modules_use_frames():
+    dets, obs = surface_code_circuit(d=3, p_error=0.005, shots=500, seed=0)
+    assert dets.shape == (500, 4 * (3 + 1)) and obs.shape == (500, 1)
+    dets, obs = color_code_memory(d=3, p_error=0.005, shots=500, seed=0)
+    assert dets.shape == (500, 3 * (3 + 1)) and obs.shape == (500, 1)
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
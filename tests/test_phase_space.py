@@ -0,0 +1,73 @@
+"""
+tests/test_phase_space.py - Tests for Wigner Functions and Quadrature Marginals on Shared Grids
+
+Verifies:
+- wigner matches qt.wigner (coherent, cat, Fock, mixed states) in one batched call
+- q / p marginals match the Wigner function integrated over the other quadrature
+- wigner_overlap gives purities and Tr(rho sigma); grids and wavefunctions are cached read-only
+- modular_probabilities concentrates a GKP q-marginal on its comb
+
+Run: pytest tests/test_phase_space.py -v
+"""
+
+import numpy as np
+import pytest
+import qutip as qt
+
+from gkp_states import gkp_zero
+from phase_space import (fock_wavefunctions, modular_probabilities, quadrature_grid, quadrature_marginals,
+                         wigner, wigner_overlap)
+
+N, EXTENT, POINTS = 30, 6.0, 121
+
+
+def _states():
+    cat = (qt.coherent(N, 2.0) + qt.coherent(N, -2.0)).unit()
+    mixed = 0.5 * qt.ket2dm(qt.basis(N, 1)) + 0.5 * qt.ket2dm(qt.coherent(N, 1j))
+    return [qt.coherent(N, 1 + 1j), cat, qt.basis(N, 5), mixed]
+
+
+def test_wigner_matches_qutip():
+    states = _states()
+    W = wigner(states, EXTENT, POINTS)
+    xvec = np.asarray(quadrature_grid(EXTENT, POINTS))
+    assert W.shape == (4, POINTS, POINTS)
+    for b, state in enumerate(states):
+        assert np.allclose(W[b], qt.wigner(state, xvec, xvec).T, atol=1e-10)
+
+
+@pytest.mark.parametrize("quadrature, axis", [("q", 1), ("p", 0)])
+def test_marginals_integrate_wigner(quadrature, axis):
+    states = _states()
+    step = 2 * EXTENT / (POINTS - 1)
+    W = wigner(states, EXTENT, POINTS)
+    marginals = quadrature_marginals(states, quadrature, EXTENT, POINTS)
+    assert np.allclose(marginals, W.sum(axis=axis + 1) * step, atol=1e-5)  # Grid edge clips ~1e-6 of W tails
+    assert np.allclose(marginals.sum(axis=1) * step, 1.0)
+    with pytest.raises(ValueError):
+        quadrature_marginals(states, "r")
+
+
+def test_overlaps_and_caches():
+    states = _states()
+    W = wigner(states, EXTENT, POINTS)
+    purities = wigner_overlap(W, W, EXTENT, POINTS)
+    assert np.allclose(purities, [1, 1, 1, (states[3] * states[3]).tr().real])
+    overlap = wigner_overlap(W[0], W[1], EXTENT, POINTS)
+    assert np.isclose(overlap, qt.fidelity(states[0], states[1]) ** 2)
+    assert fock_wavefunctions(N, EXTENT, POINTS) is fock_wavefunctions(N, EXTENT, POINTS)
+    assert not quadrature_grid(EXTENT, POINTS).flags.writeable
+
+
+def test_gkp_comb_probabilities():
+    extent, points = 16.0, 321
+    gkp = gkp_zero(0.25, 8, 80, cache_dir=None)
+    marginal = quadrature_marginals(gkp, "q", extent, points)
+    probs = modular_probabilities(marginal, np.sqrt(2 * np.pi), extent, points, bins=8)
+    assert probs.shape == (1, 8) and np.isclose(probs.sum(), 1.0, atol=1e-6)
+    assert np.allclose(probs, probs[:, ::-1], atol=0.01)  # |0>_L comb symmetric about its teeth (up to binning)
+    assert int(np.argmax(probs)) in (3, 4) and probs[0, 3:5].sum() > 1.5 * probs[0, [0, 7]].sum()
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
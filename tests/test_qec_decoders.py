@@ -0,0 +1,93 @@
+"""
+tests/test_qec_decoders.py - Tests for the Detector-Graph MWPM and Color Code Restriction Decoders
+
+Verifies:
+- Shortest-path observable parities match a brute-force walk of the predecessor tree
+- Every single circuit fault of a d=3 surface code memory is decoded back to its own logical flip
+- MWPM lowers the logical error rate below the raw flip rate and improves with distance
+- The restriction decoder reproduces every syndrome and corrects all errors of weight <= (d-1)/2
+  for d=3, 5 (color code, code capacity)
+
+Run: pytest tests/test_qec_decoders.py -v
+"""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from color_code_qec_sim import color_code_circuit, corrected_logical
+from error_correction_surface_code import logical_error_rate
+from pauli_frame import FrameSampler
+from qec_codes import RotatedSurfaceCode, TriangularColorCode, memory_circuit
+from qec_decoders import DetectorGraph, MatchingDecoder, RestrictionDecoder
+
+
+def _face_matrix(code):
+    h = np.zeros((len(code.faces), code.n_data), dtype=np.int64)
+    for k, face in enumerate(code.faces):
+        h[k, [q for q in face if q >= 0]] = 1
+    return h
+
+
+def test_path_parities_follow_shortest_paths():
+    edges = {(0, 1): (0.1, 0), (1, 2): (0.1, 1), (2, 3): (0.1, 0), (0, 4): (0.01, 1), (3, 4): (0.3, 1)}
+    graph = DetectorGraph(4, edges)
+    w = {key: np.log((1 - p) / p) for key, (p, _) in edges.items()}
+    # 0 -> 3 runs 0-4-3 (two observable edges), 1 -> 3 runs 1-2-3 and 0 -> 2 runs 0-1-2 (one each)
+    assert np.isclose(graph.dist[0, 3], w[(0, 4)] + w[(3, 4)])
+    assert graph.obs_parity[0, 3] == 0 and graph.obs_parity[3, 0] == 0
+    assert graph.obs_parity[1, 3] == 1 and graph.obs_parity[0, 2] == 1 and graph.obs_parity[2, 0] == 1
+
+
+def test_single_faults_are_corrected():
+    circuit = memory_circuit(RotatedSurfaceCode(3), rounds=2, p=0.001)
+    decoder = MatchingDecoder.from_circuit(circuit)
+    _, det_sets, obs_masks = FrameSampler(circuit, seed=0).fault_signatures()
+    for dets, mask in zip(det_sets, obs_masks):
+        assert decoder.decode_defects(dets) == mask
+
+
+def test_mwpm_suppresses_logical_errors():
+    raw = logical_error_rate(3, p_error=0.002, shots=5000, decoder=None, seed=1)
+    d3 = logical_error_rate(3, p_error=0.002, shots=5000, seed=1)
+    d5 = logical_error_rate(5, p_error=0.002, shots=5000, seed=1)
+    assert d3 < raw / 4
+    assert d5 < d3
+
+
+@pytest.mark.parametrize("d", [3, 5])
+def test_restriction_decoder_reaches_distance(d):
+    code = TriangularColorCode(d)
+    decoder = RestrictionDecoder(code)
+    h = _face_matrix(code)
+    logical = np.zeros(code.n_data, dtype=np.int64)
+    logical[code.logicals["Z"]] = 1
+    for weight in range(1, (d - 1) // 2 + 1):
+        for qubits in itertools.combinations(range(code.n_data), weight):
+            error = np.zeros(code.n_data, dtype=np.int64)
+            error[list(qubits)] = 1
+            fix = decoder.correction((h @ error) % 2 == 1).astype(np.int64)
+            assert not ((h @ (fix + error)) % 2).any()
+            assert (logical @ (fix + error)) % 2 == 0
+
+
+def test_restriction_decoder_reproduces_syndromes():
+    code = TriangularColorCode(7)
+    decoder = RestrictionDecoder(code)
+    h = _face_matrix(code)
+    rng = np.random.default_rng(0)
+    for _ in range(100):
+        error = (rng.random(code.n_data) < 0.1).astype(np.int64)
+        fix = decoder.correction((h @ error) % 2 == 1).astype(np.int64)
+        assert not ((h @ (fix + error)) % 2).any()
+
+
+def test_color_code_mercy_is_decoded():
+    syndrome, raw = color_code_circuit(errors=[(0, "X"), (3, "Z")])
+    assert raw == -1.0
+    assert corrected_logical(syndrome, raw) == 1.0
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,103 @@
+"""
+tests/test_quantum_volume.py - Unit Tests for the Exact Quantum Volume Engine
+
+Verifies:
+- Vectorized statevector matches the PennyLane QNode path for the same spec
+- Heavy set is exactly the above-median half of the ideal distribution
+- Noiseless heavy-output mean sits near the ~0.85 asymptote (well above 2/3)
+- Batched simulator reproduces the per-trial distributions exactly
+- A trial's circuit and its shot samples come from independent spawned seed streams
+- Cached QV template rebinds to the same circuit as the ideal statevector
+
+Run: pytest tests/test_quantum_volume.py -v
+"""
+
+import numpy as np
+import pytest
+from quantum_volume_engine import (
+    random_qv_spec, ideal_probabilities, heavy_set, samples_to_indices,
+    heavy_output_probability, run_qv_trial, run_qv_trials, trial_streams
+)
+from batched_qv_simulator import random_qv_specs, batched_probabilities, batched_heavy_output_probs
+
+
+@pytest.mark.parametrize("n", [2, 3, 4, 5])
+def test_statevector_matches_qnode(n):
+    qml = pytest.importorskip("pennylane")
+    perms, angles = random_qv_spec(n, n, seed=7)
+
+    @qml.qnode(qml.device("default.qubit", wires=n))
+    def circuit():
+        for layer, perm in enumerate(perms):
+            for b in range(n // 2):
+                q1, q2 = int(perm[2 * b]), int(perm[2 * b + 1])
+                a = angles[layer, b]
+                qml.Rot(*a[0:3], wires=q1)
+                qml.Rot(*a[3:6], wires=q2)
+                qml.CNOT(wires=[q1, q2])
+                qml.RZ(a[6], wires=q1)
+                qml.RY(a[7], wires=q2)
+        return qml.probs(wires=range(n))
+
+    assert np.allclose(ideal_probabilities(perms, angles), circuit(), atol=1e-10)
+
+
+def test_heavy_set_is_above_median():
+    probs = np.array([0.05, 0.4, 0.1, 0.45])
+    assert heavy_set(probs).tolist() == [False, True, False, True]
+
+
+def test_heavy_output_lookup():
+    heavy = np.array([False, True, False, True])
+    samples = np.array([[0, 1], [1, 1], [0, 0], [1, 0]])
+    assert samples_to_indices(samples).tolist() == [1, 3, 0, 2]
+    assert heavy_output_probability(samples, heavy) == 0.5
+    assert heavy_output_probability(1 - 2 * samples, heavy, eigvals=True) == 0.5
+
+
+def test_noiseless_heavy_mean():
+    hp = run_qv_trials(6, trials=20, shots=2000, backend="statevector", workers=2)
+    assert hp.shape == (20,)
+    assert 0.78 < hp.mean() < 0.92
+
+
+@pytest.mark.parametrize("n", [2, 3, 6])
+def test_batched_matches_per_trial(n):
+    perms, angles = random_qv_specs(n, n, seeds=[11, 12, 13])
+    ref = np.stack([ideal_probabilities(p, a) for p, a in zip(perms, angles)])
+    assert np.allclose(batched_probabilities(perms, angles), ref, atol=1e-12)
+
+
+def test_trial_streams_independent():
+    circuit, sampling = trial_streams(5)
+    assert circuit.spawn_key != sampling.spawn_key
+    perms, angles = random_qv_spec(4, 4, circuit)
+    probs = ideal_probabilities(perms, angles)
+    idx = np.random.default_rng(sampling).choice(probs.size, size=500, p=probs)
+    assert run_qv_trial(4, 4, 5, shots=500) == np.mean(heavy_set(probs)[idx])
+    assert not np.allclose(angles, random_qv_spec(4, 4, 5)[1])  # Not the raw seed's stream either
+
+
+def test_batched_heavy_mean_matches_engine():
+    batched = batched_heavy_output_probs(6, trials=40, shots=2000, batch_size=16)
+    serial = run_qv_trials(6, trials=40, shots=2000, backend="statevector", workers=1)
+    assert batched.shape == serial.shape
+    assert abs(batched.mean() - serial.mean()) < 0.02
+
+
+def test_qv_template_rebinding():
+    qml = pytest.importorskip("pennylane")
+    from circuit_templates import qv_template
+    n = 4
+    tpl = qv_template(n, n)
+    assert qv_template(n, n) is tpl
+    dev = qml.device("default.qubit", wires=n)
+    for seed in (3, 4):
+        perms, angles = random_qv_spec(n, n, seed)
+        tape = tpl.bind(perms, angles)
+        tape = qml.tape.QuantumScript(tape.operations, [qml.probs(wires=range(n))])
+        assert np.allclose(qml.execute([tape], dev)[0], ideal_probabilities(perms, angles), atol=1e-10)
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
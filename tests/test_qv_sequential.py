@@ -0,0 +1,64 @@
+"""
+tests/test_qv_sequential.py - Tests for the Sequential Heavy-Output QV Test
+
+Verifies:
+- Clear passes / failures stop early, near-threshold streams use more trials
+- max_trials caps the budget with an honest "fail"
+- Upstream trial streams are closed once the verdict is in
+
+Run: pytest tests/test_qv_sequential.py -v
+"""
+
+import numpy as np
+import pytest
+from qv_early_stopping import SequentialHeavyOutputTest, run_sequential_test
+
+
+@pytest.mark.parametrize("true_mean, decision", [
+    (0.85, "pass"),
+    (0.50, "fail"),
+])
+def test_clear_cases_stop_early(true_mean, decision):
+    rng = np.random.default_rng(1)
+    test = run_sequential_test(np.clip(rng.normal(true_mean, 0.05, 500), 0, 1))
+    assert test.decision == decision
+    assert test.trials <= 20
+
+
+def test_near_threshold_needs_more_trials():
+    rng = np.random.default_rng(2)
+    clear = run_sequential_test(np.clip(rng.normal(0.85, 0.05, 500), 0, 1))
+    close = run_sequential_test(np.clip(rng.normal(0.70, 0.05, 500), 0, 1))
+    assert close.trials > clear.trials
+
+
+def test_max_trials_budget():
+    test = run_sequential_test(np.full(1000, 2 / 3) + np.tile([0.01, -0.01], 500), max_trials=50)
+    assert test.decision == "fail"
+    assert test.trials == 50
+
+
+def test_stream_is_closed():
+    consumed = []
+
+    def stream():
+        for h in np.tile([0.84, 0.86], 500):
+            consumed.append(h)
+            yield h
+
+    test = run_sequential_test(stream())
+    assert test.decision == "pass"
+    assert len(consumed) == test.trials
+
+
+def test_running_stats():
+    test = SequentialHeavyOutputTest(min_trials=100)
+    data = np.random.default_rng(3).uniform(0.6, 0.9, 50)
+    for h in data:
+        test.update(h)
+    assert np.isclose(test.mean, data.mean())
+    assert test.lower < test.mean < test.upper
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,72 @@
+"""
+tests/test_stabilizer_tableau.py - Tests for the Bit-Packed Stabilizer Tableau Simulator
+
+Verifies:
+- pack_bits / unpack_bits round-trip for shot counts that are not multiples of 64
+- Noiseless surface / color code memory circuits fire no detectors and no logical flips
+- Code logicals commute with every check of the opposite type
+- Injected data errors light up exactly the checks they anticommute with
+- Detection rates grow with the physical error rate
+
+Run: pytest tests/test_stabilizer_tableau.py -v
+"""
+
+import numpy as np
+import pytest
+
+from color_code_qec_sim import color_code_circuit
+from qec_codes import RotatedSurfaceCode, TriangularColorCode, memory_circuit
+from stabilizer_tableau import pack_bits, sample_syndromes, unpack_bits
+
+CODES = [RotatedSurfaceCode(3), RotatedSurfaceCode(5), TriangularColorCode(3), TriangularColorCode(5)]
+
+
+def test_pack_roundtrip():
+    bits = np.random.default_rng(0).random((3, 130)) < 0.3
+    words = pack_bits(bits)
+    assert words.shape == (3, 3) and words.dtype == np.uint64
+    assert np.array_equal(unpack_bits(words, 130), bits)
+
+
+@pytest.mark.parametrize("code", CODES, ids=lambda c: f"{type(c).__name__}-{c.d}")
+@pytest.mark.parametrize("basis", ["Z", "X"])
+def test_noiseless_memory_is_deterministic(code, basis):
+    dets, obs = sample_syndromes(memory_circuit(code, rounds=2, basis=basis), shots=100, seed=1)
+    assert dets.shape == (100, 3 * sum(b == basis for b, _ in code.checks))
+    assert not dets.any() and not obs.any()
+
+
+@pytest.mark.parametrize("code", CODES, ids=lambda c: f"{type(c).__name__}-{c.d}")
+def test_logicals_commute_with_checks(code):
+    for basis, logical in code.logicals.items():
+        assert len(logical) == code.d
+        for b, support in code.checks:
+            if b != basis:
+                assert len(set(logical) & set(support)) % 2 == 0
+
+
+def test_injected_error_flips_adjacent_checks():
+    code = RotatedSurfaceCode(5)
+    centre = code.n_data // 2
+    dets, _ = sample_syndromes(memory_circuit(code, rounds=2, errors=[(centre, "X")]), shots=4, seed=0)
+    fired = {k for k, (b, s) in enumerate(code.checks) if b == "Z" and centre in s}
+    tracked = [k for k, (b, _) in enumerate(code.checks) if b == "Z"]
+    last_round = dets[:, len(tracked):2 * len(tracked)]
+    assert all(set(np.array(tracked)[row]) == fired for row in last_round)
+
+    syndrome, logical = color_code_circuit(errors=[(0, "X"), (3, "Z")])
+    tc = TriangularColorCode(3)
+    n_faces = len(tc.faces)
+    assert set(np.flatnonzero(syndrome[n_faces:])) == {k for k, f in enumerate(tc.faces) if 0 in f}
+    assert set(np.flatnonzero(syndrome[:n_faces])) == {k for k, f in enumerate(tc.faces) if 3 in f}
+    assert logical == -1.0
+
+
+def test_detection_rate_grows_with_noise():
+    circuit = lambda p: memory_circuit(RotatedSurfaceCode(3), rounds=3, p=p)
+    rates = [sample_syndromes(circuit(p), shots=2000, seed=0)[0].mean() for p in (0.001, 0.01)]
+    assert 0 < rates[0] < rates[1]
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
@@ -0,0 +1,61 @@
+"""
+tests/test_union_find_decoder.py - Tests for the Union-Find and Sliding-Window Streaming Decoders
+
+Verifies:
+- Every single circuit fault of a d=3 surface code memory is corrected, batch and streamed
+- Union-find stays close to MWPM and far below the raw flip rate
+- Streaming over many rounds matches whole-history union-find
+- Per-round latency is recorded for every pushed round; bad window settings are rejected
+
+Run: pytest tests/test_union_find_decoder.py -v
+"""
+
+import numpy as np
+import pytest
+
+from error_correction_surface_code import logical_error_rate, streaming_logical_error_rate
+from pauli_frame import FrameSampler
+from qec_codes import RotatedSurfaceCode, memory_circuit
+from union_find_decoder import SlidingWindowDecoder, UnionFindDecoder
+
+
+def test_single_faults_are_corrected():
+    circuit = memory_circuit(RotatedSurfaceCode(3), rounds=4, p=0.001)
+    decoder = UnionFindDecoder.from_circuit(circuit)
+    stream = SlidingWindowDecoder(circuit, window=2, commit=1)
+    _, det_sets, obs_masks = FrameSampler(circuit, seed=0).fault_signatures()
+    events = np.zeros((len(det_sets), circuit.num_detectors), dtype=bool)
+    for k, dets in enumerate(det_sets):
+        events[k, dets] = True
+    expected = obs_masks[:, None].astype(bool)
+    assert np.array_equal(decoder.decode(events), expected)
+    assert np.array_equal(stream.decode(events), expected)
+
+
+def test_union_find_close_to_mwpm():
+    raw = logical_error_rate(3, p_error=0.003, shots=4000, decoder=None, seed=2)
+    uf = logical_error_rate(3, p_error=0.003, shots=4000, decoder="union-find", seed=2)
+    mwpm = logical_error_rate(3, p_error=0.003, shots=4000, decoder="mwpm", seed=2)
+    assert uf < raw / 3
+    assert uf < 2.5 * mwpm + 0.002
+
+
+def test_streaming_matches_global_union_find():
+    circuit = memory_circuit(RotatedSurfaceCode(3), rounds=12, p=0.003)
+    dets, obs = FrameSampler(circuit, seed=3).sample(600)
+    full = UnionFindDecoder.from_circuit(circuit).decode(dets)
+    streamed = SlidingWindowDecoder(circuit, window=6, commit=3).decode(dets)
+    assert abs((full != obs).mean() - (streamed != obs).mean()) < 0.02
+
+
+def test_latency_per_round():
+    rate, latency = streaming_logical_error_rate(3, p_error=0.002, shots=20, rounds=9, seed=4)
+    assert 0.0 <= rate <= 1.0
+    assert latency["rounds"] == 20 * (9 + 2)  # 9 rounds + final data detectors + finish()
+    assert 0 < latency["mean_us"] <= latency["max_us"]
+    with pytest.raises(ValueError):
+        SlidingWindowDecoder(memory_circuit(RotatedSurfaceCode(3), rounds=3), window=2, commit=3)
+
+
+if __name__ == "__main__":
+    pytest.main(["-v", __file__])
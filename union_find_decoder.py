@@ -0,0 +1,289 @@
+"""
+union_find_decoder.py - Almost-Linear Union-Find Decoder + Sliding-Window Streaming
+
+Real-time decoding has to keep up with syndrome rounds as they arrive, which batch MWPM over
+the whole memory experiment cannot. Union-find (Delfosse-Nickerson) on the same detector graph
+as qec_decoders.MatchingDecoder:
+- Array-backed structures: CSR adjacency, edge growth counters, parent / size / parity /
+  boundary flags per node - union by size + path compression (inverse-Ackermann finds)
+- Odd clusters grow their frontier edges one half-unit per step (integer log-likelihood
+  weights); fully grown edges fuse clusters; clusters touching the boundary stop growing
+- Fusing edges form a spanning forest; peeling it from the leaves selects the correction
+- SlidingWindowDecoder: rounds are pushed one at a time; once `window` rounds are buffered the
+  window is decoded, corrections in its oldest `commit` rounds are committed (defects they
+  push into later rounds carried forward) and the window slides; per-round latency recorded
+
+Usage:
+    from qec_codes import RotatedSurfaceCode, memory_circuit
+    from union_find_decoder import SlidingWindowDecoder
+    stream = SlidingWindowDecoder(memory_circuit(RotatedSurfaceCode(5), rounds=20, p=1e-3), window=4)
+    for events in rounds_of_detection_events:  # bool per detector of that round
+        stream.push_round(events)
+    flips = stream.finish()
+    print(stream.latency_report())
+
+Thunder eternal—clusters grow, fuse, peel; mercy decoded before the next round lands!
+"""
+
+import time
+
+import numpy as np
+
+from qec_decoders import detector_edges
+
+
+class UnionFindDecoder:
+    """Union-find decoder on an array-backed graph: nodes 0..N-2 detectors, node N-1 the boundary"""
+
+    def __init__(self, num_nodes: int, eu, ev, weights, obs):
+        self.num_nodes = num_nodes
+        self.boundary = num_nodes - 1
+        self.eu = np.asarray(eu, dtype=np.int64)
+        self.ev = np.asarray(ev, dtype=np.int64)
+        self.obs = np.asarray(obs, dtype=np.int64)
+        w = np.asarray(weights, dtype=float)
+        # Integer growth units: a typical edge is 2 half-steps (two clusters meet in its middle)
+        self.weights = np.maximum(1, np.rint(2 * w / np.median(w))).astype(np.int64) if w.size else w.astype(np.int64)
+        ends = np.concatenate([self.eu, self.ev])
+        order = np.argsort(ends, kind="stable")
+        self.adj_edges = np.concatenate([np.arange(len(self.eu))] * 2)[order]
+        self.adj_ptr = np.searchsorted(ends[order], np.arange(num_nodes + 1))
+
+    @classmethod
+    def from_edges(cls, num_detectors: int, edges: dict) -> "UnionFindDecoder":
+        keys = np.array(list(edges), dtype=np.int64).reshape(-1, 2)
+        probs = np.array([p for p, _ in edges.values()])
+        return cls(num_detectors + 1, keys[:, 0], keys[:, 1], np.log((1 - probs) / probs),
+                   [m for _, m in edges.values()])
+
+    @classmethod
+    def from_circuit(cls, circuit) -> "UnionFindDecoder":
+        return cls.from_edges(circuit.num_detectors, detector_edges(circuit))
+
+    def select_edges(self, defects) -> np.ndarray:
+        """Edge ids of the correction for one shot's defect nodes"""
+        n = self.num_nodes
+        parent = np.arange(n)
+        size = np.ones(n, dtype=np.int64)
+        odd = np.zeros(n, dtype=bool)
+        odd[defects] = True
+        touches = np.zeros(n, dtype=bool)
+        touches[self.boundary] = True
+        growth = np.zeros(len(self.eu), dtype=np.int64)
+        frontier = {int(d): [int(d)] for d in defects}
+        tree = []
+
+        def find(a):
+            root = a
+            while parent[root] != root:
+                root = parent[root]
+            while parent[a] != root:
+                parent[a], a = root, parent[a]
+            return root
+
+        active = [r for r in frontier if not touches[r]]
+        while active:
+            fused = []
+            for root in active:
+                keep = []
+                for vertex in dict.fromkeys(frontier[root]):
+                    open_edges = False
+                    for e in self.adj_edges[self.adj_ptr[vertex]:self.adj_ptr[vertex + 1]]:
+                        if growth[e] >= self.weights[e]:
+                            continue
+                        other = self.ev[e] if self.eu[e] == vertex else self.eu[e]
+                        if find(other) == root:
+                            continue
+                        growth[e] += 1
+                        open_edges = True
+                        if growth[e] >= self.weights[e]:
+                            fused.append(e)
+                    if open_edges:
+                        keep.append(vertex)
+                frontier[root] = keep
+            for e in fused:
+                a, b = find(self.eu[e]), find(self.ev[e])
+                if a == b:
+                    continue
+                if size[a] < size[b]:
+                    a, b = b, a
+                parent[b] = a
+                size[a] += size[b]
+                odd[a] ^= odd[b]
+                touches[a] |= touches[b]
+                frontier[a] = frontier.pop(a, []) + frontier.pop(b, []) + [int(self.eu[e]), int(self.ev[e])]
+                tree.append(e)
+            roots = {find(r) for r in active}
+            active = [r for r in roots if odd[r] and not touches[r]]
+        return self._peel(np.array(tree, dtype=np.int64), defects)
+
+    def _peel(self, tree: np.ndarray, defects) -> np.ndarray:
+        """Peel the fusion forest from its leaves; trees holding the boundary are rooted there"""
+        if tree.size == 0:
+            return tree
+        nodes = np.unique(np.concatenate([self.eu[tree], self.ev[tree]]))
+        neighbours = {int(v): [] for v in nodes}
+        for e in tree:
+            neighbours[int(self.eu[e])].append((int(self.ev[e]), e))
+            neighbours[int(self.ev[e])].append((int(self.eu[e]), e))
+        defect = {int(d) for d in defects}
+        seen, selected = set(), []
+        starts = ([self.boundary] if self.boundary in neighbours else []) + [int(v) for v in nodes]
+        for start in starts:
+            if start in seen:
+                continue
+            seen.add(start)
+            order, up = [start], {}
+            for v in order:  # BFS: order grows while iterating
+                for w, e in neighbours[v]:
+                    if w not in seen:
+                        seen.add(w)
+                        up[w] = (v, e)
+                        order.append(w)
+            for v in reversed(order[1:]):
+                if v in defect:
+                    u, e = up[v]
+                    selected.append(e)
+                    defect.discard(v)
+                    defect ^= {u}
+        return np.array(selected, dtype=np.int64)
+
+    def decode_defects(self, defects) -> int:
+        mask = 0
+        for e in self.select_edges(np.asarray(defects, dtype=np.int64)):
+            mask ^= int(self.obs[e])
+        return mask
+
+    def decode(self, dets: np.ndarray, num_observables: int = 1) -> np.ndarray:
+        """Detection events (shots, D) bool -> predicted observable flips (shots, O) bool"""
+        masks = np.array([self.decode_defects(np.flatnonzero(row)) for row in np.asarray(dets, dtype=bool)],
+                         dtype=np.int64)
+        return ((masks[:, None] >> np.arange(num_observables)) & 1).astype(bool)
+
+
+class SlidingWindowDecoder:
+    """Streaming union-find over syndrome rounds: decode `window` rounds, commit the oldest `commit`"""
+
+    def __init__(self, circuit, window: int = 3, commit: int = 1):
+        if not 1 <= commit <= window:
+            raise ValueError(f"Need 1 <= commit <= window, got commit={commit}, window={window}")
+        self.window, self.commit = window, commit
+        self.num_detectors = circuit.num_detectors
+        self.num_observables = len(circuit.observables)
+        self.det_round = np.array([r for _, r in circuit.detector_coords], dtype=np.int64)
+        self.rounds = np.unique(self.det_round)
+        self.round_dets = [np.flatnonzero(self.det_round == r) for r in self.rounds]
+        edges = detector_edges(circuit)
+        self.eu = np.array([u for u, _ in edges], dtype=np.int64)
+        self.ev = np.array([v for _, v in edges], dtype=np.int64)
+        self.edge_obs = np.array([m for _, m in edges.values()], dtype=np.int64)
+        probs = np.array([p for p, _ in edges.values()])
+        self.edge_weight = np.log((1 - probs) / probs)
+        self._windows = {}
+        self.latencies = []
+        self.reset()
+
+    def reset(self):
+        """Start a new shot (latency history is kept)"""
+        self.pending = np.zeros(self.num_detectors, dtype=bool)  # Carried defect flips
+        self.defects = np.zeros(self.num_detectors, dtype=bool)
+        self.next_round = 0   # Index into self.rounds of the next round to arrive
+        self.start = 0        # Oldest uncommitted round index
+        self.mask = 0
+
+    def _window_decoder(self, lo: int, hi: int):
+        """UnionFindDecoder on rounds [lo, hi): later detectors -> boundary, earlier-edge faults dropped"""
+        if (lo, hi) not in self._windows:
+            dets = np.concatenate(self.round_dets[lo:hi])
+            local = np.full(self.num_detectors + 1, -1, dtype=np.int64)
+            local[dets] = np.arange(len(dets))
+            boundary = len(dets)
+            last = self.rounds[hi - 1]
+
+            def remap(g):
+                if g == self.num_detectors or self.det_round[g] > last:
+                    return boundary
+                return local[g]
+
+            u = np.array([remap(g) for g in self.eu], dtype=np.int64)
+            v = np.array([remap(g) for g in self.ev], dtype=np.int64)
+            keep = (u >= 0) & (v >= 0) & (u != v)
+            decoder = UnionFindDecoder(boundary + 1, u[keep], v[keep], self.edge_weight[keep], self.edge_obs[keep])
+            self._windows[(lo, hi)] = (decoder, dets, np.flatnonzero(keep))
+        return self._windows[(lo, hi)]
+
+    def _decode_window(self, final: bool):
+        lo = self.start
+        hi = self.next_round
+        decoder, dets, edge_ids = self._window_decoder(lo, hi)
+        commit_last = self.rounds[hi - 1] if final else self.rounds[lo + self.commit - 1]
+        active = self.defects[dets] ^ self.pending[dets]
+        for e in decoder.select_edges(np.flatnonzero(active)):
+            g = edge_ids[e]
+            ends = [x for x in (self.eu[g], self.ev[g]) if x != self.num_detectors]
+            if min(self.det_round[x] for x in ends) > commit_last:
+                continue  # Entirely in the buffer: re-decided in the next window
+            self.mask ^= int(self.edge_obs[g])
+            for x in ends:
+                self.pending[x] ^= True  # Committed edge: its defects are resolved / carried forward
+        self.start = hi if final else lo + self.commit
+
+    def push_round(self, events: np.ndarray):
+        """Detection events (bool, one per detector of the next round) - decodes when a window fills"""
+        t0 = time.perf_counter()
+        dets = self.round_dets[self.next_round]
+        self.defects[dets] = np.asarray(events, dtype=bool)
+        self.next_round += 1
+        if self.next_round - self.start >= self.window and self.next_round < len(self.rounds):
+            self._decode_window(final=False)
+        self.latencies.append(time.perf_counter() - t0)
+
+    def finish(self) -> np.ndarray:
+        """Decode whatever is buffered after the last round -> predicted observable flips (O,) bool"""
+        t0 = time.perf_counter()
+        if self.start < self.next_round:
+            self._decode_window(final=True)
+        self.latencies.append(time.perf_counter() - t0)
+        return ((self.mask >> np.arange(self.num_observables)) & 1).astype(bool)
+
+    def decode(self, dets: np.ndarray) -> np.ndarray:
+        """Batch helper: stream every shot round by round -> (shots, O) bool"""
+        out = np.zeros((len(dets), self.num_observables), dtype=bool)
+        for s, row in enumerate(np.asarray(dets, dtype=bool)):
+            self.reset()
+            for round_dets in self.round_dets:
+                self.push_round(row[round_dets])
+            out[s] = self.finish()
+        return out
+
+    def latency_report(self) -> dict:
+        lat = np.array(self.latencies) * 1e6
+        return {"rounds": len(lat), "mean_us": float(lat.mean()) if lat.size else 0.0,
+                "p99_us": float(np.percentile(lat, 99)) if lat.size else 0.0,
+                "max_us": float(lat.max()) if lat.size else 0.0}
+
+
+# Benchmark: union-find vs MWPM, and streaming latency per round
+if __name__ == "__main__":
+    from pauli_frame import FrameSampler
+    from qec_codes import RotatedSurfaceCode, memory_circuit
+    from qec_decoders import MatchingDecoder
+
+    shots = 2000
+    for d in (3, 5, 7):
+        circuit = memory_circuit(RotatedSurfaceCode(d), rounds=d, p=0.002)
+        dets, obs = FrameSampler(circuit, seed=0).sample(shots)
+        t0 = time.perf_counter()
+        uf = UnionFindDecoder.from_circuit(circuit).decode(dets)
+        t1 = time.perf_counter()
+        mwpm = MatchingDecoder.from_circuit(circuit).decode(dets)
+        t2 = time.perf_counter()
+        print(f"d={d}: UF {(uf != obs).mean():.4f} ({1e6 * (t1 - t0) / shots:.0f} us/shot) | "
+              f"MWPM {(mwpm != obs).mean():.4f} ({1e6 * (t2 - t1) / shots:.0f} us/shot)")
+
+        stream_circuit = memory_circuit(RotatedSurfaceCode(d), rounds=4 * d, p=0.002)
+        dets, obs = FrameSampler(stream_circuit, seed=1).sample(200)
+        stream = SlidingWindowDecoder(stream_circuit, window=d, commit=max(1, d // 2))
+        flips = stream.decode(dets)
+        print(f"      streaming {4 * d} rounds, window {d}: logical error {(flips != obs).mean():.4f} | "
+              f"latency per round {stream.latency_report()}")
@@ -4,19 +4,24 @@
 import pennylane as qml
 from pennylane import numpy as np
 import logging
+from circuit_templates import CircuitTemplate
+from gradient_engine import GradientEngine, HamiltonianEstimator
 
 log = logging.getLogger(__name__)
 
 dev = qml.device("default.qubit", wires=6)
 
-def habitat_hamiltonian(params):
-    mercy, amf, ecm, bacteria = params
+HABITAT_OBSERVABLES = [qml.PauliZ(0), qml.PauliZ(1) @ qml.PauliZ(2), qml.PauliX(3)]
+
+def habitat_coefficients(params):
+    mercy, amf, ecm, bacteria = params[:4]
     # Map to Pauli terms (simplified for VQE demo)
-    coeffs = [- (mercy*6 + amf*4 + ecm*3 + bacteria*5),  # Resilience
-              mercy**2 * 12,  # Recovery quadratic
-              - (1 - mercy) * 15]  # Radiation penalty
-    obs = [qml.PauliZ(0), qml.PauliZ(1) @ qml.PauliZ(2), qml.PauliX(3)]
-    return qml.Hamiltonian(coeffs, obs)
+    return np.array([- (mercy*6 + amf*4 + ecm*3 + bacteria*5),  # Resilience
+                     mercy**2 * 12,  # Recovery quadratic
+                     - (1 - mercy) * 15])  # Radiation penalty
+
+def habitat_hamiltonian(params):
+    return qml.Hamiltonian(habitat_coefficients(params), HABITAT_OBSERVABLES)
 
 @qml.qnode(dev)
 def vqe_circuit(params, wires=range(6)):
@@ -26,12 +31,18 @@ def vqe_circuit(params, wires=range(6)):
         qml.CZ(wires=[i, i+1])
     return qml.expval(habitat_hamiltonian(params))
 
-def vqe_optimize(initial_params):
-    opt = qml.GradientDescentOptimizer(stepsize=0.4)
-    params = initial_params
-    for i in range(200):
-        params = opt.step(vqe_circuit, params)
-    ground_energy = vqe_circuit(params)
+# Same RY + CZ-chain ansatz as a rebindable template: energy + all shift terms in one batch
+vqe_template = CircuitTemplate([qml.RY] * 6 + [qml.CZ] * 5, list(range(6)) + [-1] * 5,
+                               [(i, -1) for i in range(6)] + [(i, i + 1) for i in range(5)],
+                               measurement=None)  # Observables supplied by HamiltonianEstimator
+
+def vqe_optimize(initial_params, method="parameter-shift", shots=None):
+    estimator = HamiltonianEstimator(vqe_template, dev, HABITAT_OBSERVABLES, habitat_coefficients, shots=shots)
+    engine = GradientEngine(estimator, method=method)
+    params = np.array(initial_params, dtype=float)
+    for _ in range(200):
+        params = params - 0.4 * engine.grad(params)
+    ground_energy = float(estimator.values(params[None])[0])  # Energy only: no shift terms for the final read
     log.info(f"VQE found absolute ground state energy {ground_energy:.3f} – omniscient params converged!")
     return params, ground_energy
 